@@ -5,11 +5,13 @@ Implements risk analysis using Groq's Llama 3.3 model.
 Provides intelligent red flag detection, pattern analysis, and explanations.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import re
 import time
+from collections import Counter
 from typing import Optional
 
 from groq import Groq
@@ -36,6 +38,51 @@ from ..core.models import (
 from ..core.exceptions import AnalyzerError, LLMRateLimitError
 from .prompts import AnalysisPrompts
 
+try:
+    # Optional C parser for LLM responses; its errors subclass json.JSONDecodeError
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Markdown stripped from explanations, compiled once at import
+_MD_EMPHASIS_RE = re.compile(r'\*{1,2}([^*]+)\*{1,2}')
+_MD_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+
+
+def _find_json_span(text: str, pos: int = 0) -> Optional[tuple[int, int]]:
+    """
+    Locate the first balanced {...} object in text at or after pos.
+
+    Single pass tracking brace depth and string/escape state, so braces
+    inside JSON strings are ignored and long outputs can't backtrack.
+    """
+    depth = 0
+    start = -1
+    in_str = False
+    escaped = False
+    for i in range(pos, len(text)):
+        c = text[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = depth > 0
+        elif c == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif c == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
 
 class GroqLLMAnalyzer(BaseAnalyzer):
     """
@@ -55,6 +102,9 @@ class GroqLLMAnalyzer(BaseAnalyzer):
         "Do not include any explanation or markdown formatting outside the JSON."
     )
 
+    # Points added per red flag by the fallback scorer
+    FALLBACK_SEVERITY_POINTS = {Severity.HIGH: 20, Severity.MEDIUM: 10, Severity.LOW: 5}
+
     # Cache TTL in seconds (24 hours)
     CACHE_TTL_SECONDS = 24 * 60 * 60
 
@@ -157,6 +207,32 @@ class GroqLLMAnalyzer(BaseAnalyzer):
             explanation=explanation,
         )
 
+    async def explain(
+        self,
+        data: SECFilingData,
+        analysis: AnalysisResult,
+    ) -> str:
+        """
+        Generate plain-English explanation for an existing analysis.
+
+        Lets callers defer the explanation call until after scoring, so
+        it is only paid for tickers whose explanation will be read.
+
+        Args:
+            data: SEC filing data that was analyzed
+            analysis: Result of a prior analyze() call
+
+        Returns:
+            Explanation text (fallback text if generation fails)
+        """
+        return await self._generate_explanation(
+            data.ticker,
+            analysis.risk_score,
+            analysis.risk_level.value,
+            list(analysis.red_flags),
+            analysis.insider_summary,
+        )
+
     async def _detect_red_flags(self, filings_8k: tuple) -> list[RedFlag]:
         """Detect red flags in 8-K filings"""
         all_flags = []
@@ -310,8 +386,16 @@ class GroqLLMAnalyzer(BaseAnalyzer):
             insider_summary=f"Net: {insider_summary.net_activity}, Sold: ${insider_summary.total_sold:,}, Bought: ${insider_summary.total_bought:,}",
         )
 
+        cache_key = self._cache_key(prompt)
+        cached = self._get_from_cache(cache_key)
+        if cached is not None:
+            return cached["explanation"]
+
         try:
-            response = self._client.chat.completions.create(
+            # The Groq client is synchronous; run it off the event loop so
+            # concurrent scans keep making progress during the round-trip
+            response = await asyncio.to_thread(
+                self._client.chat.completions.create,
                 model=self._settings.llm.model,
                 messages=[
                     {"role": "system", "content": "You are a financial analyst. Write clear, concise risk summaries for investors."},
@@ -327,6 +411,7 @@ class GroqLLMAnalyzer(BaseAnalyzer):
 
             # Validate the explanation
             if self._validate_explanation(processed, ticker):
+                self._set_cache(cache_key, {"explanation": processed})
                 return processed
             else:
                 logger.warning(f"LLM explanation for {ticker} failed validation, using fallback")
@@ -350,7 +435,8 @@ class GroqLLMAnalyzer(BaseAnalyzer):
             return cached
 
         try:
-            response = self._client.chat.completions.create(
+            response = await asyncio.to_thread(
+                self._client.chat.completions.create,
                 model=self._settings.llm.model,
                 messages=[
                     {"role": "system", "content": self.SYSTEM_PROMPT},
@@ -378,26 +464,34 @@ class GroqLLMAnalyzer(BaseAnalyzer):
         """Parse JSON from LLM response"""
         # Try direct parse
         try:
-            return json.loads(content)
+            return _json_loads(content)
         except json.JSONDecodeError:
             pass
 
         # Try extracting from markdown code block
-        if "```" in content:
-            json_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", content)
-            if json_match:
+        fence = content.find("```")
+        if fence != -1:
+            start = fence + 3
+            if content.startswith("json", start):
+                start += 4
+            end = content.find("```", start)
+            if end != -1:
                 try:
-                    return json.loads(json_match.group(1))
+                    return _json_loads(content[start:end])
                 except json.JSONDecodeError:
                     pass
 
-        # Try finding JSON object in text
-        json_match = re.search(r"\{[\s\S]*\}", content)
-        if json_match:
-            try:
-                return json.loads(json_match.group(0))
-            except json.JSONDecodeError:
-                pass
+        # Try each balanced object in the text; prose such as "{risk}" may
+        # come before the real JSON, so move on to the next "{" on failure
+        pos = content.find("{")
+        while pos != -1:
+            span = _find_json_span(content, pos)
+            if span:
+                try:
+                    return _json_loads(content[span[0]:span[1]])
+                except json.JSONDecodeError:
+                    pass
+            pos = content.find("{", pos + 1)
 
         return None
 
@@ -449,11 +543,11 @@ class GroqLLMAnalyzer(BaseAnalyzer):
         # Remove markdown formatting
         processed = explanation
         # Remove bold/italic markers
-        processed = re.sub(r'\*{1,2}([^*]+)\*{1,2}', r'\1', processed)
+        processed = _MD_EMPHASIS_RE.sub(r'\1', processed)
         # Remove inline code markers
-        processed = re.sub(r'`([^`]+)`', r'\1', processed)
+        processed = _MD_INLINE_CODE_RE.sub(r'\1', processed)
         # Remove headers
-        processed = re.sub(r'^#{1,6}\s+', '', processed, flags=re.MULTILINE)
+        processed = _MD_HEADER_RE.sub('', processed)
         # Clean up extra whitespace
         processed = ' '.join(processed.split())
 
@@ -481,13 +575,13 @@ class GroqLLMAnalyzer(BaseAnalyzer):
         buyers = set()
 
         for t in transactions:
-            value = t.total_value or 0
-            # S = Sale, P = Purchase
-            if t.transaction_type == "S":
-                total_sold += value
+            kind = t.transaction_type
+            # S = Sale, P = Purchase; other codes (grants, exercises) are ignored
+            if kind == "S":
+                total_sold += t.total_value or 0
                 sellers.add(t.insider_name)
-            elif t.transaction_type == "P":
-                total_bought += value
+            elif kind == "P":
+                total_bought += t.total_value or 0
                 buyers.add(t.insider_name)
 
         if total_sold > total_bought * 2:
@@ -515,32 +609,25 @@ class GroqLLMAnalyzer(BaseAnalyzer):
         """Fallback risk scoring when LLM fails"""
         score = 20  # Base score
 
-        # Add points for red flags
-        severity_weights = {"high": 20, "medium": 10, "low": 5}
-        for flag in red_flags:
-            score += severity_weights.get(flag.severity.value, 10)
+        # Add points for red flags: tally severities once, then weight each count
+        severity_counts = Counter(flag.severity for flag in red_flags)
+        score += sum(
+            self.FALLBACK_SEVERITY_POINTS[severity] * count
+            for severity, count in severity_counts.items()
+        )
 
         # Add points for concerning insider activity
-        if insider_data.get("net_activity") == "heavy_selling":
+        net_activity = insider_data.get("net_activity")
+        if net_activity == "heavy_selling":
             score += 15
-        elif insider_data.get("net_activity") == "net_selling":
+        elif net_activity == "net_selling":
             score += 8
 
         # Cap at 100
         score = min(score, 100)
 
-        # Determine level (aligned with RiskLevel enum)
-        if score >= 70:
-            risk_level = "high"
-        elif score >= 50:
-            risk_level = "elevated"
-        elif score >= 30:
-            risk_level = "moderate"
-        else:
-            risk_level = "low"
-
         return {
             "risk_score": score,
-            "risk_level": risk_level,
+            "risk_level": RiskLevel.from_score(score).value,
             "reasoning": "Fallback calculation - LLM unavailable",
         }
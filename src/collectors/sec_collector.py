@@ -6,14 +6,16 @@ Implements the DataCollector protocol with proper rate limiting and error handli
 """
 
 import asyncio
+import json
 import logging
+import os
 import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from xml.etree import ElementTree
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -49,23 +51,33 @@ class SECCollector(DataCollector):
     - Proper error handling with retries
     """
 
-    # 8-K Items of interest
-    ITEM_PATTERNS = [
-        (r"Item\s*1\.01", "1.01 - Entry into Material Agreement"),
-        (r"Item\s*1\.02", "1.02 - Termination of Material Agreement"),
-        (r"Item\s*2\.01", "2.01 - Completion of Acquisition/Disposition"),
-        (r"Item\s*2\.02", "2.02 - Results of Operations"),
-        (r"Item\s*2\.05", "2.05 - Costs for Exit Activities"),
-        (r"Item\s*2\.06", "2.06 - Material Impairments"),
-        (r"Item\s*3\.01", "3.01 - Notice of Delisting"),
-        (r"Item\s*4\.01", "4.01 - Changes in Registrant's Certifying Accountant"),
-        (r"Item\s*4\.02", "4.02 - Non-Reliance on Financial Statements"),
-        (r"Item\s*5\.01", "5.01 - Changes in Control"),
-        (r"Item\s*5\.02", "5.02 - Departure/Appointment of Directors or Officers"),
-        (r"Item\s*5\.03", "5.03 - Amendments to Articles"),
-        (r"Item\s*7\.01", "7.01 - Regulation FD Disclosure"),
-        (r"Item\s*8\.01", "8.01 - Other Events"),
-    ]
+    # Filing index pages are only searched for links and the file table
+    INDEX_STRAINER = SoupStrainer(["a", "table"])
+
+    # One libxml2 parser is reused for every Atom feed and Form 4 document
+    XML_PARSER = etree.XMLParser(resolve_entities=False, collect_ids=False)
+    ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+
+    # 8-K Items of interest, keyed by item number
+    ITEM_NAMES = {
+        "1.01": "1.01 - Entry into Material Agreement",
+        "1.02": "1.02 - Termination of Material Agreement",
+        "2.01": "2.01 - Completion of Acquisition/Disposition",
+        "2.02": "2.02 - Results of Operations",
+        "2.05": "2.05 - Costs for Exit Activities",
+        "2.06": "2.06 - Material Impairments",
+        "3.01": "3.01 - Notice of Delisting",
+        "4.01": "4.01 - Changes in Registrant's Certifying Accountant",
+        "4.02": "4.02 - Non-Reliance on Financial Statements",
+        "5.01": "5.01 - Changes in Control",
+        "5.02": "5.02 - Departure/Appointment of Directors or Officers",
+        "5.03": "5.03 - Amendments to Articles",
+        "7.01": "7.01 - Regulation FD Disclosure",
+        "8.01": "8.01 - Other Events",
+    }
+
+    # Every "Item N.NN" reference in a filing, found in a single pass
+    ITEM_RE = re.compile(r"Item\s*(\d\.\d\d)", re.IGNORECASE)
 
     def __init__(self, settings: Optional[Settings] = None):
         """
@@ -77,15 +89,26 @@ class SECCollector(DataCollector):
         self._settings = settings or get_settings()
         self._cik_cache: dict[str, str] = {}
         self._last_request_time: float = 0
+        # Concurrent callers queue here so each request gets its own delay slot
+        self._rate_lock = asyncio.Lock()
+        # Concurrent lookups on a cold cache share one company_tickers.json load
+        self._cik_lock = asyncio.Lock()
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create reusable HTTP client"""
+        """Get or create reusable HTTP client (pooled across all SEC requests)"""
         if self._client is None:
             self._client = httpx.AsyncClient(
                 headers=self._headers,
                 timeout=self._settings.sec.timeout,
                 follow_redirects=True,
+                # Requests are rate limited to a few hosts, so a small pool whose
+                # idle connections outlive the gaps between scan phases is enough
+                limits=httpx.Limits(
+                    max_connections=16,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=60,
+                ),
             )
         return self._client
 
@@ -103,15 +126,16 @@ class SECCollector(DataCollector):
         }
 
     async def _rate_limit(self) -> None:
-        """Enforce SEC rate limiting"""
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self._last_request_time
-        delay = self._settings.sec.request_delay
+        """Enforce SEC rate limiting (serialized across concurrent callers)"""
+        async with self._rate_lock:
+            now = asyncio.get_event_loop().time()
+            elapsed = now - self._last_request_time
+            delay = self._settings.sec.request_delay
 
-        if elapsed < delay:
-            await asyncio.sleep(delay - elapsed)
+            if elapsed < delay:
+                await asyncio.sleep(delay - elapsed)
 
-        self._last_request_time = asyncio.get_event_loop().time()
+            self._last_request_time = asyncio.get_event_loop().time()
 
     async def health_check(self) -> bool:
         """Check if SEC EDGAR is accessible"""
@@ -147,10 +171,11 @@ class SECCollector(DataCollector):
             if not cik:
                 return self._empty_result(ticker, collected_at, lookback_days, "CIK not found")
 
-            # Fetch both filing types concurrently
+            # Fetch both filing types concurrently, against one shared cutoff
+            cutoff_date = collected_at - timedelta(days=lookback_days)
             filings_8k, filings_form4 = await asyncio.gather(
-                self._fetch_8k_filings(cik, ticker, lookback_days),
-                self._fetch_form4_filings(cik, ticker, lookback_days),
+                self._fetch_8k_filings(cik, ticker, cutoff_date),
+                self._fetch_form4_filings(cik, ticker, cutoff_date),
                 return_exceptions=True,
             )
 
@@ -193,6 +218,35 @@ class SECCollector(DataCollector):
             error=error,
         )
 
+    def _load_cik_cache(self) -> dict[str, str]:
+        """Load ticker -> CIK map from the configured cache file"""
+        path = self._settings.sec.cik_cache_path
+        if not path:
+            return {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable CIK cache {path}: {e}")
+            return {}
+
+    def _save_cik_cache(self) -> None:
+        """Write ticker -> CIK map to the configured cache file"""
+        path = self._settings.sec.cik_cache_path
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._cik_cache, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write CIK cache {path}: {e}")
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -204,6 +258,20 @@ class SECCollector(DataCollector):
         if ticker in self._cik_cache:
             return self._cik_cache[ticker]
 
+        async with self._cik_lock:
+            # Another caller may have loaded the map while we waited
+            if ticker in self._cik_cache:
+                return self._cik_cache[ticker]
+            return await self._load_cik(ticker)
+
+    async def _load_cik(self, ticker: str) -> Optional[str]:
+        """Load the ticker-to-CIK map and look up ticker (caller holds _cik_lock)"""
+        # Seed from the on-disk cache before going to the network
+        if not self._cik_cache:
+            self._cik_cache = self._load_cik_cache()
+            if ticker in self._cik_cache:
+                return self._cik_cache[ticker]
+
         await self._rate_limit()
         client = await self._get_client()
 
@@ -222,6 +290,7 @@ class SECCollector(DataCollector):
                 cik = str(entry.get("cik_str", "")).zfill(10)
                 self._cik_cache[t] = cik
 
+            self._save_cik_cache()
             return self._cik_cache.get(ticker)
 
         except httpx.HTTPStatusError as e:
@@ -243,11 +312,10 @@ class SECCollector(DataCollector):
         self,
         cik: str,
         ticker: str,
-        lookback_days: int
+        cutoff_date: datetime
     ) -> list[Filing8K]:
         """Fetch 8-K filings from EDGAR"""
         filings = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=lookback_days)
 
         await self._rate_limit()
         client = await self._get_client()
@@ -261,8 +329,8 @@ class SECCollector(DataCollector):
             response = await client.get(filings_url)
             response.raise_for_status()
 
-            root = ElementTree.fromstring(response.content)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
+            root = etree.fromstring(response.content, self.XML_PARSER)
+            ns = self.ATOM_NS
 
             for entry in root.findall("atom:entry", ns):
                 filing = await self._parse_8k_entry(entry, ns, cutoff_date)
@@ -276,7 +344,7 @@ class SECCollector(DataCollector):
 
     async def _parse_8k_entry(
         self,
-        entry: ElementTree.Element,
+        entry: etree._Element,
         ns: dict,
         cutoff_date: datetime
     ) -> Optional[Filing8K]:
@@ -325,7 +393,7 @@ class SECCollector(DataCollector):
             response = await client.get(filing_url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(response.text, "lxml", parse_only=self.INDEX_STRAINER)
             main_doc = self._find_main_document(soup, filing_url)
 
             if main_doc:
@@ -389,14 +457,8 @@ class SECCollector(DataCollector):
 
     def _extract_8k_items(self, text: str) -> list[str]:
         """Extract 8-K item numbers from filing text"""
-        found_items = []
-        text_upper = text.upper()
-
-        for pattern, item_name in self.ITEM_PATTERNS:
-            if re.search(pattern, text_upper, re.IGNORECASE):
-                found_items.append(item_name)
-
-        return found_items
+        mentioned = set(self.ITEM_RE.findall(text))
+        return [name for number, name in self.ITEM_NAMES.items() if number in mentioned]
 
     @retry(
         stop=stop_after_attempt(3),
@@ -408,11 +470,10 @@ class SECCollector(DataCollector):
         self,
         cik: str,
         ticker: str,
-        lookback_days: int
+        cutoff_date: datetime
     ) -> list[InsiderTransaction]:
         """Fetch Form 4 insider transaction filings"""
         transactions = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=lookback_days)
 
         await self._rate_limit()
         client = await self._get_client()
@@ -426,8 +487,8 @@ class SECCollector(DataCollector):
             response = await client.get(filings_url)
             response.raise_for_status()
 
-            root = ElementTree.fromstring(response.content)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
+            root = etree.fromstring(response.content, self.XML_PARSER)
+            ns = self.ATOM_NS
 
             for entry in root.findall("atom:entry", ns):
                 txns = await self._parse_form4_entry(entry, ns, cutoff_date)
@@ -440,7 +501,7 @@ class SECCollector(DataCollector):
 
     async def _parse_form4_entry(
         self,
-        entry: ElementTree.Element,
+        entry: etree._Element,
         ns: dict,
         cutoff_date: datetime
     ) -> list[InsiderTransaction]:
@@ -484,7 +545,7 @@ class SECCollector(DataCollector):
             response = await client.get(filing_url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(response.text, "lxml", parse_only=self.INDEX_STRAINER)
             xml_link = self._find_form4_xml(soup, filing_url)
 
             if xml_link:
@@ -492,7 +553,7 @@ class SECCollector(DataCollector):
                 xml_response = await client.get(xml_link)
                 xml_response.raise_for_status()
 
-                root = ElementTree.fromstring(xml_response.content)
+                root = etree.fromstring(xml_response.content, self.XML_PARSER)
                 transactions = self._extract_transactions(root, filing_date, filing_url)
 
         except Exception as e:
@@ -514,7 +575,7 @@ class SECCollector(DataCollector):
 
     def _extract_transactions(
         self,
-        root: ElementTree.Element,
+        root: etree._Element,
         filing_date: datetime,
         filing_url: str
     ) -> list[InsiderTransaction]:
@@ -550,13 +611,13 @@ class SECCollector(DataCollector):
         return transactions
 
     @staticmethod
-    def _get_xml_text(element: ElementTree.Element, xpath: str) -> Optional[str]:
+    def _get_xml_text(element: etree._Element, xpath: str) -> Optional[str]:
         """Safely get text from XML element"""
         found = element.find(xpath)
         return found.text.strip() if found is not None and found.text else None
 
     @staticmethod
-    def _get_xml_float(element: ElementTree.Element, xpath: str) -> Optional[float]:
+    def _get_xml_float(element: etree._Element, xpath: str) -> Optional[float]:
         """Safely get float from XML element"""
         text = SECCollector._get_xml_text(element, xpath)
         if text:
@@ -582,11 +643,16 @@ class SECCollector(DataCollector):
 
         Returns:
             True if new filings exist after since_date
+
+        Raises:
+            TickerNotFoundError: If ticker CIK cannot be resolved
+            SECFetchError: If the filing feed cannot be fetched or parsed
         """
         ticker = ticker.upper().strip()
         cik = await self._get_cik(ticker)
         if not cik:
-            return False
+            # Unresolved CIKs include failed lookups, so don't report "no filings"
+            raise TickerNotFoundError(ticker)
 
         since_dt = datetime.strptime(since_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
 
@@ -602,16 +668,18 @@ class SECCollector(DataCollector):
             response = await client.get(filings_url)
             response.raise_for_status()
 
-            root = ElementTree.fromstring(response.content)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
+            root = etree.fromstring(response.content, self.XML_PARSER)
+            ns = self.ATOM_NS
 
             for entry in root.findall("atom:entry", ns):
                 filing_date = self._get_entry_date(entry, ns)
                 if filing_date and filing_date > since_dt:
                     return True
 
-        except Exception as e:
-            logger.warning(f"Failed to check 8-K filings for {ticker}: {e}")
+        except httpx.HTTPStatusError as e:
+            raise SECFetchError(url=filings_url, status_code=e.response.status_code)
+        except (httpx.HTTPError, etree.XMLSyntaxError) as e:
+            raise SECFetchError(url=filings_url, reason=str(e))
 
         return False
 
@@ -627,11 +695,16 @@ class SECCollector(DataCollector):
 
         Returns:
             True if new filings exist after since_date
+
+        Raises:
+            TickerNotFoundError: If ticker CIK cannot be resolved
+            SECFetchError: If the filing feed cannot be fetched or parsed
         """
         ticker = ticker.upper().strip()
         cik = await self._get_cik(ticker)
         if not cik:
-            return False
+            # Unresolved CIKs include failed lookups, so don't report "no filings"
+            raise TickerNotFoundError(ticker)
 
         since_dt = datetime.strptime(since_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
 
@@ -647,16 +720,18 @@ class SECCollector(DataCollector):
             response = await client.get(filings_url)
             response.raise_for_status()
 
-            root = ElementTree.fromstring(response.content)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
+            root = etree.fromstring(response.content, self.XML_PARSER)
+            ns = self.ATOM_NS
 
             for entry in root.findall("atom:entry", ns):
                 filing_date = self._get_entry_date(entry, ns)
                 if filing_date and filing_date > since_dt:
                     return True
 
-        except Exception as e:
-            logger.warning(f"Failed to check Form 4 filings for {ticker}: {e}")
+        except httpx.HTTPStatusError as e:
+            raise SECFetchError(url=filings_url, status_code=e.response.status_code)
+        except (httpx.HTTPError, etree.XMLSyntaxError) as e:
+            raise SECFetchError(url=filings_url, reason=str(e))
 
         return False
 
@@ -710,8 +785,8 @@ class SECCollector(DataCollector):
             response = await client.get(filings_url)
             response.raise_for_status()
 
-            root = ElementTree.fromstring(response.content)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
+            root = etree.fromstring(response.content, self.XML_PARSER)
+            ns = self.ATOM_NS
 
             entry = root.find("atom:entry", ns)
             if entry is not None:
@@ -725,7 +800,7 @@ class SECCollector(DataCollector):
         return None
 
     def _get_entry_date(
-        self, entry: ElementTree.Element, ns: dict
+        self, entry: etree._Element, ns: dict
     ) -> Optional[datetime]:
         """Extract filing date from Atom entry"""
         # Prefer filing-date over updated
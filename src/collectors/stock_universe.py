@@ -11,7 +11,7 @@ import time
 from typing import Optional
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -23,6 +23,19 @@ from ..config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+# Wikitables carry several classes ("wikitable sortable"), so match the class token
+_WIKITABLES = etree.XPath(
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' wikitable ')]"
+)
+_HEADERS = etree.XPath(".//th")
+_ROWS = etree.XPath(".//tr")
+_CELLS = etree.XPath(".//td | .//th")
+
+
+def _cell_text(element: lxml_html.HtmlElement) -> str:
+    """Text of a table cell with each text node stripped, like get_text(strip=True)"""
+    return "".join(text.strip() for text in element.itertext())
+
 
 # Fallback ticker lists when Wikipedia is unavailable
 FALLBACK_TOP_100 = [
@@ -49,7 +62,6 @@ class StockUniverseCollector:
     - Fallback to hardcoded list on failure
     - Async HTTP client (lazy-loaded)
     """
-
     def __init__(self, settings: Optional[Settings] = None):
         """
         Initialize Stock Universe Collector.
@@ -69,6 +81,13 @@ class StockUniverseCollector:
                 headers=self._headers,
                 timeout=self._settings.stock_universe.timeout,
                 follow_redirects=True,
+                # At most two list pages come from one host, so one kept-alive
+                # connection reused across get_sp500/get_nasdaq100 is enough
+                limits=httpx.Limits(
+                    max_connections=4,
+                    max_keepalive_connections=2,
+                    keepalive_expiry=60,
+                ),
             )
         return self._client
 
@@ -99,17 +118,18 @@ class StockUniverseCollector:
 
     def _get_from_cache(self, key: str) -> Optional[list[str]]:
         """Get cached ticker list if not expired"""
-        if key in self._cache:
-            tickers, timestamp = self._cache[key]
-            ttl_seconds = self._settings.stock_universe.cache_ttl_hours * 3600
-            if time.time() - timestamp < ttl_seconds:
-                return tickers
-            del self._cache[key]
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        tickers, timestamp = entry
+        if time.monotonic() - timestamp < self._settings.stock_universe.cache_ttl_hours * 3600:
+            return tickers
+        del self._cache[key]
         return None
 
     def _set_cache(self, key: str, tickers: list[str]) -> None:
-        """Cache ticker list with current timestamp"""
-        self._cache[key] = (tickers, time.time())
+        """Cache ticker list with the current monotonic time"""
+        self._cache[key] = (tickers, time.monotonic())
 
     async def get_tickers(self, mode: str, custom: Optional[list[str]] = None) -> list[str]:
         """
@@ -218,48 +238,44 @@ class StockUniverseCollector:
 
     def _parse_sp500_table(self, html: str) -> list[str]:
         """Parse S&P 500 tickers from Wikipedia table"""
-        tickers = []
-        soup = BeautifulSoup(html, "lxml")
-
-        # Find the first table with "Symbol" header
-        for table in soup.find_all("table", class_="wikitable"):
-            headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
-
-            # S&P 500 table has "Symbol" column
-            if "symbol" in headers:
-                symbol_idx = headers.index("symbol")
-                for row in table.find_all("tr")[1:]:
-                    cells = row.find_all(["td", "th"])
-                    if len(cells) > symbol_idx:
-                        ticker = cells[symbol_idx].get_text(strip=True)
-                        # Clean up ticker (remove footnotes, etc.)
-                        ticker = ticker.split("[")[0].strip()
-                        if ticker and ticker.isalpha():
-                            tickers.append(ticker.upper())
-                break
-
-        return tickers
+        # S&P 500 table has "Symbol" column
+        return [
+            ticker.upper()
+            for ticker in self._parse_wikitable_column(html, "symbol")
+            if ticker.isalpha()
+        ]
 
     def _parse_nasdaq100_table(self, html: str) -> list[str]:
         """Parse NASDAQ 100 tickers from Wikipedia table"""
-        tickers = []
-        soup = BeautifulSoup(html, "lxml")
-
-        # Find the table with "Ticker" header
-        for table in soup.find_all("table", class_="wikitable"):
-            headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
-
-            # NASDAQ 100 table has "Ticker" column
-            if "ticker" in headers:
-                ticker_idx = headers.index("ticker")
-                for row in table.find_all("tr")[1:]:
-                    cells = row.find_all(["td", "th"])
-                    if len(cells) > ticker_idx:
-                        ticker = cells[ticker_idx].get_text(strip=True)
-                        # Clean up ticker (remove footnotes, etc.)
-                        ticker = ticker.split("[")[0].strip()
-                        if ticker and ticker.replace(".", "").isalpha():
-                            tickers.append(ticker.upper())
-                break
-
-        return tickers
\ No newline at end of file
+        # NASDAQ 100 table has "Ticker" column
+        return [
+            ticker.upper()
+            for ticker in self._parse_wikitable_column(html, "ticker")
+            if ticker.replace(".", "").isalpha()
+        ]
+
+    @staticmethod
+    def _parse_wikitable_column(html: str, header: str) -> list[str]:
+        """Cell values under the first wikitable column titled header (case-insensitive)"""
+        try:
+            root = lxml_html.fromstring(html)
+        except etree.ParserError:
+            return []
+
+        for table in _WIKITABLES(root):
+            headers = [_cell_text(th).lower() for th in _HEADERS(table)]
+            if header not in headers:
+                continue
+
+            column = headers.index(header)
+            values = []
+            for row in _ROWS(table)[1:]:
+                cells = _CELLS(row)
+                if len(cells) > column:
+                    # Clean up ticker (remove footnotes, etc.)
+                    value = _cell_text(cells[column]).partition("[")[0].strip()
+                    if value:
+                        values.append(value)
+            return values
+
+        return []
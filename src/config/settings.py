@@ -20,6 +20,12 @@ class SECSettings:
     request_delay: float = 0.15  # 10 requests/second max
     timeout: int = 30
     max_retries: int = 3
+    max_filing_check_concurrency: int = 8  # in-flight incremental filing checks
+    # Optional JSON file mirroring the ticker -> CIK map across runs/processes
+    cik_cache_path: Optional[str] = None
+    # Optional JSON file remembering incremental filing checks between runs
+    filing_check_cache_path: Optional[str] = None
+    filing_check_cache_ttl_hours: int = 6
 
 
 @dataclass(frozen=True)
@@ -32,6 +38,9 @@ class LLMSettings:
     max_tokens: int = 1000
     timeout: int = 30
     max_retries: int = 2
+    # Explanations are only generated for reports scoring at or above this
+    # (ELEVATED and up); lower-risk tickers skip the extra LLM call
+    explanation_threshold: int = 50
 
     @property
     def is_configured(self) -> bool:
@@ -63,6 +72,9 @@ class WebhookSettings:
     timeout: int = 10
     max_retries: int = 2
     default_threshold: int = 70
+    retry_backoff_base: float = 0.25  # seconds
+    retry_backoff_cap: float = 10.0   # seconds
+    max_concurrent: int = 16          # in-flight webhook POSTs
 
 
 @dataclass(frozen=True)
@@ -75,6 +87,7 @@ class ActorSettings:
     default_batch_size: int = 50
     min_batch_size: int = 10
     max_batch_size: int = 100
+    max_concurrent_scans: int = 4  # tickers scanned at once in incremental mode
 
 
 @dataclass(frozen=True)
@@ -114,6 +127,8 @@ class Settings:
         Environment variables:
             GROQ_API_KEY: LLM API key
             SEC_USER_AGENT: Custom SEC user agent
+            SEC_CIK_CACHE_PATH: File to persist ticker -> CIK lookups
+            SEC_FILING_CHECK_CACHE_PATH: File to persist incremental filing checks
             DEBUG: Enable debug mode
         """
         groq_api_key = os.environ.get("GROQ_API_KEY")
@@ -121,10 +136,16 @@ class Settings:
             "SEC_USER_AGENT",
             SECSettings.user_agent
         )
+        cik_cache_path = os.environ.get("SEC_CIK_CACHE_PATH")
+        filing_check_cache_path = os.environ.get("SEC_FILING_CHECK_CACHE_PATH")
         debug = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
 
         return cls(
-            sec=SECSettings(user_agent=sec_user_agent),
+            sec=SECSettings(
+                user_agent=sec_user_agent,
+                cik_cache_path=cik_cache_path,
+                filing_check_cache_path=filing_check_cache_path,
+            ),
             llm=LLMSettings(api_key=groq_api_key),
             scoring=ScoringSettings(),
             webhook=WebhookSettings(),
@@ -145,6 +166,7 @@ class Settings:
                 max_tokens=self.llm.max_tokens,
                 timeout=self.llm.timeout,
                 max_retries=self.llm.max_retries,
+                explanation_threshold=self.llm.explanation_threshold,
             ),
             scoring=self.scoring,
             webhook=self.webhook,
@@ -30,6 +30,15 @@ class BaseAnalyzer(ABC):
         """Analyze data for risk signals"""
         pass
 
+    @abstractmethod
+    async def explain(
+        self,
+        data: SECFilingData,
+        analysis: AnalysisResult,
+    ) -> str | None:
+        """Generate a plain-English explanation for a completed analysis"""
+        pass
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """Return the name of the analysis provider"""
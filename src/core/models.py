@@ -5,6 +5,7 @@ Uses dataclasses for immutable, type-safe data structures.
 These models represent the domain entities and value objects.
 """
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -26,14 +27,21 @@ class RiskLevel(str, Enum):
     @classmethod
     def from_score(cls, score: int) -> "RiskLevel":
         """Determine risk level from numeric score"""
-        if score < 30:
+        if score <= 0:
             return cls.LOW
-        elif score < 50:
-            return cls.MODERATE
-        elif score < 70:
-            return cls.ELEVATED
-        else:
+        if score >= 100:
             return cls.HIGH
+        return _RISK_LEVEL_BY_SCORE[int(score)]
+
+
+# Precomputed level for every score in [0, 100]; from_score indexes into it
+_RISK_LEVEL_BY_SCORE: tuple[RiskLevel, ...] = tuple(
+    RiskLevel.LOW if s < 30 else
+    RiskLevel.MODERATE if s < 50 else
+    RiskLevel.ELEVATED if s < 70 else
+    RiskLevel.HIGH
+    for s in range(101)
+)
 
 
 class TransactionType(str, Enum):
@@ -51,18 +59,21 @@ class TransactionType(str, Enum):
     @property
     def description(self) -> str:
         """Human-readable description"""
-        descriptions = {
-            "P": "Purchase",
-            "S": "Sale",
-            "A": "Grant/Award",
-            "D": "Sale to issuer",
-            "F": "Tax withholding",
-            "M": "Option exercise",
-            "G": "Gift",
-            "C": "Conversion",
-            "J": "Other acquisition",
-        }
-        return descriptions.get(self.value, f"Other ({self.value})")
+        return _TRANSACTION_DESCRIPTIONS.get(self.value, f"Other ({self.value})")
+
+
+# Transaction code -> description, built once rather than per lookup
+_TRANSACTION_DESCRIPTIONS = {
+    "P": "Purchase",
+    "S": "Sale",
+    "A": "Grant/Award",
+    "D": "Sale to issuer",
+    "F": "Tax withholding",
+    "M": "Option exercise",
+    "G": "Gift",
+    "C": "Conversion",
+    "J": "Other acquisition",
+}
 
 
 class Severity(str, Enum):
@@ -72,7 +83,14 @@ class Severity(str, Enum):
     HIGH = "high"
 
 
-@dataclass(frozen=True)
+# 8-K items that flag auditor changes or restatements
+_CRITICAL_8K_ITEMS = frozenset({"4.01", "4.02"})
+
+# Item code within an item label, e.g. "4.02" in "Item 4.02 - Non-Reliance"
+_8K_ITEM_CODE_RE = re.compile(r"(?<!\d)\d\.\d\d(?!\d)")
+
+
+@dataclass(frozen=True, slots=True)
 class Filing8K:
     """Represents an SEC 8-K filing"""
     date: str
@@ -82,16 +100,18 @@ class Filing8K:
     content_snippet: Optional[str] = None
     items: tuple[str, ...] = field(default_factory=tuple)
 
+    @staticmethod
+    def item_code(item: str) -> Optional[str]:
+        """Item code ("N.NN") in an item label, wherever it appears"""
+        match = _8K_ITEM_CODE_RE.search(item)
+        return match.group() if match else None
+
     def has_critical_item(self) -> bool:
         """Check if filing contains critical items (4.01 or 4.02)"""
-        critical_items = ("4.01", "4.02")
-        return any(
-            any(critical in item for critical in critical_items)
-            for item in self.items
-        )
+        return any(self.item_code(item) in _CRITICAL_8K_ITEMS for item in self.items)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InsiderTransaction:
     """Represents a Form 4 insider transaction"""
     date: str
@@ -116,13 +136,14 @@ class InsiderTransaction:
     @property
     def transaction_description(self) -> str:
         """Get human-readable transaction description"""
-        try:
-            return TransactionType(self.transaction_type).description
-        except ValueError:
+        # Direct code lookup; skips constructing the TransactionType member
+        description = _TRANSACTION_DESCRIPTIONS.get(self.transaction_type)
+        if description is None:
             return f"Other ({self.transaction_type})"
+        return description
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SECFilingData:
     """Container for all SEC data collected for a ticker"""
     ticker: str
@@ -142,7 +163,7 @@ class SECFilingData:
         return len(self.filings_8k) + len(self.filings_form4)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RedFlag:
     """A detected red flag signal"""
     type: str
@@ -153,7 +174,7 @@ class RedFlag:
     filing_date: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InsiderPattern:
     """A detected insider trading pattern"""
     type: str
@@ -163,7 +184,7 @@ class InsiderPattern:
     evidence_url: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InsiderSummary:
     """Summary of insider trading activity"""
     net_activity: str  # "net_selling", "net_buying", "neutral"
@@ -173,7 +194,7 @@ class InsiderSummary:
     insiders_buying: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
     """Result from risk analyzer"""
     red_flags: tuple[RedFlag, ...]
@@ -185,7 +206,7 @@ class AnalysisResult:
     explanation: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoringResult:
     """Result from risk scorer"""
     risk_score: int
@@ -195,7 +216,7 @@ class ScoringResult:
     adjustment_reasons: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskReport:
     """Complete risk report for a ticker"""
     ticker: str
@@ -10,7 +10,7 @@ import logging
 from apify import Actor
 
 from .config import get_settings
-from .collectors import StockUniverseCollector
+from .collectors import SECCollector, StockUniverseCollector
 from .services import RiskScannerService, WebhookService, IncrementalScanner
 from .formatters.json_formatter import JsonFormatter
 
@@ -37,6 +37,7 @@ async def main():
         incremental_mode = actor_input.get("incrementalMode", True)
         lookback_days = actor_input.get("lookbackDays", 30)
         include_explanation = actor_input.get("includeExplanation", True)
+        force_explanations = actor_input.get("forceExplanations", False)
         alert_threshold = actor_input.get("alertThreshold", 70)
         webhook_url = actor_input.get("webhookUrl")
 
@@ -98,9 +99,12 @@ async def main():
         if use_incremental:
             Actor.log.info("Incremental mode enabled - skipping stocks with no new filings")
 
-        # Initialize services
-        scanner = RiskScannerService(settings=settings)
-        incremental_scanner = IncrementalScanner(scanner=scanner, settings=settings) if use_incremental else None
+        # Initialize services (one SEC collector shared so HTTP connections are reused)
+        sec_collector = SECCollector(settings=settings)
+        scanner = RiskScannerService(collector=sec_collector, settings=settings)
+        incremental_scanner = IncrementalScanner(
+            scanner=scanner, sec_collector=sec_collector, settings=settings
+        ) if use_incremental else None
         webhook_service = WebhookService(settings=settings)
         formatter = JsonFormatter()
 
@@ -116,6 +120,7 @@ async def main():
                     tickers,
                     lookback_days=lookback_days,
                     include_explanation=include_explanation,
+                    force_explanation=force_explanations,
                 )
                 Actor.log.info(f"Incremental scan: {scan_stats}")
 
@@ -125,6 +130,7 @@ async def main():
                     tickers,
                     lookback_days=lookback_days,
                     include_explanation=include_explanation,
+                    force_explanation=force_explanations,
                 )
             else:
                 # Large scan without incremental: process in batches
@@ -139,6 +145,7 @@ async def main():
                         batch,
                         lookback_days=lookback_days,
                         include_explanation=include_explanation,
+                        force_explanation=force_explanations,
                     )
                     all_results.extend(batch_results)
 
@@ -147,42 +154,55 @@ async def main():
                     Actor.log.info(f"Progress: {processed}/{len(tickers)} stocks processed")
 
         finally:
-            # Clean up incremental scanner resources
-            if incremental_scanner:
-                await incremental_scanner.close()
-
-        # Push results to dataset
-        for result in all_results:
-            if result.success and result.report:
-                # Format and push successful result
-                report_dict = formatter.to_dict(result.report)
-                await Actor.push_data(report_dict)
-
-                Actor.log.info(
-                    f"{result.ticker}: Risk Score {result.report.risk_score}/100 "
-                    f"({result.report.risk_level.value})"
-                )
+            # Clean up the shared SEC collector once
+            await sec_collector.close()
 
-                # Send webhook if threshold exceeded
-                if webhook_url and webhook_service.should_alert(result.report, alert_threshold):
-                    Actor.log.info(f"Sending webhook alert for {result.ticker}")
-                    try:
-                        await webhook_service.send_alert(webhook_url, result.report)
-                        Actor.log.info(f"Webhook sent successfully for {result.ticker}")
-                    except Exception as e:
-                        Actor.log.warning(f"Webhook failed for {result.ticker}: {e}")
+        try:
+            # Push results to dataset, queueing alerts to send together;
+            # the webhook service applies the alert threshold
+            alert_targets = []
+            for result in all_results:
+                if result.success and result.report:
+                    # Format and push successful result
+                    report_dict = formatter.to_dict(result.report)
+                    await Actor.push_data(report_dict)
+
+                    Actor.log.info(
+                        f"{result.ticker}: Risk Score {result.report.risk_score}/100 "
+                        f"({result.report.risk_level.value})"
+                    )
 
-            else:
-                # Push error result
-                error_data = {
-                    "ticker": result.ticker,
-                    "risk_score": None,
-                    "risk_level": None,
-                    "error": result.error,
-                    "analyzed_at": None,
-                }
-                await Actor.push_data(error_data)
-                Actor.log.error(f"{result.ticker}: {result.error}")
+                    if webhook_url:
+                        alert_targets.append((webhook_url, result.report, "generic"))
+
+                else:
+                    # Push error result
+                    error_data = {
+                        "ticker": result.ticker,
+                        "risk_score": None,
+                        "risk_level": None,
+                        "error": result.error,
+                        "analyzed_at": None,
+                    }
+                    await Actor.push_data(error_data)
+                    Actor.log.error(f"{result.ticker}: {result.error}")
+
+            # Send webhook alerts concurrently
+            if alert_targets:
+                Actor.log.info(f"Checking {len(alert_targets)} report(s) for webhook alerts")
+                outcomes = await webhook_service.send_alerts(alert_targets, alert_threshold)
+                for (_, report, _), outcome in zip(alert_targets, outcomes):
+                    if outcome is True:
+                        Actor.log.info(f"Webhook sent successfully for {report.ticker}")
+                    elif outcome is False:
+                        # Below the alert threshold; nothing was sent
+                        continue
+                    else:
+                        # Any exception gather returned, including CancelledError
+                        Actor.log.warning(f"Webhook failed for {report.ticker}: {outcome!r}")
+        finally:
+            # Release the pooled webhook client even if pushing or alerting fails
+            await webhook_service.close()
 
         # Log summary
         summary = scanner.get_summary(all_results)
@@ -10,6 +10,7 @@ from typing import Optional
 from ..config import Settings, get_settings
 from ..core.interfaces import BaseScorer
 from ..core.models import (
+    Filing8K,
     SECFilingData,
     AnalysisResult,
     ScoringResult,
@@ -50,11 +51,12 @@ class AuditorChangeRule(ScoringRule):
             adjustment=penalty,
             reason_template="+{adj} for auditor change"
         )
+        self._reason = self.reason_template.format(adj=self.adjustment)
 
     def apply(self, analysis: AnalysisResult, data: Optional[SECFilingData]) -> tuple[int, str]:
         for flag in analysis.red_flags:
             if flag.type == "AUDITOR_CHANGE":
-                return self.adjustment, self.reason_template.format(adj=self.adjustment)
+                return self.adjustment, self._reason
         return 0, ""
 
 
@@ -67,11 +69,12 @@ class FinancialRestatementRule(ScoringRule):
             adjustment=penalty,
             reason_template="+{adj} for financial restatement"
         )
+        self._reason = self.reason_template.format(adj=self.adjustment)
 
     def apply(self, analysis: AnalysisResult, data: Optional[SECFilingData]) -> tuple[int, str]:
         for flag in analysis.red_flags:
             if flag.type == "FINANCIAL_RESTATEMENT":
-                return self.adjustment, self.reason_template.format(adj=self.adjustment)
+                return self.adjustment, self._reason
         return 0, ""
 
 
@@ -103,6 +106,7 @@ class HighSeverityPatternsRule(ScoringRule):
             reason_template="+{adj} for multiple high-severity insider patterns"
         )
         self.threshold = threshold
+        self._reason = self.reason_template.format(adj=self.adjustment)
 
     def apply(self, analysis: AnalysisResult, data: Optional[SECFilingData]) -> tuple[int, str]:
         high_severity = [
@@ -110,7 +114,7 @@ class HighSeverityPatternsRule(ScoringRule):
             if p.severity == Severity.HIGH
         ]
         if len(high_severity) >= self.threshold:
-            return self.adjustment, self.reason_template.format(adj=self.adjustment)
+            return self.adjustment, self._reason
         return 0, ""
 
 
@@ -123,13 +127,14 @@ class CombinedSignalsRule(ScoringRule):
             adjustment=penalty,
             reason_template="+{adj} for red flags + insider selling combination"
         )
+        self._reason = self.reason_template.format(adj=self.adjustment)
 
     def apply(self, analysis: AnalysisResult, data: Optional[SECFilingData]) -> tuple[int, str]:
         has_red_flags = len(analysis.red_flags) > 0
         has_insider_selling = analysis.insider_summary.net_activity == "net_selling"
 
         if has_red_flags and has_insider_selling:
-            return self.adjustment, self.reason_template.format(adj=self.adjustment)
+            return self.adjustment, self._reason
         return 0, ""
 
 
@@ -147,6 +152,10 @@ class Critical8KItemsRule(ScoringRule):
             adjustment=0,
             reason_template="+{adj} for Item {item}"
         )
+        self._reasons = {
+            item: self.reason_template.format(adj=penalty, item=item)
+            for item, penalty in self.CRITICAL_ITEMS.items()
+        }
 
     def apply(self, analysis: AnalysisResult, data: Optional[SECFilingData]) -> tuple[int, str]:
         if not data:
@@ -157,10 +166,11 @@ class Critical8KItemsRule(ScoringRule):
 
         for filing in data.filings_8k:
             for item in filing.items:
-                for critical_item, penalty in self.CRITICAL_ITEMS.items():
-                    if critical_item in item:
-                        total_adjustment += penalty
-                        reasons.append(f"+{penalty} for Item {critical_item}")
+                code = Filing8K.item_code(item)
+                penalty = self.CRITICAL_ITEMS.get(code)
+                if penalty:
+                    total_adjustment += penalty
+                    reasons.append(self._reasons[code])
 
         if total_adjustment > 0:
             return total_adjustment, "; ".join(reasons)
@@ -265,13 +275,15 @@ class CategoryScorer:
         for category, weight in self.CATEGORY_WEIGHTS.items():
             raw_score = category_scores[category]
             # Cap individual category contribution at 100 points before weighting
-            capped_score = min(raw_score, 100)
+            capped_score = 100 if raw_score > 100 else raw_score
             weighted_contribution = capped_score * weight
             category_breakdown[category] = weighted_contribution
             weighted_total += weighted_contribution
 
         # Cap final score at 100
-        final_score = min(int(weighted_total), 100)
+        final_score = int(weighted_total)
+        if final_score > 100:
+            final_score = 100
 
         return final_score, category_breakdown
 
@@ -295,6 +307,7 @@ class RuleBasedScorer(BaseScorer):
         """
         self._settings = settings or get_settings()
         self._rules = self._create_default_rules()
+        self._rule_appliers = self._bind_rules()
         self._use_category_scoring = use_category_scoring
         self._category_scorer = CategoryScorer() if use_category_scoring else None
 
@@ -310,9 +323,14 @@ class RuleBasedScorer(BaseScorer):
             Critical8KItemsRule(),
         ]
 
+    def _bind_rules(self) -> tuple:
+        """Resolve each rule's apply method once so score() skips the lookup"""
+        return tuple(rule.apply for rule in self._rules)
+
     def add_rule(self, rule: ScoringRule) -> None:
         """Add a custom scoring rule"""
         self._rules.append(rule)
+        self._rule_appliers = self._bind_rules()
 
     def get_scoring_method(self) -> str:
         if self._use_category_scoring:
@@ -351,14 +369,19 @@ class RuleBasedScorer(BaseScorer):
         total_adjustments = 0
         adjustment_reasons = []
 
-        for rule in self._rules:
-            adjustment, reason = rule.apply(analysis, data)
+        for apply_rule in self._rule_appliers:
+            adjustment, reason = apply_rule(analysis, data)
             if adjustment != 0:
                 total_adjustments += adjustment
                 if reason:
                     adjustment_reasons.append(reason)
 
-        final_score = min(100, max(0, base_score + total_adjustments))
+        # Clamp to [0, 100] inline rather than via nested min()/max() calls
+        final_score = base_score + total_adjustments
+        if final_score < 0:
+            final_score = 0
+        elif final_score > 100:
+            final_score = 100
 
         return ScoringResult(
             risk_score=final_score,
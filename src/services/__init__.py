@@ -5,5 +5,6 @@ Service layer module
 from .risk_scanner import RiskScannerService
 from .webhook_service import WebhookService
 from .incremental_scanner import IncrementalScanner
+from .filing_check_cache import FilingCheckCache
 
-__all__ = ["RiskScannerService", "WebhookService", "IncrementalScanner"]
+__all__ = ["RiskScannerService", "WebhookService", "IncrementalScanner", "FilingCheckCache"]
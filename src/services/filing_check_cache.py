@@ -0,0 +1,88 @@
+"""
+Filing Check Cache
+
+Persists the outcome of "any new filings since <date>?" checks so that
+back-to-back incremental runs don't repeat the same SEC requests.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class FilingCheckCache:
+    """
+    TTL cache of filing checks keyed by (ticker, form type, since date).
+
+    Entries live in memory and are optionally mirrored to a JSON file.
+    A new filing moves the ticker's stored filing date forward, so stale
+    keys simply stop being looked up; the TTL bounds how long a "no new
+    filings" answer is trusted.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: float = 6 * 60 * 60):
+        """
+        Initialize filing check cache.
+
+        Args:
+            path: JSON file to persist entries to (memory only if not provided)
+            ttl_seconds: How long a cached check result stays valid
+        """
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[bool, float]] = {}
+
+    @staticmethod
+    def _key(ticker: str, form_type: str, since_date: str) -> str:
+        return f"{ticker}|{form_type}|{since_date}"
+
+    def get(self, ticker: str, form_type: str, since_date: str) -> Optional[bool]:
+        """Return the cached check result, or None if missing or expired"""
+        entry = self._entries.get(self._key(ticker, form_type, since_date))
+        if entry is None:
+            return None
+        has_new, checked_at = entry
+        if time.time() - checked_at > self._ttl_seconds:
+            return None
+        return has_new
+
+    def put(self, ticker: str, form_type: str, since_date: str, has_new: bool) -> None:
+        """Record a check result"""
+        self._entries[self._key(ticker, form_type, since_date)] = (bool(has_new), time.time())
+
+    def load(self) -> None:
+        """Load unexpired entries from the cache file"""
+        if not self._path:
+            return
+        cutoff = time.time() - self._ttl_seconds
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+            for key, (has_new, checked_at) in data.items():
+                if checked_at >= cutoff:
+                    self._entries[key] = (bool(has_new), checked_at)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable filing check cache {self._path}: {e}")
+
+    def save(self) -> None:
+        """Write unexpired entries to the cache file"""
+        if not self._path:
+            return
+        cutoff = time.time() - self._ttl_seconds
+        data = {k: v for k, v in self._entries.items() if v[1] >= cutoff}
+        try:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{self._path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.warning(f"Failed to write filing check cache {self._path}: {e}")
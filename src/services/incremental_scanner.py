@@ -5,12 +5,14 @@ Wraps RiskScannerService with incremental scanning logic to skip
 tickers that haven't had new filings since their last scan.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from ..config import Settings, get_settings
 from ..collectors.sec_collector import SECCollector
 from ..storage.scan_state import ScanStateStore, ScanStats
+from .filing_check_cache import FilingCheckCache
 from .risk_scanner import RiskScannerService, ScanResult
 
 
@@ -34,6 +36,7 @@ class IncrementalScanner:
         sec_collector: Optional[SECCollector] = None,
         state_store: Optional[ScanStateStore] = None,
         settings: Optional[Settings] = None,
+        filing_check_cache: Optional[FilingCheckCache] = None,
     ):
         """
         Initialize incremental scanner.
@@ -43,17 +46,26 @@ class IncrementalScanner:
             sec_collector: SECCollector for filing checks (creates default if not provided)
             state_store: ScanStateStore for state persistence (creates default if not provided)
             settings: Application settings
+            filing_check_cache: Cache of filing check results (built from settings if not provided)
         """
         self._settings = settings or get_settings()
-        self._scanner = scanner or RiskScannerService(settings=self._settings)
         self._sec_collector = sec_collector or SECCollector(settings=self._settings)
+        # Share the collector (and its HTTP connection pool) with the default scanner
+        self._scanner = scanner or RiskScannerService(
+            collector=self._sec_collector, settings=self._settings
+        )
         self._state_store = state_store or ScanStateStore()
+        self._filing_check_cache = filing_check_cache or FilingCheckCache(
+            path=self._settings.sec.filing_check_cache_path,
+            ttl_seconds=self._settings.sec.filing_check_cache_ttl_hours * 60 * 60,
+        )
         self._state_loaded = False
 
     async def _ensure_state_loaded(self) -> None:
         """Ensure state is loaded from store"""
         if not self._state_loaded:
             await self._state_store.load()
+            self._filing_check_cache.load()
             self._state_loaded = True
 
     async def scan_incremental(
@@ -62,6 +74,7 @@ class IncrementalScanner:
         lookback_days: int = 30,
         include_explanation: bool = True,
         force_rescan: bool = False,
+        force_explanation: bool = False,
     ) -> tuple[list[ScanResult], ScanStats]:
         """
         Scan only tickers that need rescanning.
@@ -79,6 +92,7 @@ class IncrementalScanner:
             lookback_days: Staleness threshold in days
             include_explanation: Generate plain-English explanations
             force_rescan: Bypass incremental logic, scan all tickers
+            force_explanation: Explain every ticker regardless of score
 
         Returns:
             Tuple of (results, stats) where:
@@ -87,48 +101,60 @@ class IncrementalScanner:
         """
         await self._ensure_state_loaded()
 
-        results: list[ScanResult] = []
         skip_reasons: dict[str, int] = {}
-        scanned_count = 0
-        skipped_count = 0
+        to_scan: list[str] = []
 
-        for i, ticker in enumerate(tickers):
-            ticker = ticker.upper().strip()
-            progress = f"[{i+1}/{len(tickers)}]"
+        normalized = [ticker.upper().strip() for ticker in tickers]
 
-            # Determine if we need to scan
-            if force_rescan:
-                should_scan = True
-                reason = "force_rescan"
-            else:
-                should_scan, reason = await self._should_scan(ticker, lookback_days)
+        # Determine up front which tickers need scanning; the filing checks
+        # are independent network calls, so run them concurrently
+        if force_rescan:
+            decisions = [(True, "force_rescan")] * len(normalized)
+        else:
+            semaphore = asyncio.Semaphore(self._settings.sec.max_filing_check_concurrency)
+
+            async def check(ticker: str) -> tuple[bool, str]:
+                async with semaphore:
+                    return await self._should_scan(ticker, lookback_days)
+
+            decisions = await asyncio.gather(*(check(ticker) for ticker in normalized))
+
+        for i, (ticker, (should_scan, reason)) in enumerate(zip(normalized, decisions)):
+            progress = f"[{i+1}/{len(tickers)}]"
 
             if should_scan:
                 logger.info(f"{progress} Scanning {ticker} (reason: {reason})")
+                to_scan.append(ticker)
+            else:
+                logger.info(f"{progress} Skipping {ticker} (reason: {reason})")
+                skip_reasons[reason] = skip_reasons.get(reason, 0) + 1
+
+        # Scans are dominated by SEC/LLM round-trips, so overlap a bounded number
+        scan_semaphore = asyncio.Semaphore(self._settings.actor.max_concurrent_scans)
+
+        async def scan(ticker: str) -> ScanResult:
+            async with scan_semaphore:
                 result = await self._scanner.scan_ticker(
                     ticker,
                     lookback_days=lookback_days,
                     include_explanation=include_explanation,
+                    force_explanation=force_explanation,
                 )
-                results.append(result)
-                scanned_count += 1
-
                 # Update state after successful scan
                 if result.success and result.report:
                     await self._update_state_after_scan(ticker, result)
+                return result
 
-            else:
-                logger.info(f"{progress} Skipping {ticker} (reason: {reason})")
-                skip_reasons[reason] = skip_reasons.get(reason, 0) + 1
-                skipped_count += 1
+        results = list(await asyncio.gather(*(scan(ticker) for ticker in to_scan)))
 
         # Save state after all scans complete
         await self._state_store.save()
+        self._filing_check_cache.save()
 
         stats = ScanStats(
             total=len(tickers),
-            scanned=scanned_count,
-            skipped=skipped_count,
+            scanned=len(to_scan),
+            skipped=len(normalized) - len(to_scan),
             reasons=skip_reasons,
         )
 
@@ -155,39 +181,66 @@ class IncrementalScanner:
             return True, reason
 
         # Time-based check passed, now check for new filings
-        # This requires 2 API calls but avoids full scan if no new filings
+        # This requires up to 2 API calls but avoids full scan if no new filings
         state = self._state_store.get_state(ticker)
         if state is None:
             return True, "never_scanned"
 
-        # Check for new 8-K filings
+        # Check both filing types concurrently; 8-K results take precedence
+        checks = []
         if state.last_8k_date:
-            try:
-                has_new_8k = await self._sec_collector.has_new_filings_8k(
-                    ticker, state.last_8k_date
-                )
-                if has_new_8k:
-                    return True, "new_8k_filing"
-            except Exception as e:
-                logger.warning(f"Failed to check 8-K filings for {ticker}: {e}")
-                # On error, default to scanning
-                return True, "filing_check_error"
-
-        # Check for new Form 4 filings
+            checks.append((
+                "8-K",
+                "new_8k_filing",
+                self._has_new_filings(
+                    ticker, "8-K", state.last_8k_date, self._sec_collector.has_new_filings_8k
+                ),
+            ))
         if state.last_form4_date:
-            try:
-                has_new_form4 = await self._sec_collector.has_new_filings_form4(
-                    ticker, state.last_form4_date
-                )
-                if has_new_form4:
-                    return True, "new_form4_filing"
-            except Exception as e:
-                logger.warning(f"Failed to check Form 4 filings for {ticker}: {e}")
+            checks.append((
+                "Form 4",
+                "new_form4_filing",
+                self._has_new_filings(
+                    ticker, "4", state.last_form4_date, self._sec_collector.has_new_filings_form4
+                ),
+            ))
+
+        outcomes = await asyncio.gather(
+            *(check for _, _, check in checks), return_exceptions=True
+        )
+
+        for (form_name, new_reason, _), outcome in zip(checks, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Failed to check {form_name} filings for {ticker}: {outcome}")
+                # On error, default to scanning
                 return True, "filing_check_error"
+            if outcome:
+                return True, new_reason
 
         # No new filings found
         return False, "unchanged"
 
+    async def _has_new_filings(
+        self,
+        ticker: str,
+        form_type: str,
+        since_date: str,
+        fetch: Callable[[str, str], Awaitable[bool]],
+    ) -> bool:
+        """
+        Run a filing check, answering from the filing check cache when possible.
+
+        Only completed checks are cached; a failed fetch raises before
+        anything is stored, so the next run asks SEC again.
+        """
+        cached = self._filing_check_cache.get(ticker, form_type, since_date)
+        if cached is not None:
+            return cached
+
+        has_new = await fetch(ticker, since_date)
+        self._filing_check_cache.put(ticker, form_type, since_date, has_new)
+        return has_new
+
     async def _update_state_after_scan(
         self, ticker: str, result: ScanResult
     ) -> None:
@@ -212,5 +265,5 @@ class IncrementalScanner:
         )
 
     async def close(self) -> None:
-        """Close resources"""
+        """Close resources (including the collector shared with the default scanner)"""
         await self._sec_collector.close()
\ No newline at end of file
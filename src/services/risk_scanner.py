@@ -6,8 +6,8 @@ Implements dependency injection for flexible component configuration.
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Optional, Protocol
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Iterable, Optional, Protocol
 
 from ..config import Settings, get_settings
 from ..core.interfaces import DataCollector, BaseAnalyzer, BaseScorer
@@ -89,14 +89,20 @@ class RiskScannerService:
         ticker: str,
         lookback_days: int = 30,
         include_explanation: bool = True,
+        force_explanation: bool = False,
     ) -> ScanResult:
         """
         Scan a single ticker for risk signals.
 
+        Explanations are generated after scoring, and only for reports
+        at or above the configured explanation threshold, unless
+        force_explanation is set.
+
         Args:
             ticker: Stock ticker symbol
             lookback_days: Days of filings to analyze
             include_explanation: Generate plain-English explanation
+            force_explanation: Explain every ticker regardless of score
 
         Returns:
             ScanResult with report or error
@@ -116,12 +122,23 @@ class RiskScannerService:
 
             # Step 2: Analyze for risk signals
             logger.debug(f"Analyzing {ticker} with {self._analyzer.get_provider_name()}")
-            analysis = await self._analyzer.analyze(sec_data, include_explanation)
+            analysis = await self._analyzer.analyze(
+                sec_data, include_explanation and force_explanation
+            )
 
             # Step 3: Apply scoring adjustments
             logger.debug(f"Scoring {ticker} with {self._scorer.get_scoring_method()}")
             scoring = self._scorer.score(analysis, sec_data)
 
+            # Step 3b: Explain only reports that are likely to be read
+            if (
+                include_explanation
+                and not force_explanation
+                and scoring.risk_score >= self._settings.llm.explanation_threshold
+            ):
+                explanation = await self._analyzer.explain(sec_data, analysis)
+                analysis = replace(analysis, explanation=explanation)
+
             # Step 4: Format output
             report = self._formatter.format(ticker, sec_data, analysis, scoring)
 
@@ -163,68 +180,109 @@ class RiskScannerService:
                 success=False,
             )
 
-    async def scan_multiple(
+    async def iter_scan_multiple(
         self,
         tickers: list[str],
         lookback_days: int = 30,
         include_explanation: bool = True,
-    ) -> list[ScanResult]:
+        force_explanation: bool = False,
+    ) -> AsyncIterator[ScanResult]:
         """
-        Scan multiple tickers sequentially.
+        Scan multiple tickers sequentially, yielding each result as it completes.
+
+        Lets callers handle and drop each report instead of holding
+        the whole batch in memory.
 
         Args:
             tickers: List of ticker symbols
             lookback_days: Days of filings to analyze
             include_explanation: Generate plain-English explanations
+            force_explanation: Explain every ticker regardless of score
 
-        Returns:
-            List of ScanResults
+        Yields:
+            ScanResult for each ticker, in input order
         """
-        results = []
-
         for i, ticker in enumerate(tickers):
             logger.info(f"[{i+1}/{len(tickers)}] Processing {ticker}")
 
-            result = await self.scan_ticker(
+            yield await self.scan_ticker(
                 ticker,
                 lookback_days=lookback_days,
                 include_explanation=include_explanation,
+                force_explanation=force_explanation,
             )
-            results.append(result)
 
-        return results
+    async def scan_multiple(
+        self,
+        tickers: list[str],
+        lookback_days: int = 30,
+        include_explanation: bool = True,
+        force_explanation: bool = False,
+    ) -> list[ScanResult]:
+        """
+        Scan multiple tickers sequentially.
 
-    def get_summary(self, results: list[ScanResult]) -> dict:
+        Args:
+            tickers: List of ticker symbols
+            lookback_days: Days of filings to analyze
+            include_explanation: Generate plain-English explanations
+            force_explanation: Explain every ticker regardless of score
+
+        Returns:
+            List of ScanResults
+        """
+        return [
+            result
+            async for result in self.iter_scan_multiple(
+                tickers,
+                lookback_days=lookback_days,
+                include_explanation=include_explanation,
+                force_explanation=force_explanation,
+            )
+        ]
+
+    def get_summary(self, results: Iterable[ScanResult]) -> dict:
         """
         Generate summary statistics from results.
 
+        Makes a single pass, so results may be any iterable.
+
         Args:
-            results: List of ScanResults
+            results: ScanResults to summarize
 
         Returns:
             Summary dictionary
         """
-        successful = [r for r in results if r.success and r.report]
-        failed = [r for r in results if not r.success]
-
-        high_risk = [
-            r for r in successful
-            if r.report and r.report.risk_level.value == "high"
-        ]
-        elevated = [
-            r for r in successful
-            if r.report and r.report.risk_level.value == "elevated"
-        ]
+        total = 0
+        successful = 0
+        high_risk_tickers = []
+        elevated_tickers = []
+        failed_tickers = []
+
+        for r in results:
+            total += 1
+            if not r.success:
+                failed_tickers.append(r.ticker)
+                continue
+            if not r.report:
+                continue
+
+            successful += 1
+            level = r.report.risk_level.value
+            if level == "high":
+                high_risk_tickers.append(r.ticker)
+            elif level == "elevated":
+                elevated_tickers.append(r.ticker)
 
         return {
-            "total": len(results),
-            "successful": len(successful),
-            "failed": len(failed),
-            "high_risk_count": len(high_risk),
-            "elevated_count": len(elevated),
-            "high_risk_tickers": [r.ticker for r in high_risk],
-            "elevated_tickers": [r.ticker for r in elevated],
-            "failed_tickers": [r.ticker for r in failed],
+            "total": total,
+            "successful": successful,
+            "failed": len(failed_tickers),
+            "high_risk_count": len(high_risk_tickers),
+            "elevated_count": len(elevated_tickers),
+            "high_risk_tickers": high_risk_tickers,
+            "elevated_tickers": elevated_tickers,
+            "failed_tickers": failed_tickers,
         }
 
 
@@ -5,7 +5,11 @@ Handles sending notifications to webhook endpoints.
 """
 
 import asyncio
-from typing import Optional
+import importlib.util
+import json
+import random
+from collections import OrderedDict
+from typing import Callable, ClassVar, Optional
 
 import httpx
 
@@ -15,6 +19,23 @@ from ..core.exceptions import WebhookError
 from ..formatters.webhook_formatter import WebhookFormatter
 
 
+try:
+    # Optional C encoder; its output is already the bytes httpx sends
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _jittered_backoff(attempt: int, base: float, cap: float) -> float:
+    """Capped exponential backoff with jitter, so concurrent retries spread out"""
+    return random.uniform(base, min(cap, base * 2 ** attempt))
+
+
 class WebhookService:
     """
     Service for sending webhook notifications.
@@ -25,6 +46,16 @@ class WebhookService:
     - Slack blocks
     """
 
+    # Max formatted payloads kept for re-sending one report to several endpoints
+    PAYLOAD_CACHE_SIZE = 128
+
+    # Format type -> formatter method; unknown types fall back to generic
+    _DISPATCH: ClassVar[dict[str, Callable[[WebhookFormatter, RiskReport], dict]]] = {
+        "generic": WebhookFormatter.format_generic_payload,
+        "discord": WebhookFormatter.format_discord_embed,
+        "slack": WebhookFormatter.format_slack_blocks,
+    }
+
     def __init__(self, settings: Optional[Settings] = None):
         """
         Initialize webhook service.
@@ -34,57 +65,120 @@ class WebhookService:
         """
         self._settings = settings or get_settings()
         self._formatter = WebhookFormatter()
+        self._client: Optional[httpx.AsyncClient] = None
+        # Created lazily so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # (id(report), format_type) -> (report, payload); holding the report
+        # keeps its id from being reused while the entry is cached
+        self._payload_cache: OrderedDict[tuple[int, str], tuple[RiskReport, dict]] = OrderedDict()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create reusable HTTP client (pooled across alerts and retries)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._settings.webhook.timeout,
+                headers={"Content-Type": "application/json"},
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                # Multiplex concurrent alerts to one host over a single connection
+                http2=_HTTP2_AVAILABLE,
+            )
+        return self._client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get or create the semaphore bounding in-flight requests"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._settings.webhook.max_concurrent)
+        return self._semaphore
+
+    async def close(self) -> None:
+        """Close HTTP client and release resources"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    def _backoff(self, attempt: int) -> float:
+        """Delay before the next retry attempt"""
+        webhook = self._settings.webhook
+        return _jittered_backoff(attempt, webhook.retry_backoff_base, webhook.retry_backoff_cap)
+
+    def _retry_after(self, response: httpx.Response, attempt: int) -> float:
+        """Delay requested by a 429 response, capped; falls back to backoff"""
+        try:
+            delay = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            return self._backoff(attempt)
+        # Negative (or NaN) values are invalid; huge ones would stall the run
+        if not delay >= 0:
+            return self._backoff(attempt)
+        return min(delay, self._settings.webhook.retry_backoff_cap)
 
     async def send_alert(
         self,
         url: str,
         report: RiskReport,
-        format_type: str = "generic"
+        format_type: str = "generic",
+        threshold: Optional[int] = None,
+        always: bool = False,
     ) -> bool:
         """
         Send alert to webhook URL.
 
+        Reports below the alert threshold are skipped without formatting
+        or any HTTP work.
+
         Args:
             url: Webhook URL
             report: RiskReport to send
             format_type: "generic", "discord", or "slack"
+            threshold: Override threshold (uses default if not provided)
+            always: Send regardless of threshold (e.g. digest alerts)
 
         Returns:
-            True if successful
+            True if successful, False if skipped below threshold
 
         Raises:
             WebhookError: If delivery fails
         """
+        if not always and not self.should_alert(report, threshold):
+            return False
+
         payload = self._format_payload(report, format_type)
+        # Serialize once up front rather than on every retry
+        body = _json_dumps(payload)
+        client = await self._get_client()
+        semaphore = self._get_semaphore()
 
         for attempt in range(self._settings.webhook.max_retries + 1):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        url,
-                        json=payload,
-                        timeout=self._settings.webhook.timeout,
-                        headers={"Content-Type": "application/json"},
-                    )
-
-                    if response.status_code < 400:
-                        return True
-
-                    if response.status_code >= 500 and attempt < self._settings.webhook.max_retries:
-                        await asyncio.sleep(2 ** attempt)
-                        continue
-
-                    raise WebhookError(
-                        url=url,
-                        status_code=response.status_code,
-                        reason=response.text[:200]
-                    )
-
-            except httpx.TimeoutException:
+                # Hold the slot only for the POST, not for retry sleeps
+                async with semaphore:
+                    response = await client.post(url, content=body)
+
+                if response.status_code < 400:
+                    return True
+
+                if response.status_code == 429 and attempt < self._settings.webhook.max_retries:
+                    await asyncio.sleep(self._retry_after(response, attempt))
+                    continue
+
+                if response.status_code >= 500 and attempt < self._settings.webhook.max_retries:
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+
+                raise WebhookError(
+                    url=url,
+                    status_code=response.status_code,
+                    reason=response.text[:200]
+                )
+
+            except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                # Transient transport failures are worth retrying
                 if attempt < self._settings.webhook.max_retries:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(self._backoff(attempt))
                     continue
-                raise WebhookError(url=url, reason="Timeout")
+                if isinstance(e, httpx.TimeoutException):
+                    raise WebhookError(url=url, reason="Timeout")
+                raise WebhookError(url=url, reason=str(e))
 
             except WebhookError:
                 raise
@@ -94,14 +188,48 @@ class WebhookService:
 
         return False
 
+    async def send_alerts(
+        self,
+        targets: list[tuple[str, RiskReport, str]],
+        threshold: Optional[int] = None,
+    ) -> list[bool | BaseException]:
+        """
+        Send several alerts concurrently.
+
+        Failures are returned rather than raised, so one failing
+        endpoint does not stop the others.
+
+        Args:
+            targets: (url, report, format_type) tuples
+            threshold: Override threshold applied to every target
+
+        Returns:
+            One entry per target, in order: True/False from send_alert,
+            or the exception it raised
+        """
+        return await asyncio.gather(
+            *(
+                self.send_alert(url, report, format_type, threshold)
+                for url, report, format_type in targets
+            ),
+            return_exceptions=True,
+        )
+
     def _format_payload(self, report: RiskReport, format_type: str) -> dict:
-        """Format report for webhook"""
-        if format_type == "discord":
-            return self._formatter.format_discord_embed(report)
-        elif format_type == "slack":
-            return self._formatter.format_slack_blocks(report)
-        else:
-            return self._formatter.format_generic_payload(report)
+        """Format report for webhook (memoized per report and format)"""
+        cache_key = (id(report), format_type)
+        cached = self._payload_cache.get(cache_key)
+        if cached is not None and cached[0] is report:
+            self._payload_cache.move_to_end(cache_key)
+            return cached[1]
+
+        handler = self._DISPATCH.get(format_type, WebhookFormatter.format_generic_payload)
+        payload = handler(self._formatter, report)
+
+        self._payload_cache[cache_key] = (report, payload)
+        if len(self._payload_cache) > self.PAYLOAD_CACHE_SIZE:
+            self._payload_cache.popitem(last=False)
+        return payload
 
     def should_alert(self, report: RiskReport, threshold: Optional[int] = None) -> bool:
         """
@@ -114,5 +242,6 @@ class WebhookService:
         Returns:
             True if score exceeds threshold
         """
-        threshold = threshold or self._settings.webhook.default_threshold
+        if threshold is None:
+            threshold = self._settings.webhook.default_threshold
         return report.exceeds_threshold(threshold)
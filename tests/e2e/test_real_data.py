@@ -5,13 +5,21 @@ These tests are marked as 'slow' and 'integration' so they can be skipped in CI.
 They make real HTTP requests to SEC EDGAR.
 
 Run with: pytest -m e2e tests/e2e/
+Parallel: pytest -n auto -m e2e tests/e2e/  (requires pytest-xdist)
 Skip with: pytest -m "not e2e"
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 import os
 import time
-from datetime import datetime
+from unittest.mock import AsyncMock
+
+from src.collectors.sec_collector import SECCollector
+from src.core.models import RiskLevel
+from src.formatters.json_formatter import JsonFormatter
+from src.services.risk_scanner import RiskScannerBuilder
 
 # Skip all tests in this module if GROQ_API_KEY is not set
 pytestmark = [
@@ -21,162 +29,124 @@ pytestmark = [
         not os.getenv("GROQ_API_KEY"),
         reason="GROQ_API_KEY environment variable not set"
     ),
+    # Share one event loop so the module-scoped scanner's clients stay valid
+    pytest.mark.asyncio(loop_scope="module"),
 ]
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def scanner_service():
+    """Scanner built once and shared across the module"""
+    service = RiskScannerBuilder().build()
+    yield service
+    await service._collector.close()
+
+
 class TestRealSECData:
     """E2E tests with real SEC EDGAR data"""
 
-    @pytest.fixture
-    def test_tickers(self):
-        """Well-known tickers for testing"""
-        return ["AAPL", "MSFT", "GOOGL"]
-
-    @pytest.mark.asyncio
-    async def test_sec_collector_real_data(self, test_tickers):
+    @pytest.mark.parametrize("ticker", ["AAPL", "MSFT", "GOOGL"])
+    async def test_sec_collector_real_data(self, ticker):
         """Test SEC collector with real EDGAR data"""
-        from src.collectors.sec_collector import SECCollector
-
         collector = SECCollector()
 
         try:
-            for ticker in test_tickers[:1]:  # Just test one to be fast
-                data = await collector.collect(ticker, lookback_days=7)
-
-                # Verify response structure
-                assert data is not None
-                assert data.ticker == ticker
-                assert data.cik is not None
-                assert isinstance(data.filings_8k, tuple)
-                assert isinstance(data.filings_form4, tuple)
-                assert data.collected_at is not None
-                assert data.error is None
-
-                # Add small delay to respect rate limits
-                await collector._rate_limit()
+            data = await collector.collect(ticker, lookback_days=7)
+
+            # Verify response structure
+            assert data is not None
+            assert data.ticker == ticker
+            assert data.cik is not None
+            assert isinstance(data.filings_8k, tuple)
+            assert isinstance(data.filings_form4, tuple)
+            assert data.collected_at is not None
+            assert data.error is None
         finally:
             await collector.close()
 
-    @pytest.mark.asyncio
-    async def test_full_pipeline_real_data(self, test_tickers):
+    async def test_full_pipeline_real_data(self, scanner_service):
         """Test full pipeline with real data (single ticker)"""
-        from src.services.risk_scanner import RiskScannerBuilder
-        from src.core.models import RiskLevel
-
-        # Build the scanner
-        builder = RiskScannerBuilder()
-        service = builder.build()
+        # Scan single ticker
+        result = await scanner_service.scan_ticker("AAPL", lookback_days=7)
+
+        # Verify result structure
+        assert result is not None
+        assert result.success is True
+        assert result.ticker == "AAPL"
+
+        report = result.report
+        assert report is not None
+        assert 0 <= report.risk_score <= 100
+        assert report.risk_level in RiskLevel
+        assert report.analyzed_at is not None
+        assert isinstance(report.evidence_links, tuple)
+
+    async def test_output_schema_validation(self, scanner_service):
+        """Test that output matches expected schema"""
+        formatter = JsonFormatter()
 
-        try:
-            # Scan single ticker
-            result = await service.scan_ticker(test_tickers[0], lookback_days=7)
-
-            # Verify result structure
-            assert result is not None
-            assert result.success is True
-            assert result.ticker == test_tickers[0]
-
-            report = result.report
-            assert report is not None
-            assert 0 <= report.risk_score <= 100
-            assert report.risk_level in RiskLevel
-            assert report.analyzed_at is not None
-            assert isinstance(report.evidence_links, tuple)
-        finally:
-            await service._collector.close()
+        result = await scanner_service.scan_ticker("AAPL", lookback_days=7)
+        assert result.success is True
+        output = formatter.to_dict(result.report)
 
-    @pytest.mark.asyncio
-    async def test_output_schema_validation(self):
-        """Test that output matches expected schema"""
-        from src.services.risk_scanner import RiskScannerBuilder
-        from src.formatters.json_formatter import JsonFormatter
+        # Validate required fields
+        required_fields = [
+            "ticker",
+            "risk_score",
+            "risk_level",
+            "red_flags",
+            "insider_summary",
+            "evidence_links",
+            "analyzed_at",
+        ]
 
-        builder = RiskScannerBuilder()
-        service = builder.build()
-        formatter = JsonFormatter()
+        for field in required_fields:
+            assert field in output, f"Missing required field: {field}"
 
-        try:
-            result = await service.scan_ticker("AAPL", lookback_days=7)
-            assert result.success is True
-            output = formatter.to_dict(result.report)
-
-            # Validate required fields
-            required_fields = [
-                "ticker",
-                "risk_score",
-                "risk_level",
-                "red_flags",
-                "insider_summary",
-                "evidence_links",
-                "analyzed_at",
-            ]
-
-            for field in required_fields:
-                assert field in output, f"Missing required field: {field}"
-
-            # Validate types
-            assert isinstance(output["ticker"], str)
-            assert isinstance(output["risk_score"], int)
-            assert isinstance(output["risk_level"], str)
-            assert isinstance(output["red_flags"], list)
-            assert isinstance(output["evidence_links"], list)
-        finally:
-            await service._collector.close()
+        # Validate types
+        assert isinstance(output["ticker"], str)
+        assert isinstance(output["risk_score"], int)
+        assert isinstance(output["risk_level"], str)
+        assert isinstance(output["red_flags"], list)
+        assert isinstance(output["evidence_links"], list)
 
 
 class TestPerformanceTargets:
     """Test performance against documented targets"""
 
-    @pytest.mark.asyncio
-    async def test_single_ticker_performance(self):
+    async def test_single_ticker_performance(self, scanner_service):
         """Test that single ticker scan completes within target time"""
-        from src.services.risk_scanner import RiskScannerBuilder
-
-        builder = RiskScannerBuilder()
-        service = builder.build()
-
+        # Target: Should complete within 60 seconds for single ticker
         try:
-            start_time = time.time()
-            result = await service.scan_ticker("AAPL", lookback_days=7)
-            elapsed = time.time() - start_time
-
-            # Target: Should complete within 60 seconds for single ticker
-            assert elapsed < 60, f"Single ticker scan took {elapsed:.1f}s (target: <60s)"
-            assert result is not None
-            assert result.success is True
-        finally:
-            await service._collector.close()
+            result = await asyncio.wait_for(
+                scanner_service.scan_ticker("AAPL", lookback_days=7),
+                timeout=60.0,
+            )
+        except asyncio.TimeoutError:
+            pytest.fail("Single ticker scan exceeded 60s target")
+
+        assert result is not None
+        assert result.success is True
 
-    @pytest.mark.asyncio
     @pytest.mark.skip(reason="Requires multiple API calls, run manually")
-    async def test_batch_ticker_performance(self):
+    async def test_batch_ticker_performance(self, scanner_service):
         """Test that batch scan of 10 tickers completes within 3 minutes"""
-        from src.services.risk_scanner import RiskScannerBuilder
-
         tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "JPM", "V", "JNJ"]
-        builder = RiskScannerBuilder()
-        service = builder.build()
 
-        try:
-            start_time = time.time()
-            results = await service.scan_multiple(tickers, lookback_days=7)
-            elapsed = time.time() - start_time
+        start_time = time.time()
+        results = await scanner_service.scan_multiple(tickers, lookback_days=7)
+        elapsed = time.time() - start_time
 
-            # Target: ~3 minutes for 10 tickers
-            assert elapsed < 180, f"Batch scan took {elapsed:.1f}s (target: <180s)"
-            assert len(results) == len(tickers)
-        finally:
-            await service._collector.close()
+        # Target: ~3 minutes for 10 tickers
+        assert elapsed < 180, f"Batch scan took {elapsed:.1f}s (target: <180s)"
+        assert len(results) == len(tickers)
 
 
 class TestErrorHandling:
     """E2E tests for error handling"""
 
-    @pytest.mark.asyncio
     async def test_invalid_ticker_handling(self):
         """Test handling of invalid ticker symbols"""
-        from src.collectors.sec_collector import SECCollector
-
         collector = SECCollector()
 
         try:
@@ -188,50 +158,38 @@ class TestErrorHandling:
         finally:
             await collector.close()
 
-    @pytest.mark.asyncio
-    async def test_empty_filings_handling(self):
+    async def test_empty_filings_handling(self, scanner_service):
         """Test handling when no filings are found in lookback period"""
-        from src.services.risk_scanner import RiskScannerBuilder
-        from src.core.models import RiskLevel
+        # Use very short lookback to get empty results
+        result = await scanner_service.scan_ticker("AAPL", lookback_days=1)
 
-        builder = RiskScannerBuilder()
-        service = builder.build()
-
-        try:
-            # Use very short lookback to get empty results
-            result = await service.scan_ticker("AAPL", lookback_days=1)
-
-            # Should still return valid result
-            assert result is not None
-            assert result.success is True
-            report = result.report
-            assert 0 <= report.risk_score <= 100
-            assert report.risk_level in RiskLevel
-        finally:
-            await service._collector.close()
+        # Should still return valid result
+        assert result is not None
+        assert result.success is True
+        report = result.report
+        assert 0 <= report.risk_score <= 100
+        assert report.risk_level in RiskLevel
 
 
 class TestRetryBehavior:
     """E2E tests for retry behavior (rate limiting)"""
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_handling(self):
-        """Test that rate limiting works correctly"""
-        from src.collectors.sec_collector import SECCollector
+    async def test_rate_limit_handling(self, monkeypatch):
+        """Test that rate limiting sleeps between back-to-back requests"""
+        # Check the requested delays rather than waiting on the wall clock
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
 
         collector = SECCollector()
 
         try:
-            # Make multiple requests - rate limiter should prevent 429 errors
-            start_time = time.time()
-
             for i in range(3):
                 await collector._rate_limit()
 
-            elapsed = time.time() - start_time
-
-            # Should have delays between requests
-            # With 0.1s delay, 3 requests should take at least 0.2s
-            assert elapsed >= 0.1, "Rate limiting not applied"
+            # First request goes straight out, the next two are delayed
+            delay = collector._settings.sec.request_delay
+            assert sleep.await_count == 2, "Rate limiting not applied"
+            for call in sleep.await_args_list:
+                assert call.args[0] == pytest.approx(delay, abs=0.01)
         finally:
             await collector.close()
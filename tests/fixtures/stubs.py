@@ -0,0 +1,27 @@
+"""
+Lightweight async test doubles.
+
+Cheaper than AsyncMock for hot fixtures that only need a canned
+return value and a record of calls.
+"""
+
+from typing import Any, Optional
+
+
+class AsyncReturnStub:
+    """Awaitable callable returning a fixed value (or raising side_effect)"""
+
+    def __init__(self, return_value: Any = None, side_effect: Optional[BaseException] = None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.calls: list[tuple[tuple, dict]] = []
+
+    async def __call__(self, *args, **kwargs) -> Any:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
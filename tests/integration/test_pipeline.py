@@ -15,7 +15,6 @@ from src.formatters.json_formatter import JsonFormatter
 from src.core.models import (
     SECFilingData,
     Filing8K,
-    InsiderTransaction,
     AnalysisResult,
     RedFlag,
     InsiderPattern,
@@ -41,7 +40,7 @@ class TestSECCollectorIntegration:
         collector = SECCollector()
         assert collector._cik_cache == {}
 
-    def test_collector_caches_cik_lookups(self, mock_cik_response):
+    def test_collector_caches_cik_lookups(self):
         """Test that CIK lookups are cached after population"""
         collector = SECCollector()
 
@@ -52,6 +51,33 @@ class TestSECCollectorIntegration:
         assert collector._cik_cache["AAPL"] == "0000320193"
         assert collector._cik_cache["MSFT"] == "0000789019"
 
+    @pytest.mark.asyncio
+    async def test_cik_lookups_persisted_to_disk(self, mock_cik_response, tmp_path):
+        """Test that a fetched CIK map is written to and reused from disk"""
+        from dataclasses import replace
+        from src.config.settings import Settings
+
+        settings = Settings()
+        cache_file = tmp_path / "ciks.json"
+        settings = replace(settings, sec=replace(settings.sec, cik_cache_path=str(cache_file)))
+
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = mock_cik_response
+        collector = SECCollector(settings=settings)
+        collector._client = AsyncMock()
+        collector._client.get.return_value = response
+        collector._rate_limit = AsyncMock()
+
+        assert await collector._get_cik("AAPL") == "0000320193"
+        assert cache_file.exists()
+
+        # A fresh collector resolves from the file without any request
+        fresh = SECCollector(settings=settings)
+        fresh._client = AsyncMock()
+        assert await fresh._get_cik("MSFT") == "0000789019"
+        fresh._client.get.assert_not_called()
+
 
 class TestLLMAnalyzerIntegration:
     """Integration tests for LLM Analyzer with caching and retry"""
@@ -78,78 +104,72 @@ class TestLLMAnalyzerIntegration:
             error=None,
         )
 
-    def test_cache_ttl_expiration(self):
+    @pytest.fixture
+    def analyzer(self):
+        """Analyzer with the API key patched into the environment"""
+        with patch.dict('os.environ', {'GROQ_API_KEY': 'test-key'}):
+            yield GroqLLMAnalyzer(api_key='test-key')
+
+    def test_cache_ttl_expiration(self, analyzer):
         """Test that cache entries expire after TTL"""
         import time
 
-        with patch.dict('os.environ', {'GROQ_API_KEY': 'test-key'}):
-            analyzer = GroqLLMAnalyzer(api_key='test-key')
-
-            # Manually set cache with old timestamp
-            old_timestamp = time.time() - (25 * 60 * 60)  # 25 hours ago
-            cache_key = "test_key"
-            analyzer._cache[cache_key] = ({"test": "data"}, old_timestamp)
+        # Manually set cache with old timestamp
+        old_timestamp = time.time() - (25 * 60 * 60)  # 25 hours ago
+        cache_key = "test_key"
+        analyzer._cache[cache_key] = ({"test": "data"}, old_timestamp)
 
-            # Should return None (expired)
-            result = analyzer._get_from_cache(cache_key)
-            assert result is None
+        # Should return None (expired)
+        result = analyzer._get_from_cache(cache_key)
+        assert result is None
 
-            # Cache entry should be removed
-            assert cache_key not in analyzer._cache
+        # Cache entry should be removed
+        assert cache_key not in analyzer._cache
 
-    def test_cache_valid_entry(self):
+    def test_cache_valid_entry(self, analyzer):
         """Test that valid cache entries are returned"""
         import time
 
-        with patch.dict('os.environ', {'GROQ_API_KEY': 'test-key'}):
-            analyzer = GroqLLMAnalyzer(api_key='test-key')
-
-            # Set cache with recent timestamp
-            cache_key = "test_key"
-            test_data = {"test": "data"}
-            analyzer._set_cache(cache_key, test_data)
+        # Set cache with recent timestamp
+        cache_key = "test_key"
+        test_data = {"test": "data"}
+        analyzer._set_cache(cache_key, test_data)
 
-            # Should return cached data
-            result = analyzer._get_from_cache(cache_key)
-            assert result == test_data
+        # Should return cached data
+        result = analyzer._get_from_cache(cache_key)
+        assert result == test_data
 
-    def test_explanation_validation(self):
+    def test_explanation_validation(self, analyzer):
         """Test explanation validation logic"""
-        with patch.dict('os.environ', {'GROQ_API_KEY': 'test-key'}):
-            analyzer = GroqLLMAnalyzer(api_key='test-key')
-
-            # Valid explanation
-            valid = "AAPL shows moderate risk with some concerning insider activity patterns observed."
-            assert analyzer._validate_explanation(valid, "AAPL") is True
+        # Valid explanation
+        valid = "AAPL shows moderate risk with some concerning insider activity patterns observed."
+        assert analyzer._validate_explanation(valid, "AAPL") is True
 
-            # Too short
-            short = "AAPL risk."
-            assert analyzer._validate_explanation(short, "AAPL") is False
+        # Too short
+        short = "AAPL risk."
+        assert analyzer._validate_explanation(short, "AAPL") is False
 
-            # Missing ticker
-            no_ticker = "This stock shows moderate risk with concerning patterns."
-            assert analyzer._validate_explanation(no_ticker, "AAPL") is False
+        # Missing ticker
+        no_ticker = "This stock shows moderate risk with concerning patterns."
+        assert analyzer._validate_explanation(no_ticker, "AAPL") is False
 
-            # Contains financial advice
-            advice = "AAPL shows risk. You should sell this stock immediately for best results."
-            assert analyzer._validate_explanation(advice, "AAPL") is False
+        # Contains financial advice
+        advice = "AAPL shows risk. You should sell this stock immediately for best results."
+        assert analyzer._validate_explanation(advice, "AAPL") is False
 
-    def test_explanation_post_processing(self):
+    def test_explanation_post_processing(self, analyzer):
         """Test explanation post-processing"""
-        with patch.dict('os.environ', {'GROQ_API_KEY': 'test-key'}):
-            analyzer = GroqLLMAnalyzer(api_key='test-key')
-
-            # Remove markdown
-            markdown = "**AAPL** shows *moderate* risk with `code`"
-            result = analyzer._post_process_explanation(markdown)
-            assert "**" not in result
-            assert "*" not in result
-            assert "`" not in result
+        # Remove markdown
+        markdown = "**AAPL** shows *moderate* risk with `code`"
+        result = analyzer._post_process_explanation(markdown)
+        assert "**" not in result
+        assert "*" not in result
+        assert "`" not in result
 
-            # Ensure ends with period
-            no_period = "AAPL shows moderate risk"
-            result = analyzer._post_process_explanation(no_period)
-            assert result.endswith(".")
+        # Ensure ends with period
+        no_period = "AAPL shows moderate risk"
+        result = analyzer._post_process_explanation(no_period)
+        assert result.endswith(".")
 
 
 class TestCategoryScorerIntegration:
@@ -227,13 +247,13 @@ class TestCategoryScorerIntegration:
 class TestRuleBasedScorerIntegration:
     """Integration tests for rule-based scoring with category scoring"""
 
-    def test_scorer_with_category_scoring_enabled(self, sample_analysis_result):
+    def test_scorer_with_category_scoring_enabled(self):
         """Test scorer with category-based scoring enabled"""
         scorer = RuleBasedScorer(use_category_scoring=True)
         assert scorer._category_scorer is not None
         assert "Category-weighted" in scorer.get_scoring_method()
 
-    def test_scorer_with_category_scoring_disabled(self, sample_analysis_result):
+    def test_scorer_with_category_scoring_disabled(self):
         """Test scorer with category-based scoring disabled"""
         scorer = RuleBasedScorer(use_category_scoring=False)
         assert scorer._category_scorer is None
@@ -252,7 +272,7 @@ class TestRuleBasedScorerIntegration:
 class TestFullPipelineIntegration:
     """End-to-end integration tests for the full pipeline"""
 
-    def test_pipeline_with_empty_data(self, empty_sec_data, empty_analysis_result):
+    def test_pipeline_with_empty_data(self, empty_analysis_result):
         """Test pipeline handles empty data gracefully"""
         scorer = RuleBasedScorer(use_category_scoring=False)
         result = scorer.score(empty_analysis_result)
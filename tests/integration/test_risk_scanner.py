@@ -2,13 +2,21 @@
 Integration tests for RiskScannerService.
 
 Tests the orchestration service with mocked dependencies.
+
+Parallel: pytest -n auto --dist=loadgroup  (requires pytest-xdist)
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
 from src.services.risk_scanner import RiskScannerService, RiskScannerBuilder
+from src.collectors.sec_collector import SECCollector
+from src.core.interfaces import BaseAnalyzer, BaseScorer
+from src.formatters.webhook_formatter import WebhookFormatter
+from src.core.exceptions import CollectorError
+from tests.fixtures.stubs import AsyncReturnStub
 from src.core.models import (
     SECFilingData,
     Filing8K,
@@ -24,91 +32,155 @@ from src.core.models import (
 )
 
 
+# Frozen payloads shared by every test; the mocks just return them
+_COLLECTED_AT = datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+_NEUTRAL_INSIDER_SUMMARY = InsiderSummary(
+    net_activity="neutral",
+    total_sold=0,
+    total_bought=0,
+    insiders_selling=0,
+    insiders_buying=0,
+)
+
+_SEC_DATA = SECFilingData(
+    ticker="TEST",
+    cik="0001234567",
+    filings_8k=(
+        Filing8K(
+            date="2025-01-15",
+            form_type="8-K",
+            title="Current Report",
+            url="https://sec.gov/test/8k",
+            content_snippet="Executive departure announced...",
+            items=("5.02 - Departure/Appointment of Directors or Officers",),
+        ),
+    ),
+    filings_form4=(
+        InsiderTransaction(
+            date="2025-01-14",
+            insider_name="John Smith",
+            insider_title="CFO",
+            is_director=False,
+            is_officer=True,
+            transaction_type="S",
+            shares=50000,
+            price=150.00,
+            total_value=7500000,
+            url="https://sec.gov/test/form4",
+        ),
+    ),
+    collected_at=_COLLECTED_AT,
+    lookback_days=30,
+    error=None,
+)
+
+_ANALYSIS_RESULT = AnalysisResult(
+    red_flags=(
+        RedFlag(
+            type="EXECUTIVE_DEPARTURE",
+            title="CFO Resignation",
+            severity=Severity.HIGH,
+            details="CFO resigned effective immediately",
+            evidence_url="https://sec.gov/test/8k",
+            filing_date="2025-01-15",
+        ),
+    ),
+    insider_patterns=(
+        InsiderPattern(
+            type="LARGE_SALE",
+            title="CFO Sold $7.5M",
+            severity=Severity.HIGH,
+            details="CFO sold 50,000 shares before resignation",
+            evidence_url="https://sec.gov/test/form4",
+        ),
+    ),
+    insider_summary=InsiderSummary(
+        net_activity="net_selling",
+        total_sold=7500000,
+        total_bought=0,
+        insiders_selling=1,
+        insiders_buying=0,
+    ),
+    risk_score=65,
+    risk_level=RiskLevel.ELEVATED,
+    reasoning="Executive departure with preceding insider selling",
+    explanation="TEST shows elevated risk due to CFO departure and significant insider selling.",
+)
+
+_EMPTY_SEC_DATA = SECFilingData(
+    ticker="EMPTY",
+    cik="0009999999",
+    filings_8k=(),
+    filings_form4=(),
+    collected_at=_COLLECTED_AT,
+    lookback_days=30,
+    error=None,
+)
+
+_EMPTY_ANALYSIS_RESULT = AnalysisResult(
+    red_flags=(),
+    insider_patterns=(),
+    insider_summary=_NEUTRAL_INSIDER_SUMMARY,
+    risk_score=10,
+    risk_level=RiskLevel.LOW,
+    reasoning="No filings found",
+    explanation="No SEC filings in the lookback period.",
+)
+
+_LOW_SCORING_RESULT = ScoringResult(
+    risk_score=10,
+    risk_level=RiskLevel.LOW,
+    base_score=10,
+    adjustments=0,
+    adjustment_reasons=(),
+)
+
+_MULTI_SCAN_REPORT = RiskReport(
+    ticker="TEST",
+    risk_score=50,
+    risk_level=RiskLevel.ELEVATED,
+    red_flags=(),
+    red_flags_count=0,
+    insider_patterns=(),
+    insider_summary=_NEUTRAL_INSIDER_SUMMARY,
+    explanation="Test",
+    reasoning="Test",
+    evidence_links=(),
+    filings_analyzed={},
+    scoring_details={},
+    analyzed_at=_COLLECTED_AT,
+    lookback_days=30,
+)
+
+
+# Independent async tests share one event loop instead of one per test
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("scanner_integration")
 class TestRiskScannerService:
     """Integration tests for RiskScannerService"""
 
     @pytest.fixture
     def mock_collector(self):
         """Mock SEC collector"""
-        collector = AsyncMock()
-        collector.collect.return_value = SECFilingData(
-            ticker="TEST",
-            cik="0001234567",
-            filings_8k=(
-                Filing8K(
-                    date="2025-01-15",
-                    form_type="8-K",
-                    title="Current Report",
-                    url="https://sec.gov/test/8k",
-                    content_snippet="Executive departure announced...",
-                    items=("5.02 - Departure/Appointment of Directors or Officers",),
-                ),
-            ),
-            filings_form4=(
-                InsiderTransaction(
-                    date="2025-01-14",
-                    insider_name="John Smith",
-                    insider_title="CFO",
-                    is_director=False,
-                    is_officer=True,
-                    transaction_type="S",
-                    shares=50000,
-                    price=150.00,
-                    total_value=7500000,
-                    url="https://sec.gov/test/form4",
-                ),
-            ),
-            collected_at=datetime.now(timezone.utc),
-            lookback_days=30,
-            error=None,
-        )
-        collector.health_check.return_value = True
-        collector.close = AsyncMock()
+        collector = MagicMock(spec=SECCollector)
+        collector.collect = AsyncReturnStub(_SEC_DATA)
+        collector.health_check = AsyncReturnStub(True)
         return collector
 
     @pytest.fixture
     def mock_analyzer(self):
         """Mock LLM analyzer"""
-        analyzer = AsyncMock()
-        analyzer.analyze.return_value = AnalysisResult(
-            red_flags=(
-                RedFlag(
-                    type="EXECUTIVE_DEPARTURE",
-                    title="CFO Resignation",
-                    severity=Severity.HIGH,
-                    details="CFO resigned effective immediately",
-                    evidence_url="https://sec.gov/test/8k",
-                    filing_date="2025-01-15",
-                ),
-            ),
-            insider_patterns=(
-                InsiderPattern(
-                    type="LARGE_SALE",
-                    title="CFO Sold $7.5M",
-                    severity=Severity.HIGH,
-                    details="CFO sold 50,000 shares before resignation",
-                    evidence_url="https://sec.gov/test/form4",
-                ),
-            ),
-            insider_summary=InsiderSummary(
-                net_activity="net_selling",
-                total_sold=7500000,
-                total_bought=0,
-                insiders_selling=1,
-                insiders_buying=0,
-            ),
-            risk_score=65,
-            risk_level=RiskLevel.ELEVATED,
-            reasoning="Executive departure with preceding insider selling",
-            explanation="TEST shows elevated risk due to CFO departure and significant insider selling.",
-        )
+        analyzer = MagicMock(spec=BaseAnalyzer)
+        analyzer.analyze = AsyncReturnStub(_ANALYSIS_RESULT)
+        analyzer.explain = AsyncReturnStub(None)
         analyzer.get_provider_name.return_value = "Groq (llama-3.3-70b-versatile)"
         return analyzer
 
     @pytest.fixture
     def mock_scorer(self):
         """Mock scorer"""
-        scorer = MagicMock()
+        scorer = MagicMock(spec=BaseScorer)
         scorer.score.return_value = ScoringResult(
             risk_score=70,
             risk_level=RiskLevel.HIGH,
@@ -119,98 +191,67 @@ class TestRiskScannerService:
         scorer.get_scoring_method.return_value = "Category-weighted scoring with rule adjustments"
         return scorer
 
-    @pytest.mark.asyncio
     async def test_scan_single_ticker(self, mock_collector, mock_analyzer, mock_scorer):
         """Test scanning a single ticker"""
-        # Mock the formatter to return a proper RiskReport
-        mock_formatter = MagicMock()
-        mock_formatter.format.return_value = RiskReport(
-            ticker="TEST",
-            risk_score=70,
-            risk_level=RiskLevel.HIGH,
-            red_flags=(
-                RedFlag(
-                    type="EXECUTIVE_DEPARTURE",
-                    title="CFO Resignation",
-                    severity=Severity.HIGH,
-                    details="CFO resigned",
-                ),
-            ),
-            red_flags_count=1,
-            insider_patterns=(
-                InsiderPattern(
-                    type="LARGE_SALE",
-                    title="CFO Sold $7.5M",
-                    severity=Severity.HIGH,
-                    details="CFO sold shares",
-                ),
-            ),
-            insider_summary=InsiderSummary(
-                net_activity="net_selling",
-                total_sold=7500000,
-                total_bought=0,
-                insiders_selling=1,
-                insiders_buying=0,
-            ),
-            explanation="Test explanation",
-            reasoning="Test reasoning",
-            evidence_links=("https://sec.gov/test",),
-            filings_analyzed={"8k_count": 1, "form4_count": 1},
-            scoring_details={},
-            analyzed_at=datetime.now(timezone.utc),
-            lookback_days=30,
-        )
-
         service = RiskScannerService(
             collector=mock_collector,
             analyzer=mock_analyzer,
             scorer=mock_scorer,
         )
-        service._formatter = mock_formatter
 
         result = await service.scan_ticker("TEST", lookback_days=30)
 
-        assert result is not None
         assert result.success is True
         assert result.ticker == "TEST"
         assert result.report.risk_score == 70
         assert result.report.risk_level == RiskLevel.HIGH
 
-        # Verify collector was called
-        mock_collector.collect.assert_called_once_with("TEST", 30)
+        # Each stage runs once
+        assert mock_collector.collect.calls == [(("TEST", 30), {})]
+        assert mock_analyzer.analyze.call_count == 1
+        mock_scorer.score.assert_called_once()
 
-        # Verify analyzer was called
-        mock_analyzer.analyze.assert_called_once()
+    async def test_scan_handles_collector_error(self, mock_analyzer, mock_scorer):
+        """Test that service handles collector errors gracefully"""
+        collector = MagicMock(spec=SECCollector)
+        collector.collect = AsyncReturnStub(side_effect=CollectorError("Network error"))
 
-        # Verify scorer was called
-        mock_scorer.score.assert_called_once()
+        service = RiskScannerService(
+            collector=collector,
+            analyzer=mock_analyzer,
+            scorer=mock_scorer,
+        )
+
+        result = await service.scan_ticker("TEST", lookback_days=30)
+
+        # Should return ScanResult with error, without analyzing
+        assert result.success is False
+        assert result.report is None
+        assert "Collection failed" in result.error
+        assert mock_analyzer.analyze.call_count == 0
+
+    async def test_scan_with_empty_filings(self, mock_analyzer, mock_scorer):
+        """Test scanning when no filings are found"""
+        collector = MagicMock(spec=SECCollector)
+        collector.collect = AsyncReturnStub(_EMPTY_SEC_DATA)
+        mock_analyzer.analyze.return_value = _EMPTY_ANALYSIS_RESULT
+        mock_scorer.score.return_value = _LOW_SCORING_RESULT
+
+        service = RiskScannerService(
+            collector=collector,
+            analyzer=mock_analyzer,
+            scorer=mock_scorer,
+        )
+
+        result = await service.scan_ticker("EMPTY", lookback_days=30)
+
+        assert result.success is True
+        assert result.report.risk_level == RiskLevel.LOW
+        assert len(result.report.red_flags) == 0
 
-    @pytest.mark.asyncio
     async def test_scan_multiple_tickers(self, mock_collector, mock_analyzer, mock_scorer):
         """Test scanning multiple tickers"""
-        mock_formatter = MagicMock()
-        mock_formatter.format.return_value = RiskReport(
-            ticker="TEST",
-            risk_score=50,
-            risk_level=RiskLevel.ELEVATED,
-            red_flags=tuple(),
-            red_flags_count=0,
-            insider_patterns=tuple(),
-            insider_summary=InsiderSummary(
-                net_activity="neutral",
-                total_sold=0,
-                total_bought=0,
-                insiders_selling=0,
-                insiders_buying=0,
-            ),
-            explanation="Test",
-            reasoning="Test",
-            evidence_links=tuple(),
-            filings_analyzed={},
-            scoring_details={},
-            analyzed_at=datetime.now(timezone.utc),
-            lookback_days=30,
-        )
+        mock_formatter = SimpleNamespace(format=lambda *args, **kwargs: _MULTI_SCAN_REPORT)
 
         service = RiskScannerService(
             collector=mock_collector,
@@ -224,91 +265,39 @@ class TestRiskScannerService:
         assert len(results) == 3
         assert mock_collector.collect.call_count == 3
 
-    @pytest.mark.asyncio
-    async def test_scan_handles_collector_error(self, mock_analyzer, mock_scorer):
-        """Test that service handles collector errors gracefully"""
-        from src.core.exceptions import CollectorError
-
-        mock_collector = AsyncMock()
-        mock_collector.collect.side_effect = CollectorError("Network error")
-        mock_collector.close = AsyncMock()
+    async def test_iter_scan_multiple_streams_in_order(self, mock_collector, mock_analyzer, mock_scorer):
+        """Results are yielded one at a time, in input order, and summarize from a one-shot iterator"""
+        mock_formatter = SimpleNamespace(format=lambda *args, **kwargs: _MULTI_SCAN_REPORT)
 
         service = RiskScannerService(
             collector=mock_collector,
             analyzer=mock_analyzer,
             scorer=mock_scorer,
         )
+        service._formatter = mock_formatter
 
-        result = await service.scan_ticker("TEST", lookback_days=30)
+        tickers = ["AAPL", "MSFT", "GOOGL"]
+        results = []
+        async for result in service.iter_scan_multiple(tickers, lookback_days=30):
+            # Each ticker is scanned only when the previous result has been consumed
+            assert mock_collector.collect.call_count == len(results) + 1
+            results.append(result)
 
-        # Should return ScanResult with error
-        assert result is not None
-        assert result.success is False
-        assert result.error is not None
-        assert "Collection failed" in result.error
+        assert [r.ticker for r in results] == tickers
 
-    @pytest.mark.asyncio
-    async def test_scan_with_empty_filings(self, mock_analyzer, mock_scorer):
-        """Test scanning when no filings are found"""
-        mock_collector = AsyncMock()
-        mock_collector.collect.return_value = SECFilingData(
-            ticker="EMPTY",
-            cik="0009999999",
-            filings_8k=tuple(),
-            filings_form4=tuple(),
-            collected_at=datetime.now(timezone.utc),
-            lookback_days=30,
-            error=None,
-        )
-        mock_collector.close = AsyncMock()
-
-        # Adjust analyzer mock for empty data
-        mock_analyzer.analyze.return_value = AnalysisResult(
-            red_flags=tuple(),
-            insider_patterns=tuple(),
-            insider_summary=InsiderSummary(
-                net_activity="neutral",
-                total_sold=0,
-                total_bought=0,
-                insiders_selling=0,
-                insiders_buying=0,
-            ),
-            risk_score=10,
-            risk_level=RiskLevel.LOW,
-            reasoning="No filings found",
-            explanation="No SEC filings in the lookback period.",
-        )
+        summary = service.get_summary(r for r in results)
+
+        assert summary["total"] == 3
+        assert summary["elevated_tickers"] == tickers
 
+    async def test_explanation_deferred_for_low_risk(self, mock_collector, mock_analyzer, mock_scorer):
+        """Test that explanations are only generated for elevated-or-higher scores"""
         mock_scorer.score.return_value = ScoringResult(
-            risk_score=10,
+            risk_score=20,
             risk_level=RiskLevel.LOW,
-            base_score=10,
+            base_score=20,
             adjustments=0,
-            adjustment_reasons=tuple(),
-        )
-
-        mock_formatter = MagicMock()
-        mock_formatter.format.return_value = RiskReport(
-            ticker="EMPTY",
-            risk_score=10,
-            risk_level=RiskLevel.LOW,
-            red_flags=tuple(),
-            red_flags_count=0,
-            insider_patterns=tuple(),
-            insider_summary=InsiderSummary(
-                net_activity="neutral",
-                total_sold=0,
-                total_bought=0,
-                insiders_selling=0,
-                insiders_buying=0,
-            ),
-            explanation="No filings",
-            reasoning="No filings",
-            evidence_links=tuple(),
-            filings_analyzed={},
-            scoring_details={},
-            analyzed_at=datetime.now(timezone.utc),
-            lookback_days=30,
+            adjustment_reasons=(),
         )
 
         service = RiskScannerService(
@@ -316,14 +305,27 @@ class TestRiskScannerService:
             analyzer=mock_analyzer,
             scorer=mock_scorer,
         )
-        service._formatter = mock_formatter
 
-        result = await service.scan_ticker("EMPTY", lookback_days=30)
+        result = await service.scan_ticker("TEST", lookback_days=30)
 
-        assert result is not None
         assert result.success is True
-        assert result.report.risk_level == RiskLevel.LOW
-        assert len(result.report.red_flags) == 0
+        assert mock_analyzer.analyze.calls == [((_SEC_DATA, False), {})]
+        assert mock_analyzer.explain.call_count == 0
+
+        # High scores get an explanation after scoring
+        mock_scorer.score.return_value = ScoringResult(
+            risk_score=70,
+            risk_level=RiskLevel.HIGH,
+            base_score=65,
+            adjustments=5,
+            adjustment_reasons=(),
+        )
+        mock_analyzer.explain.return_value = "TEST shows high risk."
+
+        result = await service.scan_ticker("TEST", lookback_days=30)
+
+        assert mock_analyzer.explain.call_count == 1
+        assert result.report.explanation == "TEST shows high risk."
 
 
 class TestRiskScannerBuilder:
@@ -338,9 +340,9 @@ class TestRiskScannerBuilder:
 
     def test_builder_custom_components(self):
         """Test that builder accepts custom components"""
-        mock_collector = AsyncMock()
-        mock_analyzer = AsyncMock()
-        mock_scorer = MagicMock()
+        mock_collector = AsyncMock(spec=SECCollector)
+        mock_analyzer = AsyncMock(spec=BaseAnalyzer)
+        mock_scorer = MagicMock(spec=BaseScorer)
 
         builder = RiskScannerBuilder()
         builder = builder.with_collector(mock_collector)
@@ -354,13 +356,14 @@ class TestRiskScannerBuilder:
         assert service._scorer is mock_scorer
 
 
+@pytest.mark.xdist_group("webhook_integration")
 class TestWebhookIntegration:
     """Integration tests for webhook functionality"""
 
     @pytest.fixture
-    def high_risk_report(self):
+    def high_risk_report(self, make_risk_report):
         """High risk report that should trigger webhook"""
-        return RiskReport(
+        return make_risk_report(
             ticker="RISK",
             risk_score=85,
             risk_level=RiskLevel.HIGH,
@@ -373,21 +376,6 @@ class TestWebhookIntegration:
                 ),
             ),
             red_flags_count=1,
-            insider_patterns=tuple(),
-            insider_summary=InsiderSummary(
-                net_activity="neutral",
-                total_sold=0,
-                total_bought=0,
-                insiders_selling=0,
-                insiders_buying=0,
-            ),
-            explanation="High risk detected",
-            reasoning="Auditor change is a critical signal",
-            evidence_links=("https://sec.gov/test",),
-            filings_analyzed={"8k_count": 1, "form4_count": 0},
-            scoring_details={},
-            analyzed_at=datetime.now(timezone.utc),
-            lookback_days=30,
         )
 
     def test_webhook_threshold_check(self, high_risk_report):
@@ -397,8 +385,6 @@ class TestWebhookIntegration:
 
     def test_webhook_payload_format(self, high_risk_report):
         """Test webhook payload can be generated"""
-        from src.formatters.webhook_formatter import WebhookFormatter
-
         formatter = WebhookFormatter()
         payload = formatter.format_generic_payload(high_risk_report)
 
@@ -0,0 +1,23 @@
+"""
+Shared fixtures for unit tests
+"""
+
+import pytest
+
+from src.collectors.sec_collector import SECCollector
+from src.config.settings import SECSettings, Settings
+
+
+@pytest.fixture
+def collector():
+    """
+    Fresh SECCollector for each test.
+
+    Built from plain test settings rather than a patched get_settings, so
+    the collector's settings reads are ordinary attribute lookups. A new
+    instance per test keeps the CIK cache, rate-limit clock and HTTP
+    client from carrying over between tests.
+    """
+    return SECCollector(
+        settings=Settings(sec=SECSettings(user_agent="Test/1.0", request_delay=0.01))
+    )
@@ -0,0 +1,55 @@
+"""
+Tests for FilingCheckCache
+"""
+
+from unittest.mock import patch
+
+from src.services.filing_check_cache import FilingCheckCache
+
+
+class TestFilingCheckCache:
+    """Tests for FilingCheckCache"""
+
+    def test_miss_returns_none(self):
+        """Unknown checks are cache misses"""
+        cache = FilingCheckCache()
+        assert cache.get("AAPL", "8-K", "2024-01-10") is None
+
+    def test_put_then_get(self):
+        """Recorded results are returned for the same key only"""
+        cache = FilingCheckCache()
+        cache.put("AAPL", "8-K", "2024-01-10", False)
+
+        assert cache.get("AAPL", "8-K", "2024-01-10") is False
+        assert cache.get("AAPL", "4", "2024-01-10") is None
+        assert cache.get("AAPL", "8-K", "2024-02-01") is None
+
+    def test_expired_entry_is_miss(self):
+        """Entries older than the TTL are ignored"""
+        cache = FilingCheckCache(ttl_seconds=60)
+        with patch("src.services.filing_check_cache.time.time", return_value=1000.0):
+            cache.put("AAPL", "8-K", "2024-01-10", False)
+        with patch("src.services.filing_check_cache.time.time", return_value=1061.0):
+            assert cache.get("AAPL", "8-K", "2024-01-10") is None
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Entries survive a save/load cycle through the cache file"""
+        path = str(tmp_path / "filing_checks.json")
+        cache = FilingCheckCache(path=path)
+        cache.put("AAPL", "4", "2024-01-12", True)
+        cache.save()
+
+        reloaded = FilingCheckCache(path=path)
+        reloaded.load()
+
+        assert reloaded.get("AAPL", "4", "2024-01-12") is True
+
+    def test_unreadable_file_ignored(self, tmp_path):
+        """A corrupt cache file loads as empty"""
+        path = tmp_path / "filing_checks.json"
+        path.write_text("not json")
+
+        cache = FilingCheckCache(path=str(path))
+        cache.load()
+
+        assert cache.get("AAPL", "8-K", "2024-01-10") is None
@@ -2,12 +2,56 @@
 Tests for formatters module
 """
 
-import pytest
+import re
+from datetime import datetime, timezone
 
 from src.formatters.json_formatter import JsonFormatter
 from src.formatters.markdown_formatter import MarkdownFormatter
 from src.formatters.webhook_formatter import WebhookFormatter
-from src.core.models import RiskLevel
+from src.core.models import InsiderSummary, RiskLevel, RiskReport
+
+
+# Fixed timestamp for reports whose analyzed_at is not under test
+_NOW = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+# Expected Markdown report sections, in order, matched in one pass
+_MD_STRUCTURE_RE = re.compile(
+    r"# Risk Report: TEST.*?Risk Score: 70/100.*?HIGH.*?## Red Flags Detected.*?## Insider Activity",
+    re.DOTALL,
+)
+
+# Formatters are stateless, so one instance serves every test
+_JSON = JsonFormatter()
+_MD = MarkdownFormatter()
+_WEBHOOK = WebhookFormatter()
+
+_NEUTRAL_INSIDER_SUMMARY = InsiderSummary(
+    net_activity="neutral",
+    total_sold=0,
+    total_bought=0,
+    insiders_selling=0,
+    insiders_buying=0,
+)
+
+
+def _minimal_report(ticker: str, score: int) -> RiskReport:
+    """Report with only the fields summary tables read; the rest are shared empties"""
+    return RiskReport(
+        ticker=ticker,
+        risk_score=score,
+        risk_level=RiskLevel.from_score(score),
+        red_flags=(),
+        red_flags_count=0,
+        insider_patterns=(),
+        insider_summary=_NEUTRAL_INSIDER_SUMMARY,
+        explanation=None,
+        reasoning="Test",
+        evidence_links=(),
+        filings_analyzed={},
+        scoring_details={},
+        analyzed_at=_NOW,
+        lookback_days=30,
+    )
 
 
 class TestJsonFormatter:
@@ -15,7 +59,7 @@ class TestJsonFormatter:
 
     def test_format_creates_report(self, sample_sec_data, sample_analysis_result, sample_scoring_result):
         """Should create RiskReport from components"""
-        formatter = JsonFormatter()
+        formatter = _JSON
         report = formatter.format(
             "TEST",
             sample_sec_data,
@@ -29,7 +73,7 @@ class TestJsonFormatter:
 
     def test_to_dict_serialization(self, sample_risk_report):
         """Should serialize report to dictionary"""
-        formatter = JsonFormatter()
+        formatter = _JSON
         result = formatter.to_dict(sample_risk_report)
 
         assert result["ticker"] == "TEST"
@@ -40,7 +84,7 @@ class TestJsonFormatter:
 
     def test_evidence_links_collected(self, sample_sec_data, sample_analysis_result, sample_scoring_result):
         """Should collect evidence links from all sources"""
-        formatter = JsonFormatter()
+        formatter = _JSON
         report = formatter.format(
             "TEST",
             sample_sec_data,
@@ -52,7 +96,7 @@ class TestJsonFormatter:
 
     def test_get_format_type(self):
         """Should return JSON"""
-        formatter = JsonFormatter()
+        formatter = _JSON
         assert formatter.get_format_type() == "JSON"
 
 
@@ -61,100 +105,52 @@ class TestMarkdownFormatter:
 
     def test_format_report_structure(self, sample_risk_report):
         """Should create markdown with expected sections"""
-        formatter = MarkdownFormatter()
+        formatter = _MD
         markdown = formatter.format_report(sample_risk_report)
 
-        assert "# Risk Report: TEST" in markdown
-        assert "Risk Score: 70/100" in markdown
-        assert "HIGH" in markdown
-        assert "## Red Flags Detected" in markdown
-        assert "## Insider Activity" in markdown
+        assert _MD_STRUCTURE_RE.search(markdown) is not None
 
-    def test_format_report_no_red_flags(self, sample_risk_report):
+    def test_format_report_no_red_flags(self, make_risk_report):
         """Should skip red flags section when empty"""
-        from src.core.models import RiskReport, InsiderSummary
-        from datetime import datetime, timezone
-
-        empty_flags_report = RiskReport(
+        empty_flags_report = make_risk_report(
             ticker="EMPTY",
             risk_score=10,
             risk_level=RiskLevel.LOW,
-            red_flags=tuple(),
+            red_flags=(),
             red_flags_count=0,
-            insider_patterns=tuple(),
-            insider_summary=InsiderSummary(
-                net_activity="neutral",
-                total_sold=0,
-                total_bought=0,
-                insiders_selling=0,
-                insiders_buying=0,
-            ),
-            explanation=None,
-            reasoning="No signals",
-            evidence_links=tuple(),
-            filings_analyzed={"8k_count": 0, "form4_count": 0},
-            scoring_details={},
-            analyzed_at=datetime.now(timezone.utc),
-            lookback_days=30,
         )
 
-        formatter = MarkdownFormatter()
+        formatter = _MD
         markdown = formatter.format_report(empty_flags_report)
 
         assert "## Red Flags Detected" not in markdown
 
     def test_format_summary_table(self, sample_risk_report):
         """Should create summary table"""
-        formatter = MarkdownFormatter()
-        table = formatter.format_summary_table([sample_risk_report])
+        table = _MD.format_summary_table([sample_risk_report])
 
         assert "| Ticker |" in table
         assert "| TEST |" in table
 
     def test_format_summary_table_sorted(self):
         """Should sort by risk score descending"""
-        from src.core.models import RiskReport, InsiderSummary
-        from datetime import datetime, timezone
-
-        def make_report(ticker: str, score: int) -> RiskReport:
-            return RiskReport(
-                ticker=ticker,
-                risk_score=score,
-                risk_level=RiskLevel.from_score(score),
-                red_flags=tuple(),
-                red_flags_count=0,
-                insider_patterns=tuple(),
-                insider_summary=InsiderSummary(
-                    net_activity="neutral",
-                    total_sold=0,
-                    total_bought=0,
-                    insiders_selling=0,
-                    insiders_buying=0,
-                ),
-                explanation=None,
-                reasoning="Test",
-                evidence_links=tuple(),
-                filings_analyzed={},
-                scoring_details={},
-                analyzed_at=datetime.now(timezone.utc),
-                lookback_days=30,
-            )
-
         reports = [
-            make_report("LOW", 20),
-            make_report("HIGH", 80),
-            make_report("MED", 50),
+            _minimal_report("LOW", 20),
+            _minimal_report("HIGH", 80),
+            _minimal_report("MED", 50),
         ]
 
-        formatter = MarkdownFormatter()
-        table = formatter.format_summary_table(reports)
+        table = _MD.format_summary_table(reports)
 
         lines = table.split("\n")
-        data_lines = [l for l in lines if l.startswith("| ") and "Ticker" not in l and "---" not in l]
+        data_lines = (l for l in lines if l.startswith("| ") and "Ticker" not in l and "---" not in l)
 
-        # HIGH should come first
-        assert "HIGH" in data_lines[0]
-        assert "LOW" in data_lines[-1]
+        # HIGH should come first, LOW last; single pass, no intermediate list
+        first = last = next(data_lines)
+        for last in data_lines:
+            pass
+        assert "HIGH" in first
+        assert "LOW" in last
 
 
 class TestWebhookFormatter:
@@ -162,7 +158,7 @@ class TestWebhookFormatter:
 
     def test_format_generic_payload(self, sample_risk_report):
         """Should create generic webhook payload"""
-        formatter = WebhookFormatter()
+        formatter = _WEBHOOK
         payload = formatter.format_generic_payload(sample_risk_report)
 
         assert payload["alert_type"] == "risk_signal"
@@ -172,7 +168,7 @@ class TestWebhookFormatter:
 
     def test_format_discord_embed(self, sample_risk_report):
         """Should create Discord embed structure"""
-        formatter = WebhookFormatter()
+        formatter = _WEBHOOK
         payload = formatter.format_discord_embed(sample_risk_report)
 
         assert "embeds" in payload
@@ -182,7 +178,7 @@ class TestWebhookFormatter:
 
     def test_format_slack_blocks(self, sample_risk_report):
         """Should create Slack blocks structure"""
-        formatter = WebhookFormatter()
+        formatter = _WEBHOOK
         payload = formatter.format_slack_blocks(sample_risk_report)
 
         assert "blocks" in payload
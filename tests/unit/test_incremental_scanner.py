@@ -1,17 +1,48 @@
 """
 Tests for Incremental Scanner Service
+
+Parallel: pytest -n auto --dist=loadfile  (requires pytest-xdist)
 """
 
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timezone, timedelta
 
 from src.services.incremental_scanner import IncrementalScanner
 from src.services.risk_scanner import ScanResult
-from src.storage.scan_state import TickerScanState, ScanStats
-from src.core.models import RiskReport, RiskLevel
+from src.storage.scan_state import TickerScanState
+from src.core.models import RiskLevel
+from src.config.settings import ActorSettings, SECSettings, Settings
+
+
+# Last scanned five days ago: recent enough not to be stale
+_RECENT_TIME = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
+_RECENT_STATE = TickerScanState(
+    last_scan_time=_RECENT_TIME,
+    last_8k_date="2024-01-10",
+    last_form4_date="2024-01-12",
+    last_risk_score=50,
+)
+
+
+# IncrementalScanner sizes its semaphores and filing check cache from settings
+_SETTINGS = Settings(
+    sec=SECSettings(max_filing_check_concurrency=4),
+    actor=ActorSettings(max_concurrent_scans=4),
+)
+
 
+def _make_successful_result(ticker: str, score: int = 50) -> ScanResult:
+    """Fresh successful scan result for a ticker"""
+    # Only risk_score/risk_level are read, so a plain namespace stands in for RiskReport
+    report = SimpleNamespace(risk_score=score, risk_level=RiskLevel.LOW)
+    return ScanResult(ticker=ticker, report=report, error=None, success=True)
 
+
+# Each class runs its async tests on one shared event loop
+@pytest.mark.asyncio(loop_scope="class")
 class TestIncrementalScanner:
     """Tests for IncrementalScanner"""
 
@@ -29,7 +60,6 @@ class TestIncrementalScanner:
         collector.has_new_filings_8k = AsyncMock(return_value=False)
         collector.has_new_filings_form4 = AsyncMock(return_value=False)
         collector.get_latest_filing_dates = AsyncMock(return_value=(None, None))
-        collector.close = AsyncMock()
         return collector
 
     @pytest.fixture
@@ -46,27 +76,18 @@ class TestIncrementalScanner:
     @pytest.fixture
     def incremental_scanner(self, mock_scanner, mock_collector, mock_state_store):
         """Create IncrementalScanner with mocked dependencies"""
-        with patch("src.services.incremental_scanner.get_settings"):
-            scanner = IncrementalScanner(
-                scanner=mock_scanner,
-                sec_collector=mock_collector,
-                state_store=mock_state_store,
-            )
-            return scanner
-
-    def _make_successful_result(self, ticker: str, score: int = 50) -> ScanResult:
-        """Create a successful scan result"""
-        report = MagicMock(spec=RiskReport)
-        report.risk_score = score
-        report.risk_level = RiskLevel.LOW
-        return ScanResult(ticker=ticker, report=report, error=None, success=True)
-
-    @pytest.mark.asyncio
+        return IncrementalScanner(
+            scanner=mock_scanner,
+            sec_collector=mock_collector,
+            state_store=mock_state_store,
+            settings=_SETTINGS,
+        )
+
     async def test_scan_incremental_first_run(
         self, incremental_scanner, mock_scanner, mock_state_store
     ):
         """First run scans all tickers (never scanned before)"""
-        mock_scanner.scan_ticker.return_value = self._make_successful_result("AAPL")
+        mock_scanner.scan_ticker.return_value = _make_successful_result("AAPL")
         mock_state_store.needs_rescan.return_value = (True, "never_scanned")
 
         results, stats = await incremental_scanner.scan_incremental(
@@ -78,29 +99,18 @@ class TestIncrementalScanner:
         assert stats.skipped == 0
         mock_scanner.scan_ticker.assert_called()
 
-    @pytest.mark.asyncio
     async def test_scan_incremental_skips_unchanged(
-        self, incremental_scanner, mock_scanner, mock_state_store, mock_collector
+        self, incremental_scanner, mock_scanner, mock_state_store
     ):
         """Skips tickers with no new filings"""
         # Setup: AAPL needs rescan, MSFT doesn't
-        def needs_rescan_side_effect(ticker, lookback_days):
-            if ticker == "AAPL":
-                return (True, "never_scanned")
-            return (False, "check_filings")
-
-        mock_state_store.needs_rescan.side_effect = needs_rescan_side_effect
+        needs_rescan = {"AAPL": (True, "never_scanned"), "MSFT": (False, "check_filings")}
+        mock_state_store.needs_rescan.side_effect = lambda ticker, lookback_days: needs_rescan[ticker]
 
         # MSFT has recent state, no new filings
-        recent_time = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
-        mock_state_store.get_state.return_value = TickerScanState(
-            last_scan_time=recent_time,
-            last_8k_date="2024-01-10",
-            last_form4_date="2024-01-12",
-            last_risk_score=50,
-        )
+        mock_state_store.get_state.return_value = _RECENT_STATE
 
-        mock_scanner.scan_ticker.return_value = self._make_successful_result("AAPL")
+        mock_scanner.scan_ticker.return_value = _make_successful_result("AAPL")
 
         results, stats = await incremental_scanner.scan_incremental(
             ["AAPL", "MSFT"], lookback_days=30
@@ -110,25 +120,18 @@ class TestIncrementalScanner:
         assert stats.skipped == 1
         assert "unchanged" in stats.reasons
 
-    @pytest.mark.asyncio
     async def test_scan_incremental_rescans_on_new_8k(
         self, incremental_scanner, mock_scanner, mock_state_store, mock_collector
     ):
         """Rescans when new 8-K filings found"""
         mock_state_store.needs_rescan.return_value = (False, "check_filings")
 
-        recent_time = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
-        mock_state_store.get_state.return_value = TickerScanState(
-            last_scan_time=recent_time,
-            last_8k_date="2024-01-10",
-            last_form4_date="2024-01-12",
-            last_risk_score=50,
-        )
+        mock_state_store.get_state.return_value = _RECENT_STATE
 
         # New 8-K filing found
         mock_collector.has_new_filings_8k.return_value = True
 
-        mock_scanner.scan_ticker.return_value = self._make_successful_result("AAPL")
+        mock_scanner.scan_ticker.return_value = _make_successful_result("AAPL")
 
         results, stats = await incremental_scanner.scan_incremental(
             ["AAPL"], lookback_days=30
@@ -137,26 +140,19 @@ class TestIncrementalScanner:
         assert stats.scanned == 1
         assert stats.skipped == 0
 
-    @pytest.mark.asyncio
     async def test_scan_incremental_rescans_on_new_form4(
         self, incremental_scanner, mock_scanner, mock_state_store, mock_collector
     ):
         """Rescans when new Form 4 filings found"""
         mock_state_store.needs_rescan.return_value = (False, "check_filings")
 
-        recent_time = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
-        mock_state_store.get_state.return_value = TickerScanState(
-            last_scan_time=recent_time,
-            last_8k_date="2024-01-10",
-            last_form4_date="2024-01-12",
-            last_risk_score=50,
-        )
+        mock_state_store.get_state.return_value = _RECENT_STATE
 
         # New Form 4 filing found
         mock_collector.has_new_filings_8k.return_value = False
         mock_collector.has_new_filings_form4.return_value = True
 
-        mock_scanner.scan_ticker.return_value = self._make_successful_result("AAPL")
+        mock_scanner.scan_ticker.return_value = _make_successful_result("AAPL")
 
         results, stats = await incremental_scanner.scan_incremental(
             ["AAPL"], lookback_days=30
@@ -165,7 +161,6 @@ class TestIncrementalScanner:
         assert stats.scanned == 1
         assert stats.skipped == 0
 
-    @pytest.mark.asyncio
     async def test_scan_incremental_force_rescan(
         self, incremental_scanner, mock_scanner, mock_state_store
     ):
@@ -173,7 +168,7 @@ class TestIncrementalScanner:
         # Even though state says no rescan needed
         mock_state_store.needs_rescan.return_value = (False, "check_filings")
 
-        mock_scanner.scan_ticker.return_value = self._make_successful_result("AAPL")
+        mock_scanner.scan_ticker.return_value = _make_successful_result("AAPL")
 
         results, stats = await incremental_scanner.scan_incremental(
             ["AAPL", "MSFT"], lookback_days=30, force_rescan=True
@@ -182,12 +177,11 @@ class TestIncrementalScanner:
         assert stats.scanned == 2
         assert stats.skipped == 0
 
-    @pytest.mark.asyncio
     async def test_scan_incremental_updates_state_after_scan(
         self, incremental_scanner, mock_scanner, mock_state_store, mock_collector
     ):
         """Updates state after successful scan"""
-        mock_scanner.scan_ticker.return_value = self._make_successful_result("AAPL", score=75)
+        mock_scanner.scan_ticker.return_value = _make_successful_result("AAPL", score=75)
         mock_collector.get_latest_filing_dates.return_value = ("2024-01-15", "2024-01-14")
 
         await incremental_scanner.scan_incremental(["AAPL"], lookback_days=30)
@@ -200,25 +194,23 @@ class TestIncrementalScanner:
         assert call_args.kwargs["last_8k_date"] == "2024-01-15"
         assert call_args.kwargs["last_form4_date"] == "2024-01-14"
 
-    @pytest.mark.asyncio
     async def test_scan_incremental_saves_state_at_end(
         self, incremental_scanner, mock_scanner, mock_state_store
     ):
         """Saves state after all scans complete"""
-        mock_scanner.scan_ticker.return_value = self._make_successful_result("AAPL")
+        mock_scanner.scan_ticker.return_value = _make_successful_result("AAPL")
 
         await incremental_scanner.scan_incremental(["AAPL", "MSFT"], lookback_days=30)
 
         mock_state_store.save.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_scan_incremental_rescans_on_stale(
         self, incremental_scanner, mock_scanner, mock_state_store
     ):
         """Rescans stale tickers"""
         mock_state_store.needs_rescan.return_value = (True, "stale")
 
-        mock_scanner.scan_ticker.return_value = self._make_successful_result("AAPL")
+        mock_scanner.scan_ticker.return_value = _make_successful_result("AAPL")
 
         results, stats = await incremental_scanner.scan_incremental(
             ["AAPL"], lookback_days=30
@@ -227,7 +219,28 @@ class TestIncrementalScanner:
         assert stats.scanned == 1
         assert stats.skipped == 0
 
-    @pytest.mark.asyncio
+    async def test_scan_incremental_scans_concurrently(
+        self, incremental_scanner, mock_scanner, mock_state_store
+    ):
+        """Tickers needing a scan are scanned concurrently, results kept in order"""
+        mock_state_store.needs_rescan.return_value = (True, "never_scanned")
+        both_started = asyncio.Barrier(2)
+
+        async def scan_ticker(ticker, **kwargs):
+            # Deadlocks (and times out) unless both scans are in flight at once
+            await both_started.wait()
+            return _make_successful_result(ticker)
+
+        mock_scanner.scan_ticker.side_effect = scan_ticker
+
+        results, stats = await asyncio.wait_for(
+            incremental_scanner.scan_incremental(["AAPL", "MSFT"], lookback_days=30),
+            timeout=1,
+        )
+
+        assert [r.ticker for r in results] == ["AAPL", "MSFT"]
+        assert stats.scanned == 2
+
     async def test_close_cleans_up_resources(
         self, incremental_scanner, mock_collector
     ):
@@ -237,32 +250,25 @@ class TestIncrementalScanner:
         mock_collector.close.assert_called_once()
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestIncrementalScannerShouldScan:
     """Tests for _should_scan method"""
 
     @pytest.fixture
     def incremental_scanner(self):
         """Create IncrementalScanner with minimal mocks"""
-        with patch("src.services.incremental_scanner.get_settings"):
-            scanner = IncrementalScanner(
-                scanner=AsyncMock(),
-                sec_collector=AsyncMock(),
-                state_store=MagicMock(),
-            )
-            return scanner
-
-    @pytest.mark.asyncio
+        return IncrementalScanner(
+            scanner=AsyncMock(),
+            sec_collector=AsyncMock(),
+            state_store=MagicMock(),
+            settings=_SETTINGS,
+        )
+
     async def test_should_scan_handles_filing_check_error(self, incremental_scanner):
         """Defaults to scanning on filing check error"""
         incremental_scanner._state_store.needs_rescan.return_value = (False, "check_filings")
 
-        recent_time = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
-        incremental_scanner._state_store.get_state.return_value = TickerScanState(
-            last_scan_time=recent_time,
-            last_8k_date="2024-01-10",
-            last_form4_date="2024-01-12",
-            last_risk_score=50,
-        )
+        incremental_scanner._state_store.get_state.return_value = _RECENT_STATE
 
         # Simulate error checking 8-K filings
         incremental_scanner._sec_collector.has_new_filings_8k.side_effect = Exception("API error")
@@ -271,3 +277,43 @@ class TestIncrementalScannerShouldScan:
 
         assert should_scan is True
         assert reason == "filing_check_error"
+
+    async def test_should_scan_prefers_8k_result(self, incremental_scanner):
+        """A new 8-K wins even if the concurrent Form 4 check fails"""
+        incremental_scanner._state_store.needs_rescan.return_value = (False, "check_filings")
+        incremental_scanner._state_store.get_state.return_value = _RECENT_STATE
+        incremental_scanner._sec_collector.has_new_filings_8k.return_value = True
+        incremental_scanner._sec_collector.has_new_filings_form4.side_effect = Exception("API error")
+
+        should_scan, reason = await incremental_scanner._should_scan("AAPL", 30)
+
+        assert should_scan is True
+        assert reason == "new_8k_filing"
+
+    async def test_should_scan_uses_filing_check_cache(self, incremental_scanner):
+        """Cached filing checks skip the SEC requests"""
+        incremental_scanner._state_store.needs_rescan.return_value = (False, "check_filings")
+        incremental_scanner._state_store.get_state.return_value = _RECENT_STATE
+        incremental_scanner._filing_check_cache.put("AAPL", "8-K", "2024-01-10", False)
+        incremental_scanner._filing_check_cache.put("AAPL", "4", "2024-01-12", False)
+
+        should_scan, reason = await incremental_scanner._should_scan("AAPL", 30)
+
+        assert (should_scan, reason) == (False, "unchanged")
+        incremental_scanner._sec_collector.has_new_filings_8k.assert_not_called()
+        incremental_scanner._sec_collector.has_new_filings_form4.assert_not_called()
+
+    async def test_failed_filing_check_not_cached(self, incremental_scanner):
+        """A failed SEC fetch is retried on the next check instead of cached"""
+        incremental_scanner._state_store.needs_rescan.return_value = (False, "check_filings")
+        incremental_scanner._state_store.get_state.return_value = _RECENT_STATE
+        collector = incremental_scanner._sec_collector
+        collector.has_new_filings_8k.side_effect = [Exception("API error"), False]
+        collector.has_new_filings_form4.return_value = False
+
+        first = await incremental_scanner._should_scan("AAPL", 30)
+        second = await incremental_scanner._should_scan("AAPL", 30)
+
+        assert first == (True, "filing_check_error")
+        assert second == (False, "unchanged")
+        assert collector.has_new_filings_8k.call_count == 2
@@ -2,9 +2,14 @@
 Tests for LLM Analyzer - JSON parsing and fallback methods
 """
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+from src.analyzers.llm_analyzer import GroqLLMAnalyzer
+from src.config.settings import LLMSettings, Settings
 from src.core.models import (
     InsiderTransaction,
     RedFlag,
@@ -12,21 +17,59 @@ from src.core.models import (
 )
 
 
+# Insider transactions are frozen, so the fallback tests share prebuilt tuples
+def _txn(date: str, name: str, kind: str, shares: int, value: int) -> InsiderTransaction:
+    """Transaction by an insider whose title matches their name"""
+    return InsiderTransaction(
+        date=date,
+        insider_name=name,
+        insider_title=name,
+        transaction_type=kind,
+        shares=shares,
+        total_value=value,
+    )
+
+
+_HEAVY_SELL = (_txn("2025-01-01", "CEO", "S", 10000, 1000000),)
+_NET_SELL = (
+    _txn("2025-01-01", "CEO", "S", 10000, 100000),
+    _txn("2025-01-02", "CFO", "P", 5000, 60000),
+)
+_HEAVY_BUY = (_txn("2025-01-01", "CEO", "P", 10000, 1000000),)
+_NEUTRAL = (
+    _txn("2025-01-01", "CEO", "S", 10000, 100000),
+    _txn("2025-01-02", "CFO", "P", 10000, 100000),
+)
+_REPEAT_SELLS = tuple(_txn(f"2025-01-0{day}", "CEO", "S", 1000, 50000) for day in (1, 2, 3))
+
+# Red flag sets for the fallback scorer, which only reads them
+_FLAGS_ONE_HIGH = (RedFlag(type="TEST", title="Test", severity=Severity.HIGH),)
+_FLAGS_MULTI = (
+    RedFlag(type="TEST1", title="Test1", severity=Severity.HIGH),
+    RedFlag(type="TEST2", title="Test2", severity=Severity.MEDIUM),
+    RedFlag(type="TEST3", title="Test3", severity=Severity.LOW),
+)
+_FLAGS_CAP = tuple(  # 10 * 20 = 200 points
+    RedFlag(type=f"TEST{i}", title=f"Test{i}", severity=Severity.HIGH) for i in range(10)
+)
+_FLAGS_HIGH = (
+    RedFlag(type="TEST1", title="Test1", severity=Severity.HIGH),
+    RedFlag(type="TEST2", title="Test2", severity=Severity.HIGH),
+    RedFlag(type="TEST3", title="Test3", severity=Severity.MEDIUM),
+)
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    """Analyzer with a mocked Groq client, shared by every test in the module"""
+    settings = Settings(llm=LLMSettings(api_key="test-key", model="test-model", max_tokens=1000))
+    with patch("src.analyzers.llm_analyzer.Groq"):
+        yield GroqLLMAnalyzer(settings=settings)
+
+
 class TestParseJsonResponse:
     """Tests for _parse_json_response method"""
 
-    @pytest.fixture
-    def analyzer(self):
-        """Create analyzer instance with mocked Groq client"""
-        with patch("src.analyzers.llm_analyzer.Groq"):
-            with patch("src.analyzers.llm_analyzer.get_settings") as mock_settings:
-                mock_settings.return_value.llm.api_key = "test-key"
-                mock_settings.return_value.llm.model = "test-model"
-                mock_settings.return_value.llm.temperature = 0.1
-                mock_settings.return_value.llm.max_tokens = 1000
-                from src.analyzers.llm_analyzer import GroqLLMAnalyzer
-                return GroqLLMAnalyzer(api_key="test-key")
-
     def test_direct_json(self, analyzer):
         """Valid JSON parses directly"""
         content = '{"red_flags": [], "risk_score": 25}'
@@ -57,6 +100,24 @@ That's all.'''
         result = analyzer._parse_json_response(content)
         assert result == {"status": "ok", "score": 10}
 
+    def test_braces_inside_strings_in_text(self, analyzer):
+        """Braces within JSON strings don't end the embedded object early"""
+        content = 'Result: {"details": "uses } and { literally", "score": 5} and {"other": 1}'
+        result = analyzer._parse_json_response(content)
+        assert result == {"details": "uses } and { literally", "score": 5}
+
+    def test_braces_in_prose_before_json(self, analyzer):
+        """Brace-containing prose before the JSON is skipped, not treated as the answer"""
+        content = 'I considered {risk} first. {"risk_score": 40}'
+        result = analyzer._parse_json_response(content)
+        assert result == {"risk_score": 40}
+
+    def test_unbalanced_brace_before_json(self, analyzer):
+        """An unclosed brace in prose doesn't hide a later JSON object"""
+        content = 'Scores { pending review: {"risk_score": 40}'
+        result = analyzer._parse_json_response(content)
+        assert result == {"risk_score": 40}
+
     def test_nested_json_object(self, analyzer):
         """Nested JSON objects parse correctly"""
         content = '{"patterns": [{"type": "CLUSTER", "details": {"count": 3}}]}'
@@ -84,31 +145,9 @@ That's all.'''
 class TestComputeInsiderFallback:
     """Tests for _compute_insider_fallback method"""
 
-    @pytest.fixture
-    def analyzer(self):
-        """Create analyzer instance with mocked Groq client"""
-        with patch("src.analyzers.llm_analyzer.Groq"):
-            with patch("src.analyzers.llm_analyzer.get_settings") as mock_settings:
-                mock_settings.return_value.llm.api_key = "test-key"
-                mock_settings.return_value.llm.model = "test-model"
-                mock_settings.return_value.llm.temperature = 0.1
-                mock_settings.return_value.llm.max_tokens = 1000
-                from src.analyzers.llm_analyzer import GroqLLMAnalyzer
-                return GroqLLMAnalyzer(api_key="test-key")
-
     def test_heavy_selling(self, analyzer):
         """Heavy selling is detected when sold > 2x bought"""
-        transactions = (
-            InsiderTransaction(
-                date="2025-01-01",
-                insider_name="CEO",
-                insider_title="CEO",
-                transaction_type="S",
-                shares=10000,
-                total_value=1000000,
-            ),
-        )
-        result = analyzer._compute_insider_fallback(transactions)
+        result = analyzer._compute_insider_fallback(_HEAVY_SELL)
         assert result["net_activity"] == "heavy_selling"
         assert result["total_sold"] == 1000000
         assert result["total_bought"] == 0
@@ -117,63 +156,17 @@ class TestComputeInsiderFallback:
 
     def test_net_selling(self, analyzer):
         """Net selling detected when sold > bought but < 2x"""
-        transactions = (
-            InsiderTransaction(
-                date="2025-01-01",
-                insider_name="CEO",
-                insider_title="CEO",
-                transaction_type="S",
-                shares=10000,
-                total_value=100000,
-            ),
-            InsiderTransaction(
-                date="2025-01-02",
-                insider_name="CFO",
-                insider_title="CFO",
-                transaction_type="P",
-                shares=5000,
-                total_value=60000,
-            ),
-        )
-        result = analyzer._compute_insider_fallback(transactions)
+        result = analyzer._compute_insider_fallback(_NET_SELL)
         assert result["net_activity"] == "net_selling"
 
     def test_heavy_buying(self, analyzer):
         """Heavy buying detected when bought > 2x sold"""
-        transactions = (
-            InsiderTransaction(
-                date="2025-01-01",
-                insider_name="CEO",
-                insider_title="CEO",
-                transaction_type="P",
-                shares=10000,
-                total_value=1000000,
-            ),
-        )
-        result = analyzer._compute_insider_fallback(transactions)
+        result = analyzer._compute_insider_fallback(_HEAVY_BUY)
         assert result["net_activity"] == "heavy_buying"
 
     def test_neutral_activity(self, analyzer):
         """Neutral when buying equals selling"""
-        transactions = (
-            InsiderTransaction(
-                date="2025-01-01",
-                insider_name="CEO",
-                insider_title="CEO",
-                transaction_type="S",
-                shares=10000,
-                total_value=100000,
-            ),
-            InsiderTransaction(
-                date="2025-01-02",
-                insider_name="CFO",
-                insider_title="CFO",
-                transaction_type="P",
-                shares=10000,
-                total_value=100000,
-            ),
-        )
-        result = analyzer._compute_insider_fallback(transactions)
+        result = analyzer._compute_insider_fallback(_NEUTRAL)
         assert result["net_activity"] == "neutral"
 
     def test_empty_transactions(self, analyzer):
@@ -183,22 +176,16 @@ class TestComputeInsiderFallback:
         assert result["total_sold"] == 0
         assert result["total_bought"] == 0
 
+    def test_repeat_seller_counted_once(self, analyzer):
+        """Insider counts are distinct people, not transactions"""
+        result = analyzer._compute_insider_fallback(_REPEAT_SELLS)
+        assert result["total_sold"] == 150000
+        assert result["insiders_selling"] == 1
+
 
 class TestComputeScoreFallback:
     """Tests for _compute_score_fallback method"""
 
-    @pytest.fixture
-    def analyzer(self):
-        """Create analyzer instance with mocked Groq client"""
-        with patch("src.analyzers.llm_analyzer.Groq"):
-            with patch("src.analyzers.llm_analyzer.get_settings") as mock_settings:
-                mock_settings.return_value.llm.api_key = "test-key"
-                mock_settings.return_value.llm.model = "test-model"
-                mock_settings.return_value.llm.temperature = 0.1
-                mock_settings.return_value.llm.max_tokens = 1000
-                from src.analyzers.llm_analyzer import GroqLLMAnalyzer
-                return GroqLLMAnalyzer(api_key="test-key")
-
     def test_no_flags_low_risk(self, analyzer):
         """No flags results in low risk"""
         result = analyzer._compute_score_fallback([], {})
@@ -207,24 +194,12 @@ class TestComputeScoreFallback:
 
     def test_high_severity_flag_elevated(self, analyzer):
         """High severity flag increases score"""
-        flags = [
-            RedFlag(
-                type="TEST",
-                title="Test",
-                severity=Severity.HIGH,
-            )
-        ]
-        result = analyzer._compute_score_fallback(flags, {})
+        result = analyzer._compute_score_fallback(_FLAGS_ONE_HIGH, {})
         assert result["risk_score"] == 40  # 20 base + 20 for high
 
     def test_multiple_flags_stack(self, analyzer):
         """Multiple flags add up"""
-        flags = [
-            RedFlag(type="TEST1", title="Test1", severity=Severity.HIGH),
-            RedFlag(type="TEST2", title="Test2", severity=Severity.MEDIUM),
-            RedFlag(type="TEST3", title="Test3", severity=Severity.LOW),
-        ]
-        result = analyzer._compute_score_fallback(flags, {})
+        result = analyzer._compute_score_fallback(_FLAGS_MULTI, {})
         # 20 base + 20 high + 10 medium + 5 low = 55
         assert result["risk_score"] == 55
         assert result["risk_level"] == "elevated"
@@ -245,22 +220,42 @@ class TestComputeScoreFallback:
 
     def test_score_capped_at_100(self, analyzer):
         """Score is capped at 100"""
-        flags = [
-            RedFlag(type=f"TEST{i}", title=f"Test{i}", severity=Severity.HIGH)
-            for i in range(10)  # 10 * 20 = 200 points
-        ]
-        result = analyzer._compute_score_fallback(flags, {})
+        result = analyzer._compute_score_fallback(_FLAGS_CAP, {})
         assert result["risk_score"] == 100
         assert result["risk_level"] == "high"  # Aligned with RiskLevel enum
 
     def test_high_threshold(self, analyzer):
         """Score >= 70 is high risk"""
-        flags = [
-            RedFlag(type="TEST1", title="Test1", severity=Severity.HIGH),
-            RedFlag(type="TEST2", title="Test2", severity=Severity.HIGH),
-            RedFlag(type="TEST3", title="Test3", severity=Severity.MEDIUM),
-        ]
-        result = analyzer._compute_score_fallback(flags, {})
+        result = analyzer._compute_score_fallback(_FLAGS_HIGH, {})
         # 20 + 20 + 20 + 10 = 70
         assert result["risk_score"] == 70
         assert result["risk_level"] == "high"  # Aligned with RiskLevel enum
+
+
+@pytest.mark.asyncio
+class TestCallLlm:
+    """Tests for the Groq round-trip"""
+
+    async def test_concurrent_calls_overlap(self):
+        """Blocking Groq calls run off the event loop, so two can be in flight at once"""
+        settings = Settings(llm=LLMSettings(api_key="test-key", model="test-model"))
+        with patch("src.analyzers.llm_analyzer.Groq"):
+            analyzer = GroqLLMAnalyzer(settings=settings)
+
+        # Each call waits for the other; on the event loop thread this would deadlock
+        both_in_flight = threading.Barrier(2, timeout=2)
+
+        def create(**kwargs):
+            both_in_flight.wait()
+            response = MagicMock()
+            response.choices[0].message.content = '{"ok": true}'
+            return response
+
+        analyzer._client.chat.completions.create.side_effect = create
+
+        results = await asyncio.gather(
+            analyzer._call_llm("first", "key-1"),
+            analyzer._call_llm("second", "key-2"),
+        )
+
+        assert results == [{"ok": True}, {"ok": True}]
@@ -7,13 +7,11 @@ from datetime import datetime, timezone
 
 from src.core.models import (
     RiskLevel,
-    Severity,
     Filing8K,
     InsiderTransaction,
     SECFilingData,
-    RiskReport,
-    InsiderSummary,
 )
+from src.scoring.rule_scorer import Critical8KItemsRule
 
 
 class TestRiskLevel:
@@ -39,6 +37,19 @@ class TestRiskLevel:
         assert RiskLevel.from_score(70) == RiskLevel.HIGH
         assert RiskLevel.from_score(100) == RiskLevel.HIGH
 
+    def test_from_score_out_of_range(self):
+        """Scores outside 0-100 clamp to the end levels"""
+        assert RiskLevel.from_score(-10) == RiskLevel.LOW
+        assert RiskLevel.from_score(150) == RiskLevel.HIGH
+        assert RiskLevel.from_score(29.9) == RiskLevel.LOW
+
+    def test_from_score_table_transitions(self):
+        """The precomputed lookup changes level exactly at 30, 50 and 70"""
+        levels = [RiskLevel.from_score(score) for score in range(101)]
+        transitions = [s for s in range(1, 101) if levels[s] is not levels[s - 1]]
+        assert transitions == [30, 50, 70]
+        assert levels[0] is RiskLevel.LOW and levels[100] is RiskLevel.HIGH
+
 
 class TestFiling8K:
     """Tests for Filing8K model"""
@@ -63,6 +74,45 @@ class TestFiling8K:
         )
         assert filing.has_critical_item() is False
 
+    @pytest.mark.parametrize(
+        "item",
+        [
+            "4.02 - Non-Reliance on Financial Statements",
+            "Item 4.02 - Non-Reliance on Financial Statements",
+            "7.01 - Regulation FD Disclosure",
+            "Exhibit 14.02 - Code of Ethics",
+        ],
+    )
+    def test_has_critical_item_agrees_with_scorer(self, item):
+        """Model and Critical8KItemsRule flag the same items, prefixed or not"""
+        filing = Filing8K(date="2025-01-15", form_type="8-K", title="Test", items=(item,))
+        data = SECFilingData(
+            ticker="TEST",
+            cik="0001234567",
+            filings_8k=(filing,),
+            filings_form4=(),
+            collected_at=datetime(2025, 1, 15, tzinfo=timezone.utc),
+            lookback_days=30,
+        )
+
+        adjustment, _ = Critical8KItemsRule().apply(None, data)
+
+        assert filing.has_critical_item() is (adjustment > 0)
+
+    @pytest.mark.parametrize(
+        "item, code",
+        [
+            ("4.02 - Non-Reliance on Financial Statements", "4.02"),
+            ("Item 4.01 - Changes in Registrant's Certifying Accountant", "4.01"),
+            ("Item4.01", "4.01"),
+            ("Exhibit 14.02 - Code of Ethics", None),
+            ("Other Events", None),
+        ],
+    )
+    def test_item_code(self, item, code):
+        """Extracts the N.NN code wherever it sits in the label"""
+        assert Filing8K.item_code(item) == code
+
     def test_frozen(self):
         """Filing8K should be immutable"""
         filing = Filing8K(
@@ -98,6 +148,17 @@ class TestInsiderTransaction:
         """Should return human-readable description"""
         assert sample_insider_transaction.transaction_description == "Sale"
 
+    def test_transaction_description_unknown_code(self):
+        """Unknown codes fall back to a labelled 'Other'"""
+        txn = InsiderTransaction(
+            date="2025-01-15",
+            insider_name="Test",
+            insider_title="CEO",
+            transaction_type="X",
+            shares=1000,
+        )
+        assert txn.transaction_description == "Other (X)"
+
 
 class TestSECFilingData:
     """Tests for SECFilingData model"""
@@ -1,12 +1,35 @@
 """
 Tests for Scan State Storage
+
+Parallel: pytest -n auto --dist=loadgroup  (requires pytest-xdist)
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
 
 from src.storage.scan_state import TickerScanState, ScanStats, ScanStateStore
+from tests.fixtures.stubs import AsyncReturnStub
+
+
+# Scan times either side of a 30-day lookback, computed once at import
+_NOW = datetime.now(timezone.utc)
+_OLD_ISO = (_NOW - timedelta(days=35)).isoformat()
+_RECENT_ISO = (_NOW - timedelta(days=5)).isoformat()
+
+
+class _StubKeyValueStore:
+    """Minimal stand-in for the key-value store behind ScanStateStore"""
+
+    def __init__(self):
+        self.values: dict = {}
+        self.writes: list[tuple] = []
+
+    async def get_value(self, key):
+        return self.values.get(key)
+
+    async def set_value(self, key, value):
+        self.writes.append((key, value))
+        self.values[key] = value
 
 
 class TestTickerScanState:
@@ -68,9 +91,8 @@ class TestTickerScanState:
 
     def test_is_stale_when_old(self):
         """Returns True when state is older than lookback"""
-        old_time = (datetime.now(timezone.utc) - timedelta(days=35)).isoformat()
         state = TickerScanState(
-            last_scan_time=old_time,
+            last_scan_time=_OLD_ISO,
             last_8k_date=None,
             last_form4_date=None,
             last_risk_score=50,
@@ -80,9 +102,8 @@ class TestTickerScanState:
 
     def test_is_stale_when_recent(self):
         """Returns False when state is within lookback"""
-        recent_time = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
         state = TickerScanState(
-            last_scan_time=recent_time,
+            last_scan_time=_RECENT_ISO,
             last_8k_date=None,
             last_form4_date=None,
             last_risk_score=50,
@@ -104,14 +125,22 @@ class TestScanStats:
         assert "70" in result
 
 
+# The class shares one store, so keep its tests on a single xdist worker
+@pytest.mark.xdist_group("scan_state")
 class TestScanStateStore:
     """Tests for ScanStateStore"""
 
-    @pytest.fixture
-    def store(self):
-        """Create store instance"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def store(cls):
+        """One store instance shared by the class; reset before each test"""
         return ScanStateStore()
 
+    @pytest.fixture(autouse=True)
+    def _reset_store(self, store):
+        """Give every test an empty store"""
+        store.clear()
+
     def test_get_state_not_found(self, store):
         """Returns None for unknown ticker"""
         result = store.get_state("UNKNOWN")
@@ -151,9 +180,8 @@ class TestScanStateStore:
 
     def test_needs_rescan_stale(self, store):
         """Returns True for stale ticker"""
-        old_time = (datetime.now(timezone.utc) - timedelta(days=35)).isoformat()
         store._state["AAPL"] = TickerScanState(
-            last_scan_time=old_time,
+            last_scan_time=_OLD_ISO,
             last_8k_date=None,
             last_form4_date=None,
             last_risk_score=50,
@@ -166,9 +194,8 @@ class TestScanStateStore:
 
     def test_needs_rescan_check_filings(self, store):
         """Returns False with check_filings reason for recent scan"""
-        recent_time = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
         store._state["AAPL"] = TickerScanState(
-            last_scan_time=recent_time,
+            last_scan_time=_RECENT_ISO,
             last_8k_date="2024-01-10",
             last_form4_date="2024-01-12",
             last_risk_score=50,
@@ -189,23 +216,25 @@ class TestScanStateStore:
         assert store.get_state("AAPL") is None
         assert store.get_state("MSFT") is None
 
-    @pytest.mark.asyncio
-    async def test_load_empty_store(self, store):
+    @pytest.fixture
+    def backend(self, store, monkeypatch):
+        """In-memory key-value store installed behind store._get_store"""
+        backend = _StubKeyValueStore()
+        monkeypatch.setattr(store, "_get_store", AsyncReturnStub(backend))
+        return backend
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_load_empty_store(self, store, backend):
         """Loads empty state from new store"""
-        mock_store = AsyncMock()
-        mock_store.get_value.return_value = None
-
-        with patch.object(store, "_get_store", return_value=mock_store):
-            result = await store.load()
+        result = await store.load()
 
         assert result == {}
         assert store._state == {}
 
-    @pytest.mark.asyncio
-    async def test_load_existing_state(self, store):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_load_existing_state(self, store, backend):
         """Loads existing state from store"""
-        mock_store = AsyncMock()
-        mock_store.get_value.return_value = {
+        backend.values["ticker_states"] = {
             "AAPL": {
                 "last_scan_time": "2024-01-15T10:00:00+00:00",
                 "last_8k_date": "2024-01-10",
@@ -214,33 +243,28 @@ class TestScanStateStore:
             }
         }
 
-        with patch.object(store, "_get_store", return_value=mock_store):
-            result = await store.load()
+        result = await store.load()
 
         assert "AAPL" in result
         assert result["AAPL"].last_risk_score == 75
 
-    @pytest.mark.asyncio
-    async def test_load_handles_corrupt_data(self, store):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_load_handles_corrupt_data(self, store, backend):
         """Handles corrupt data gracefully"""
-        mock_store = AsyncMock()
-        mock_store.get_value.return_value = {"AAPL": "invalid_data"}
+        backend.values["ticker_states"] = {"AAPL": "invalid_data"}
 
-        with patch.object(store, "_get_store", return_value=mock_store):
-            result = await store.load()
+        result = await store.load()
 
         assert result == {}
 
-    @pytest.mark.asyncio
-    async def test_save(self, store):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_save(self, store, backend):
         """Saves state to store"""
         store.update_state("AAPL", risk_score=75)
 
-        mock_store = AsyncMock()
-        with patch.object(store, "_get_store", return_value=mock_store):
-            await store.save()
+        await store.save()
 
-        mock_store.set_value.assert_called_once()
-        call_args = mock_store.set_value.call_args
-        assert call_args[0][0] == "ticker_states"
-        assert "AAPL" in call_args[0][1]
+        assert len(backend.writes) == 1
+        key, value = backend.writes[0]
+        assert key == "ticker_states"
+        assert "AAPL" in value
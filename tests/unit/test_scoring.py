@@ -2,39 +2,55 @@
 
 import pytest
 
-from src.core.models import RiskLevel, Severity
+from src.core.models import RiskLevel
 from src.scoring import RuleBasedScorer, CategoryScorer
 
 
+# Scoring reads but never mutates the scorers, so each configuration is built once
+@pytest.fixture(scope="module")
+def rule_scorer():
+    """Rule-only scorer"""
+    return RuleBasedScorer(use_category_scoring=False)
+
+
+@pytest.fixture(scope="module")
+def category_rule_scorer():
+    """Scorer with category weighting enabled"""
+    return RuleBasedScorer(use_category_scoring=True)
+
+
+@pytest.fixture(scope="module")
+def category_scorer():
+    """Standalone category scorer"""
+    return CategoryScorer()
+
+
 class TestRuleBasedScorer:
     """Tests for the RuleBasedScorer class (rule-only mode)"""
 
-    def test_score_with_no_adjustments(self, empty_analysis_result, empty_sec_data):
+    def test_score_with_no_adjustments(self, rule_scorer, empty_analysis_result, empty_sec_data):
         """Score should match base when no rules trigger (rule-only mode)"""
-        scorer = RuleBasedScorer(use_category_scoring=False)
-        result = scorer.score(empty_analysis_result, empty_sec_data)
+        result = rule_scorer.score(empty_analysis_result, empty_sec_data)
 
         assert result.risk_score == empty_analysis_result.risk_score
         assert result.adjustments == 0
         assert len(result.adjustment_reasons) == 0
 
-    def test_score_with_auditor_change(self, auditor_change_analysis):
+    def test_score_with_auditor_change(self, rule_scorer, auditor_change_analysis):
         """Auditor change should add penalty (rule-only mode)"""
-        scorer = RuleBasedScorer(use_category_scoring=False)
-        result = scorer.score(auditor_change_analysis)
+        result = rule_scorer.score(auditor_change_analysis)
 
         base = auditor_change_analysis.risk_score
         assert result.risk_score == base + 15  # Default auditor penalty
         assert "+15 for auditor change" in result.adjustment_reasons
 
-    def test_score_with_combined_signals(self, sample_analysis_result, sample_sec_data):
+    def test_score_with_combined_signals(self, rule_scorer, sample_analysis_result, sample_sec_data):
         """Red flags + insider selling should add penalty"""
-        scorer = RuleBasedScorer(use_category_scoring=False)
-        result = scorer.score(sample_analysis_result, sample_sec_data)
+        result = rule_scorer.score(sample_analysis_result, sample_sec_data)
 
         assert "+5 for red flags + insider selling combination" in result.adjustment_reasons
 
-    def test_score_capped_at_100(self, auditor_change_analysis):
+    def test_score_capped_at_100(self, rule_scorer, auditor_change_analysis):
         """Score should never exceed 100"""
         from src.core.models import AnalysisResult, InsiderSummary
 
@@ -54,14 +70,13 @@ class TestRuleBasedScorer:
             explanation=None,
         )
 
-        scorer = RuleBasedScorer(use_category_scoring=False)
-        result = scorer.score(high_score_analysis)
+        result = rule_scorer.score(high_score_analysis)
 
         assert result.risk_score <= 100
 
-    def test_risk_level_boundaries(self, empty_analysis_result):
-        """Test risk level determination at boundaries"""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "score, expected_level",
+        [
             (10, RiskLevel.LOW),
             (29, RiskLevel.LOW),
             (30, RiskLevel.MODERATE),
@@ -70,51 +85,46 @@ class TestRuleBasedScorer:
             (69, RiskLevel.ELEVATED),
             (70, RiskLevel.HIGH),
             (100, RiskLevel.HIGH),
-        ]
-
-        for score, expected_level in test_cases:
-            assert RiskLevel.from_score(score) == expected_level
+        ],
+    )
+    def test_risk_level_boundaries(self, score, expected_level):
+        """Test risk level determination at boundaries"""
+        assert RiskLevel.from_score(score) == expected_level
 
-    def test_get_scoring_method_rule_only(self):
+    def test_get_scoring_method_rule_only(self, rule_scorer):
         """Should return rule-based method name when category scoring disabled"""
-        scorer = RuleBasedScorer(use_category_scoring=False)
-        assert scorer.get_scoring_method() == "Rule-based adjustments"
+        assert rule_scorer.get_scoring_method() == "Rule-based adjustments"
 
-    def test_get_scoring_method_with_category(self):
+    def test_get_scoring_method_with_category(self, category_rule_scorer):
         """Should return category method name when category scoring enabled"""
-        scorer = RuleBasedScorer(use_category_scoring=True)
-        assert scorer.get_scoring_method() == "Category-weighted scoring with rule adjustments"
+        assert category_rule_scorer.get_scoring_method() == "Category-weighted scoring with rule adjustments"
 
 
 class TestCategoryScorer:
     """Tests for the CategoryScorer class"""
 
-    def test_category_weights_sum_to_one(self):
+    def test_category_weights_sum_to_one(self, category_scorer):
         """Category weights should sum to 1.0"""
-        scorer = CategoryScorer()
-        total = sum(scorer.CATEGORY_WEIGHTS.values())
+        total = sum(category_scorer.CATEGORY_WEIGHTS.values())
         assert total == pytest.approx(1.0)
 
-    def test_calculate_category_scores(self, sample_analysis_result):
+    def test_calculate_category_scores(self, category_scorer, sample_analysis_result):
         """Should calculate scores per category"""
-        scorer = CategoryScorer()
-        scores = scorer.calculate_category_scores(sample_analysis_result)
+        scores = category_scorer.calculate_category_scores(sample_analysis_result)
 
         # Should have all categories
-        for cat in scorer.CATEGORY_WEIGHTS:
+        for cat in category_scorer.CATEGORY_WEIGHTS:
             assert cat in scores
 
-    def test_weighted_score_capped_at_100(self, sample_analysis_result):
+    def test_weighted_score_capped_at_100(self, category_scorer, sample_analysis_result):
         """Weighted score should be capped at 100"""
-        scorer = CategoryScorer()
-        final_score, _ = scorer.calculate_weighted_score(sample_analysis_result)
+        final_score, _ = category_scorer.calculate_weighted_score(sample_analysis_result)
 
         assert 0 <= final_score <= 100
 
-    def test_insider_activity_adds_to_insider_category(self, sample_analysis_result):
+    def test_insider_activity_adds_to_insider_category(self, category_scorer, sample_analysis_result):
         """Insider selling should add to insider category score"""
-        scorer = CategoryScorer()
-        scores = scorer.calculate_category_scores(sample_analysis_result)
+        scores = category_scorer.calculate_category_scores(sample_analysis_result)
 
         # sample_analysis_result has net_selling, should add points
         assert scores['insider'] > 0
@@ -2,212 +2,159 @@
 Tests for SEC Collector - Parsing methods
 """
 
+import asyncio
+from types import SimpleNamespace
+
+import httpx
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import AsyncMock
 from datetime import datetime, timezone, timedelta
-from xml.etree import ElementTree
 from bs4 import BeautifulSoup
+from lxml import etree
+
+from src.collectors.sec_collector import SECCollector
+from src.config.settings import SECSettings, Settings
+from src.core.exceptions import SECFetchError, TickerNotFoundError
+
+
+_INDEX_URL = "https://sec.gov/filings/test/"
+
+
+def _index_soup(html: str) -> BeautifulSoup:
+    """Parse a filing index fixture the way the collector does; parsed once at import"""
+    return BeautifulSoup(html, "lxml", parse_only=SECCollector.INDEX_STRAINER)
 
 
 class TestFindMainDocument:
     """Tests for _find_main_document method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.1
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
-    def test_finds_8k_in_href(self, collector):
-        """Finds 8-K document by href pattern"""
-        html = '''
-        <html>
-            <a href="d8k.htm">8-K Document</a>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_main_document(soup, "https://sec.gov/filings/test/")
-        assert result == "https://sec.gov/filings/test/d8k.htm"
-
-    def test_finds_8k_in_text(self, collector):
-        """Finds 8-K document by link text"""
-        html = '''
-        <html>
-            <a href="document.htm">Form 8-K Current Report</a>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_main_document(soup, "https://sec.gov/filings/test/")
-        assert result == "https://sec.gov/filings/test/document.htm"
-
-    def test_finds_form8k_pattern(self, collector):
-        """Finds document with form8k pattern"""
-        html = '''
-        <html>
-            <a href="form8k_2025.html">Filing</a>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_main_document(soup, "https://sec.gov/filings/test/")
-        assert result == "https://sec.gov/filings/test/form8k_2025.html"
-
-    def test_finds_8k_in_table(self, collector):
-        """Finds 8-K document in table format"""
-        html = '''
-        <html>
-            <table class="tableFile">
-                <tr><th>Type</th></tr>
-                <tr>
-                    <td>1</td>
-                    <td>2</td>
-                    <td><a href="doc.htm">Link</a></td>
-                    <td>8-K</td>
-                </tr>
-            </table>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_main_document(soup, "https://sec.gov/filings/test/")
-        assert result == "https://sec.gov/filings/test/doc.htm"
-
-    def test_returns_none_when_not_found(self, collector):
-        """Returns None when no 8-K document found"""
-        html = '''
-        <html>
-            <a href="other.pdf">Some other document</a>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_main_document(soup, "https://sec.gov/filings/test/")
-        assert result is None
-
-    def test_handles_absolute_url(self, collector):
-        """Handles absolute URLs in href"""
-        html = '''
-        <html>
-            <a href="https://sec.gov/absolute/8k.htm">8-K</a>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_main_document(soup, "https://sec.gov/filings/test/")
-        assert result == "https://sec.gov/absolute/8k.htm"
+    @pytest.mark.parametrize(
+        "soup, expected",
+        [
+            pytest.param(
+                _index_soup('<html><a href="d8k.htm">8-K Document</a></html>'),
+                "https://sec.gov/filings/test/d8k.htm",
+                id="8k_in_href",
+            ),
+            pytest.param(
+                _index_soup('<html><a href="document.htm">Form 8-K Current Report</a></html>'),
+                "https://sec.gov/filings/test/document.htm",
+                id="8k_in_text",
+            ),
+            pytest.param(
+                _index_soup('<html><a href="form8k_2025.html">Filing</a></html>'),
+                "https://sec.gov/filings/test/form8k_2025.html",
+                id="form8k_pattern",
+            ),
+            pytest.param(
+                _index_soup('''
+                <html>
+                    <table class="tableFile">
+                        <tr><th>Type</th></tr>
+                        <tr>
+                            <td>1</td>
+                            <td>2</td>
+                            <td><a href="doc.htm">Link</a></td>
+                            <td>8-K</td>
+                        </tr>
+                    </table>
+                </html>
+                '''),
+                "https://sec.gov/filings/test/doc.htm",
+                id="8k_in_table",
+            ),
+            pytest.param(
+                _index_soup('<html><a href="other.pdf">Some other document</a></html>'),
+                None,
+                id="none_when_not_found",
+            ),
+            pytest.param(
+                _index_soup('<html><a href="https://sec.gov/absolute/8k.htm">8-K</a></html>'),
+                "https://sec.gov/absolute/8k.htm",
+                id="absolute_url",
+            ),
+        ],
+    )
+    def test_find_main_document(self, collector, soup, expected):
+        """Finds the 8-K document link in a filing index"""
+        assert collector._find_main_document(soup, _INDEX_URL) == expected
 
 
 class TestBuildFullUrl:
     """Tests for _build_full_url method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.1
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
-    def test_relative_url(self, collector):
-        """Builds full URL from relative href"""
-        result = collector._build_full_url("doc.htm", "https://sec.gov/filings/abc/index.htm")
-        assert result == "https://sec.gov/filings/abc/doc.htm"
-
-    def test_absolute_url_unchanged(self, collector):
-        """Absolute URLs pass through unchanged"""
-        result = collector._build_full_url("https://other.com/doc.htm", "https://sec.gov/filings/")
-        assert result == "https://other.com/doc.htm"
-
-    def test_absolute_path_uses_base_domain(self, collector):
-        """Absolute paths (starting with /) use base domain only"""
-        result = collector._build_full_url(
-            "/Archives/edgar/data/123/form4.xml",
-            "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany"
-        )
-        assert result == "https://www.sec.gov/Archives/edgar/data/123/form4.xml"
-
-    def test_absolute_path_no_double_slashes(self, collector):
-        """Absolute paths don't create double slashes in URL"""
-        result = collector._build_full_url(
-            "/Archives/edgar/data/1652044/000119312525338475/xslF345X05/ownership.xml",
-            "https://www.sec.gov/Archives/edgar/data/1652044/000119312525338475/0001193125-25-338475-index.htm"
-        )
-        assert "//" not in result.replace("https://", "")
-        assert result == "https://www.sec.gov/Archives/edgar/data/1652044/000119312525338475/xslF345X05/ownership.xml"
+    @pytest.mark.parametrize(
+        "href, base_url, expected",
+        [
+            pytest.param(
+                "doc.htm",
+                "https://sec.gov/filings/abc/index.htm",
+                "https://sec.gov/filings/abc/doc.htm",
+                id="relative_url",
+            ),
+            pytest.param(
+                "https://other.com/doc.htm",
+                "https://sec.gov/filings/",
+                "https://other.com/doc.htm",
+                id="absolute_url_unchanged",
+            ),
+            pytest.param(
+                "/Archives/edgar/data/123/form4.xml",
+                "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany",
+                "https://www.sec.gov/Archives/edgar/data/123/form4.xml",
+                id="absolute_path_uses_base_domain",
+            ),
+            pytest.param(
+                # Absolute paths must not produce double slashes
+                "/Archives/edgar/data/1652044/000119312525338475/xslF345X05/ownership.xml",
+                "https://www.sec.gov/Archives/edgar/data/1652044/000119312525338475/0001193125-25-338475-index.htm",
+                "https://www.sec.gov/Archives/edgar/data/1652044/000119312525338475/xslF345X05/ownership.xml",
+                id="absolute_path_no_double_slashes",
+            ),
+        ],
+    )
+    def test_build_full_url(self, collector, href, base_url, expected):
+        """Resolves hrefs against the page they were found on"""
+        assert collector._build_full_url(href, base_url) == expected
 
 
 class TestFindForm4Xml:
     """Tests for _find_form4_xml method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.1
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
-    def test_finds_raw_xml_file(self, collector):
-        """Finds raw XML file in filing index"""
-        html = '''
-        <html>
-            <a href="wk-form4_123456.xml">XML</a>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_form4_xml(soup, "https://sec.gov/filings/test/")
-        assert result == "https://sec.gov/filings/test/wk-form4_123456.xml"
-
-    def test_skips_xslt_transformed_files(self, collector):
-        """Skips XSLT-transformed XML files (they return HTML)"""
-        html = '''
-        <html>
-            <a href="xslF345X05/ownership.xml">Styled XML</a>
-            <a href="wk-form4_123456.xml">Raw XML</a>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_form4_xml(soup, "https://sec.gov/filings/test/")
-        # Should return the raw XML, not the XSLT one
-        assert result == "https://sec.gov/filings/test/wk-form4_123456.xml"
-
-    def test_returns_none_when_only_xslt_available(self, collector):
-        """Returns None when only XSLT files are available"""
-        html = '''
-        <html>
-            <a href="/Archives/edgar/xslF345X05/ownership.xml">Styled XML</a>
-        </html>
-        '''
-        soup = BeautifulSoup(html, "lxml")
-        result = collector._find_form4_xml(soup, "https://sec.gov/filings/test/")
-        assert result is None
+    @pytest.mark.parametrize(
+        "soup, expected",
+        [
+            pytest.param(
+                _index_soup('<html><a href="wk-form4_123456.xml">XML</a></html>'),
+                "https://sec.gov/filings/test/wk-form4_123456.xml",
+                id="raw_xml_file",
+            ),
+            pytest.param(
+                # XSLT-transformed files return HTML, so the raw XML wins
+                _index_soup('''
+                <html>
+                    <a href="xslF345X05/ownership.xml">Styled XML</a>
+                    <a href="wk-form4_123456.xml">Raw XML</a>
+                </html>
+                '''),
+                "https://sec.gov/filings/test/wk-form4_123456.xml",
+                id="skips_xslt_transformed",
+            ),
+            pytest.param(
+                _index_soup('<html><a href="/Archives/edgar/xslF345X05/ownership.xml">Styled XML</a></html>'),
+                None,
+                id="none_when_only_xslt",
+            ),
+        ],
+    )
+    def test_find_form4_xml(self, collector, soup, expected):
+        """Finds the raw Form 4 XML link in a filing index"""
+        assert collector._find_form4_xml(soup, _INDEX_URL) == expected
 
 
 class TestExtract8kItems:
     """Tests for _extract_8k_items method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.1
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
     def test_extracts_single_item(self, collector):
         """Extracts single item number"""
         text = "Item 5.02 Departure of Directors"
@@ -234,333 +181,264 @@ class TestExtract8kItems:
         result = collector._extract_8k_items(text)
         assert "2.05 - Costs for Exit Activities" in result
 
+    def test_repeated_items_listed_once_in_item_order(self, collector):
+        """Each item appears once, ordered by item number rather than by mention"""
+        text = "Item 8.01 Other Events. See Item 2.02 and Item 8.01 above. Item 9.01 Exhibits"
+        result = collector._extract_8k_items(text)
+        assert result == ["2.02 - Results of Operations", "8.01 - Other Events"]
+
+
+def _parse_xml(xml: str) -> etree._Element:
+    """Parse an XML fixture the way the collector parses SEC responses"""
+    return etree.fromstring(xml.encode(), SECCollector.XML_PARSER)
+
+
+# XML fixtures are parsed once at import; the helpers under test only read them
+_NAME_ROOT = _parse_xml("<root><name>  John Smith  </name></root>")
+_EMPTY_NAME_ROOT = _parse_xml("<root><name></name></root>")
+_OTHER_ROOT = _parse_xml("<root><other>value</other></root>")
+_PRICE_ROOT = _parse_xml("<root><price><value>150.50</value></price></root>")
+_BAD_PRICE_ROOT = _parse_xml("<root><price><value>not a number</value></price></root>")
+
+_ATOM_NS = SECCollector.ATOM_NS
+
+
+def _atom_entry(body: str) -> etree._Element:
+    """Parse the <entry> of a one-entry Atom feed"""
+    feed = f'<feed xmlns="http://www.w3.org/2005/Atom"><entry>{body}</entry></feed>'
+    return _parse_xml(feed).find("atom:entry", _ATOM_NS)
+
+
+# Dates relative to import time keep the 8-K entries inside the 30 day cutoff
+_NOW = datetime.now(timezone.utc)
+_FILING_DATE = (_NOW - timedelta(days=5)).strftime("%Y-%m-%d")
+_UPDATED_DATE = (_NOW - timedelta(days=2)).strftime("%Y-%m-%dT10:00:00Z")
+_FALLBACK_UPDATED = _NOW - timedelta(days=3)
+_CUTOFF = _NOW - timedelta(days=30)
+
+_8K_HEADER = '<title>8-K Test Filing</title><link href="https://sec.gov/test"/>'
+_8K_WITH_BOTH_DATES = _atom_entry(
+    f"{_8K_HEADER}<filing-date>{_FILING_DATE}</filing-date><updated>{_UPDATED_DATE}</updated>"
+)
+_8K_WITH_UPDATED = _atom_entry(
+    f"{_8K_HEADER}<updated>{_FALLBACK_UPDATED.strftime('%Y-%m-%dT10:00:00Z')}</updated>"
+)
+_8K_WITHOUT_DATE = _atom_entry(_8K_HEADER)
+
+_ENTRY_WITH_BOTH_DATES = _atom_entry(
+    "<filing-date>2024-01-15</filing-date><updated>2024-01-20T10:00:00Z</updated>"
+)
+_ENTRY_WITH_UPDATED = _atom_entry("<updated>2024-01-20T10:00:00Z</updated>")
+_ENTRY_WITHOUT_DATE = _atom_entry("<title>Test</title>")
+
 
 class TestGetXmlHelpers:
     """Tests for XML helper methods"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.1
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
     def test_get_xml_text_found(self, collector):
         """Returns text when element exists"""
-        xml = "<root><name>  John Smith  </name></root>"
-        root = ElementTree.fromstring(xml)
-        result = collector._get_xml_text(root, ".//name")
+        result = collector._get_xml_text(_NAME_ROOT, ".//name")
         assert result == "John Smith"
 
     def test_get_xml_text_not_found(self, collector):
         """Returns None when element missing"""
-        xml = "<root><other>value</other></root>"
-        root = ElementTree.fromstring(xml)
-        result = collector._get_xml_text(root, ".//name")
+        result = collector._get_xml_text(_OTHER_ROOT, ".//name")
         assert result is None
 
     def test_get_xml_text_empty(self, collector):
         """Returns None for empty element"""
-        xml = "<root><name></name></root>"
-        root = ElementTree.fromstring(xml)
-        result = collector._get_xml_text(root, ".//name")
+        result = collector._get_xml_text(_EMPTY_NAME_ROOT, ".//name")
         assert result is None
 
     def test_get_xml_float_valid(self, collector):
         """Returns float when valid number"""
-        xml = "<root><price><value>150.50</value></price></root>"
-        root = ElementTree.fromstring(xml)
-        result = collector._get_xml_float(root, ".//price/value")
+        result = collector._get_xml_float(_PRICE_ROOT, ".//price/value")
         assert result == 150.50
 
     def test_get_xml_float_invalid(self, collector):
         """Returns None for invalid number"""
-        xml = "<root><price><value>not a number</value></price></root>"
-        root = ElementTree.fromstring(xml)
-        result = collector._get_xml_float(root, ".//price/value")
+        result = collector._get_xml_float(_BAD_PRICE_ROOT, ".//price/value")
         assert result is None
 
     def test_get_xml_float_missing(self, collector):
         """Returns None for missing element"""
-        xml = "<root><other>value</other></root>"
-        root = ElementTree.fromstring(xml)
-        result = collector._get_xml_float(root, ".//price/value")
+        result = collector._get_xml_float(_OTHER_ROOT, ".//price/value")
         assert result is None
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestParseAtomDate:
     """Tests for filing date parsing from Atom feed"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.1
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
-    def test_prefers_filing_date_over_updated(self, collector):
+    @pytest.fixture(autouse=True)
+    def _no_content_fetch(self, collector, monkeypatch):
+        """Keep _parse_8k_entry from requesting the entry's document"""
+        monkeypatch.setattr(
+            collector, "_fetch_8k_content", AsyncMock(return_value={"snippet": None, "items": []})
+        )
+
+    async def test_prefers_filing_date_over_updated(self, collector):
         """Prefers filing-date element over updated element"""
-        import asyncio
-        # Use dates relative to a fixed cutoff to avoid time-dependent failures
-        filing_date = (datetime.now(timezone.utc) - timedelta(days=5)).strftime("%Y-%m-%d")
-        updated_date = (datetime.now(timezone.utc) - timedelta(days=2)).strftime("%Y-%m-%dT10:00:00Z")
-
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <title>8-K Test Filing</title>
-                <link href="https://sec.gov/test"/>
-                <filing-date>{filing_date}</filing-date>
-                <updated>{updated_date}</updated>
-            </entry>
-        </feed>
-        '''
-        root = ElementTree.fromstring(xml)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        entry = root.find("atom:entry", ns)
-        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
-
-        result = asyncio.run(collector._parse_8k_entry(entry, ns, cutoff))
+        result = await collector._parse_8k_entry(_8K_WITH_BOTH_DATES, _ATOM_NS, _CUTOFF)
 
         # Should use filing-date, not updated
         assert result is not None
-        assert result.date == filing_date
+        assert result.date == _FILING_DATE
 
-    def test_falls_back_to_updated(self, collector):
+    async def test_falls_back_to_updated(self, collector):
         """Falls back to updated when filing-date missing"""
-        import asyncio
-        updated_date = (datetime.now(timezone.utc) - timedelta(days=3)).strftime("%Y-%m-%dT10:00:00Z")
-        expected_date = (datetime.now(timezone.utc) - timedelta(days=3)).strftime("%Y-%m-%d")
-
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <title>8-K Test Filing</title>
-                <link href="https://sec.gov/test"/>
-                <updated>{updated_date}</updated>
-            </entry>
-        </feed>
-        '''
-        root = ElementTree.fromstring(xml)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        entry = root.find("atom:entry", ns)
-        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
-
-        result = asyncio.run(collector._parse_8k_entry(entry, ns, cutoff))
+        result = await collector._parse_8k_entry(_8K_WITH_UPDATED, _ATOM_NS, _CUTOFF)
 
         assert result is not None
-        assert result.date == expected_date
+        assert result.date == _FALLBACK_UPDATED.strftime("%Y-%m-%d")
 
-    def test_returns_none_when_no_date(self, collector):
+    async def test_returns_none_when_no_date(self, collector):
         """Returns None when no date element exists"""
-        import asyncio
-        xml = '''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <title>8-K Test Filing</title>
-                <link href="https://sec.gov/test"/>
-            </entry>
-        </feed>
-        '''
-        root = ElementTree.fromstring(xml)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        entry = root.find("atom:entry", ns)
-        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
-
-        result = asyncio.run(collector._parse_8k_entry(entry, ns, cutoff))
+        result = await collector._parse_8k_entry(_8K_WITHOUT_DATE, _ATOM_NS, _CUTOFF)
 
         assert result is None
 
 
+# Atom feed bodies served by the stub client
+_FEED_2024_01_20 = b'''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <entry>
+        <filing-date>2024-01-20</filing-date>
+    </entry>
+</feed>
+'''
+_FEED_2024_01_10 = b'''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <entry>
+        <filing-date>2024-01-10</filing-date>
+    </entry>
+</feed>
+'''
+_EMPTY_FEED = b'''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+</feed>
+'''
+
+
+class _StubResponse:
+    """Stand-in for httpx.Response; the collector only reads content"""
+
+    __slots__ = ("content",)
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _StubClient:
+    """Stand-in for httpx.AsyncClient that answers every GET with one response"""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: _StubResponse):
+        self.response = response
+
+    async def get(self, url: str, **kwargs) -> _StubResponse:
+        return self.response
+
+
+def _resolves_to(value):
+    """Coroutine function returning value; a lighter stub than AsyncMock"""
+    async def stub(*args, **kwargs):
+        return value
+    return stub
+
+
+@pytest.fixture
+def serve_feed(collector, monkeypatch):
+    """Point the collector at a stub client that serves one Atom feed"""
+    def serve(feed: bytes) -> None:
+        monkeypatch.setattr(collector, "_get_client", _resolves_to(_StubClient(_StubResponse(feed))))
+        monkeypatch.setattr(collector, "_get_cik", _resolves_to("0001234567890"))
+        monkeypatch.setattr(collector, "_rate_limit", _resolves_to(None))
+    return serve
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestHasNewFilings8k:
     """Tests for has_new_filings_8k method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.01
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
-    @pytest.mark.asyncio
-    async def test_returns_true_when_new_filings_exist(self, collector):
+    async def test_returns_true_when_new_filings_exist(self, collector, serve_feed):
         """Returns True when filings exist after since_date"""
-        mock_response = MagicMock()
-        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <filing-date>2024-01-20</filing-date>
-            </entry>
-        </feed>
-        '''
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-
-        collector._get_client = AsyncMock(return_value=mock_client)
-        collector._get_cik = AsyncMock(return_value="0001234567890")
-        collector._rate_limit = AsyncMock()
+        serve_feed(_FEED_2024_01_20)
 
         result = await collector.has_new_filings_8k("AAPL", "2024-01-15")
 
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_returns_false_when_no_new_filings(self, collector):
+    async def test_returns_false_when_no_new_filings(self, collector, serve_feed):
         """Returns False when no filings after since_date"""
-        mock_response = MagicMock()
-        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <filing-date>2024-01-10</filing-date>
-            </entry>
-        </feed>
-        '''
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-
-        collector._get_client = AsyncMock(return_value=mock_client)
-        collector._get_cik = AsyncMock(return_value="0001234567890")
-        collector._rate_limit = AsyncMock()
+        serve_feed(_FEED_2024_01_10)
 
         result = await collector.has_new_filings_8k("AAPL", "2024-01-15")
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_returns_false_when_cik_not_found(self, collector):
-        """Returns False when CIK cannot be resolved"""
-        collector._get_cik = AsyncMock(return_value=None)
+    async def test_raises_when_cik_not_found(self, collector, monkeypatch):
+        """Raises rather than reporting no filings when CIK cannot be resolved"""
+        monkeypatch.setattr(collector, "_get_cik", _resolves_to(None))
 
-        result = await collector.has_new_filings_8k("INVALID", "2024-01-15")
+        with pytest.raises(TickerNotFoundError):
+            await collector.has_new_filings_8k("INVALID", "2024-01-15")
 
-        assert result is False
+    async def test_raises_when_fetch_fails(self, collector, serve_feed, monkeypatch):
+        """A failed feed fetch raises rather than reporting no filings"""
+        serve_feed(_EMPTY_FEED)
+
+        async def refuse(url: str, **kwargs):
+            raise httpx.ConnectError("refused")
+
+        monkeypatch.setattr(collector, "_get_client", _resolves_to(SimpleNamespace(get=refuse)))
+
+        with pytest.raises(SECFetchError):
+            await collector.has_new_filings_8k("AAPL", "2024-01-15")
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestHasNewFilingsForm4:
     """Tests for has_new_filings_form4 method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.01
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
-    @pytest.mark.asyncio
-    async def test_returns_true_when_new_filings_exist(self, collector):
+    async def test_returns_true_when_new_filings_exist(self, collector, serve_feed):
         """Returns True when Form 4 filings exist after since_date"""
-        mock_response = MagicMock()
-        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <filing-date>2024-01-20</filing-date>
-            </entry>
-        </feed>
-        '''
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-
-        collector._get_client = AsyncMock(return_value=mock_client)
-        collector._get_cik = AsyncMock(return_value="0001234567890")
-        collector._rate_limit = AsyncMock()
+        serve_feed(_FEED_2024_01_20)
 
         result = await collector.has_new_filings_form4("AAPL", "2024-01-15")
 
         assert result is True
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestGetLatestFilingDates:
     """Tests for get_latest_filing_dates method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.01
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
-    @pytest.mark.asyncio
-    async def test_returns_both_dates(self, collector):
+    async def test_returns_both_dates(self, collector, serve_feed):
         """Returns both 8-K and Form 4 dates"""
-        mock_response = MagicMock()
-        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <filing-date>2024-01-20</filing-date>
-            </entry>
-        </feed>
-        '''
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-
-        collector._get_client = AsyncMock(return_value=mock_client)
-        collector._get_cik = AsyncMock(return_value="0001234567890")
-        collector._rate_limit = AsyncMock()
+        serve_feed(_FEED_2024_01_20)
 
         latest_8k, latest_form4 = await collector.get_latest_filing_dates("AAPL")
 
         assert latest_8k == "2024-01-20"
         assert latest_form4 == "2024-01-20"
 
-    @pytest.mark.asyncio
-    async def test_returns_none_when_cik_not_found(self, collector):
+    async def test_returns_none_when_cik_not_found(self, collector, monkeypatch):
         """Returns None for both when CIK not found"""
-        collector._get_cik = AsyncMock(return_value=None)
+        monkeypatch.setattr(collector, "_get_cik", _resolves_to(None))
 
         latest_8k, latest_form4 = await collector.get_latest_filing_dates("INVALID")
 
         assert latest_8k is None
         assert latest_form4 is None
 
-    @pytest.mark.asyncio
-    async def test_returns_none_when_no_filings(self, collector):
+    async def test_returns_none_when_no_filings(self, collector, serve_feed):
         """Returns None when no filings found"""
-        mock_response = MagicMock()
-        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-        </feed>
-        '''
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-
-        collector._get_client = AsyncMock(return_value=mock_client)
-        collector._get_cik = AsyncMock(return_value="0001234567890")
-        collector._rate_limit = AsyncMock()
+        serve_feed(_EMPTY_FEED)
 
         latest_8k, latest_form4 = await collector.get_latest_filing_dates("AAPL")
 
@@ -571,68 +449,89 @@ class TestGetLatestFilingDates:
 class TestGetEntryDate:
     """Tests for _get_entry_date helper method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.sec_collector.get_settings") as mock_settings:
-            mock_settings.return_value.sec.base_url = "https://www.sec.gov"
-            mock_settings.return_value.sec.company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            mock_settings.return_value.sec.user_agent = "Test/1.0"
-            mock_settings.return_value.sec.request_delay = 0.01
-            mock_settings.return_value.sec.timeout = 30
-            from src.collectors.sec_collector import SECCollector
-            return SECCollector()
-
     def test_prefers_filing_date(self, collector):
         """Prefers filing-date over updated"""
-        xml = '''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <filing-date>2024-01-15</filing-date>
-                <updated>2024-01-20T10:00:00Z</updated>
-            </entry>
-        </feed>
-        '''
-        root = ElementTree.fromstring(xml)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        entry = root.find("atom:entry", ns)
-
-        result = collector._get_entry_date(entry, ns)
+        result = collector._get_entry_date(_ENTRY_WITH_BOTH_DATES, _ATOM_NS)
 
         assert result is not None
         assert result.strftime("%Y-%m-%d") == "2024-01-15"
 
     def test_falls_back_to_updated(self, collector):
         """Falls back to updated when filing-date missing"""
-        xml = '''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <updated>2024-01-20T10:00:00Z</updated>
-            </entry>
-        </feed>
-        '''
-        root = ElementTree.fromstring(xml)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        entry = root.find("atom:entry", ns)
-
-        result = collector._get_entry_date(entry, ns)
+        result = collector._get_entry_date(_ENTRY_WITH_UPDATED, _ATOM_NS)
 
         assert result is not None
         assert result.strftime("%Y-%m-%d") == "2024-01-20"
 
     def test_returns_none_when_no_date(self, collector):
         """Returns None when no date elements exist"""
-        xml = '''<?xml version="1.0" encoding="UTF-8"?>
-        <feed xmlns="http://www.w3.org/2005/Atom">
-            <entry>
-                <title>Test</title>
-            </entry>
-        </feed>
-        '''
-        root = ElementTree.fromstring(xml)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        entry = root.find("atom:entry", ns)
-
-        result = collector._get_entry_date(entry, ns)
+        result = collector._get_entry_date(_ENTRY_WITHOUT_DATE, _ATOM_NS)
 
         assert result is None
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestClientReuse:
+    """Tests for the pooled HTTP client"""
+
+    async def test_client_reused_until_closed(self):
+        """All requests share one client; close releases it"""
+        collector = SECCollector(settings=Settings())
+
+        first = await collector._get_client()
+        assert await collector._get_client() is first
+
+        await collector.close()
+        assert collector._client is None
+        assert first.is_closed
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestRateLimit:
+    """Tests for request spacing under concurrency"""
+
+    async def test_concurrent_callers_are_spaced(self):
+        """Concurrent callers fire one request_delay apart, not all at once"""
+        delay = 0.05
+        collector = SECCollector(
+            settings=Settings(sec=SECSettings(user_agent="Test/1.0", request_delay=delay))
+        )
+        loop = asyncio.get_running_loop()
+        fired: list[float] = []
+
+        async def call() -> None:
+            await collector._rate_limit()
+            fired.append(loop.time())
+
+        await asyncio.gather(*(call() for _ in range(8)))
+
+        gaps = [later - earlier for earlier, later in zip(fired, fired[1:])]
+        # Timers may fire a hair early; unserialized callers would be ~0 apart
+        assert all(gap >= delay - 1e-3 for gap in gaps)
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestCikLookup:
+    """Tests for the ticker-to-CIK map load"""
+
+    async def test_concurrent_cold_lookups_load_map_once(self, collector, monkeypatch):
+        """Concurrent lookups on a cold cache share one company_tickers.json request"""
+        url = collector._settings.sec.company_tickers_url
+        tickers = {
+            "0": {"ticker": "AAPL", "cik_str": 320193},
+            "1": {"ticker": "MSFT", "cik_str": 789019},
+        }
+        requested: list[str] = []
+
+        async def get(url: str, **kwargs) -> httpx.Response:
+            requested.append(url)
+            await asyncio.sleep(0)  # let the other lookups reach the lock
+            return httpx.Response(200, json=tickers, request=httpx.Request("GET", url))
+
+        monkeypatch.setattr(collector, "_get_client", _resolves_to(SimpleNamespace(get=get)))
+        monkeypatch.setattr(collector, "_rate_limit", _resolves_to(None))
+
+        ciks = await asyncio.gather(*(collector._get_cik(t) for t in ["AAPL", "MSFT"] * 4))
+
+        assert requested == [url]
+        assert ciks == ["0000320193", "0000789019"] * 4
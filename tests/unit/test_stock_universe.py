@@ -1,28 +1,40 @@
 """
 Tests for Stock Universe Collector
+
+Parallel: pytest -n auto --dist=loadfile  (requires pytest-xdist)
 """
 
+import httpx
 import pytest
-import time
-from unittest.mock import patch, AsyncMock, MagicMock
+from typing import Optional
+from unittest.mock import AsyncMock
+
+from src.collectors.stock_universe import FALLBACK_TOP_100, StockUniverseCollector
+from src.config.settings import Settings, StockUniverseSettings
+
+
+_SETTINGS = Settings(
+    stock_universe=StockUniverseSettings(
+        sp500_url="https://example.com/sp500",
+        nasdaq100_url="https://example.com/nasdaq100",
+        user_agent="Test/1.0",
+        request_delay=0.01,
+    )
+)
+
+# Fixed clock for the cache TTL tests (24 hour TTL)
+_NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def collector():
+    """Fresh collector per test (tests stub methods and fill the cache); settings are shared"""
+    return StockUniverseCollector(settings=_SETTINGS)
 
 
 class TestStockUniverseCollector:
     """Tests for StockUniverseCollector"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance with mocked settings"""
-        with patch("src.collectors.stock_universe.get_settings") as mock_settings:
-            mock_settings.return_value.stock_universe.sp500_url = "https://example.com/sp500"
-            mock_settings.return_value.stock_universe.nasdaq100_url = "https://example.com/nasdaq100"
-            mock_settings.return_value.stock_universe.user_agent = "Test/1.0"
-            mock_settings.return_value.stock_universe.request_delay = 0.01
-            mock_settings.return_value.stock_universe.timeout = 30
-            mock_settings.return_value.stock_universe.cache_ttl_hours = 24
-            from src.collectors.stock_universe import StockUniverseCollector
-            return StockUniverseCollector()
-
     def test_initializes_with_empty_cache(self, collector):
         """Collector starts with empty cache"""
         assert collector._cache == {}
@@ -32,47 +44,28 @@ class TestStockUniverseCollector:
         assert collector._client is None
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestGetTickers:
     """Tests for get_tickers method"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.stock_universe.get_settings") as mock_settings:
-            mock_settings.return_value.stock_universe.sp500_url = "https://example.com/sp500"
-            mock_settings.return_value.stock_universe.nasdaq100_url = "https://example.com/nasdaq100"
-            mock_settings.return_value.stock_universe.user_agent = "Test/1.0"
-            mock_settings.return_value.stock_universe.request_delay = 0.01
-            mock_settings.return_value.stock_universe.timeout = 30
-            mock_settings.return_value.stock_universe.cache_ttl_hours = 24
-            from src.collectors.stock_universe import StockUniverseCollector
-            return StockUniverseCollector()
-
-    @pytest.mark.asyncio
     async def test_custom_mode_returns_normalized_tickers(self, collector):
         """Custom mode returns uppercase normalized tickers"""
         result = await collector.get_tickers("custom", ["aapl", " MSFT ", "googl"])
         assert result == ["AAPL", "MSFT", "GOOGL"]
 
-    @pytest.mark.asyncio
-    async def test_custom_mode_requires_tickers(self, collector):
-        """Custom mode raises error without tickers"""
-        with pytest.raises(ValueError, match="Custom ticker list required"):
-            await collector.get_tickers("custom", None)
-
-    @pytest.mark.asyncio
-    async def test_custom_mode_requires_non_empty_tickers(self, collector):
-        """Custom mode raises error with empty list"""
-        with pytest.raises(ValueError, match="Custom ticker list required"):
-            await collector.get_tickers("custom", [])
-
-    @pytest.mark.asyncio
-    async def test_invalid_mode_raises_error(self, collector):
-        """Invalid mode raises ValueError"""
-        with pytest.raises(ValueError, match="Invalid scan mode"):
-            await collector.get_tickers("invalid_mode", None)
-
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "mode, custom, message",
+        [
+            pytest.param("custom", None, "Custom ticker list required", id="custom_without_tickers"),
+            pytest.param("custom", [], "Custom ticker list required", id="custom_with_empty_list"),
+            pytest.param("invalid_mode", None, "Invalid scan mode", id="invalid_mode"),
+        ],
+    )
+    async def test_rejects_invalid_requests(self, collector, mode, custom, message):
+        """Invalid modes and missing custom tickers raise ValueError"""
+        with pytest.raises(ValueError, match=message):
+            await collector.get_tickers(mode, custom)
+
     async def test_sp500_mode_calls_get_sp500(self, collector):
         """sp500 mode calls get_sp500 method"""
         collector.get_sp500 = AsyncMock(return_value=["AAPL", "MSFT"])
@@ -80,7 +73,6 @@ class TestGetTickers:
         collector.get_sp500.assert_called_once()
         assert result == ["AAPL", "MSFT"]
 
-    @pytest.mark.asyncio
     async def test_nasdaq100_mode_calls_get_nasdaq100(self, collector):
         """nasdaq100 mode calls get_nasdaq100 method"""
         collector.get_nasdaq100 = AsyncMock(return_value=["AAPL", "NVDA"])
@@ -93,17 +85,9 @@ class TestCaching:
     """Tests for caching behavior"""
 
     @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.stock_universe.get_settings") as mock_settings:
-            mock_settings.return_value.stock_universe.sp500_url = "https://example.com/sp500"
-            mock_settings.return_value.stock_universe.nasdaq100_url = "https://example.com/nasdaq100"
-            mock_settings.return_value.stock_universe.user_agent = "Test/1.0"
-            mock_settings.return_value.stock_universe.request_delay = 0.01
-            mock_settings.return_value.stock_universe.timeout = 30
-            mock_settings.return_value.stock_universe.cache_ttl_hours = 24
-            from src.collectors.stock_universe import StockUniverseCollector
-            return StockUniverseCollector()
+    def frozen_time(self, monkeypatch):
+        """Pin the collector's clock so cache ages are exact"""
+        monkeypatch.setattr("src.collectors.stock_universe.time.monotonic", lambda: _NOW)
 
     def test_cache_set_and_get(self, collector):
         """Cache set and get work correctly"""
@@ -118,20 +102,19 @@ class TestCaching:
         result = collector._get_from_cache("missing_key")
         assert result is None
 
+    @pytest.mark.usefixtures("frozen_time")
     def test_cache_expires_after_ttl(self, collector):
         """Cache entries expire after TTL"""
-        # Manually set cache with old timestamp
-        old_timestamp = time.time() - (25 * 60 * 60)  # 25 hours ago
-        collector._cache["expired_key"] = (["AAPL"], old_timestamp)
+        collector._cache["expired_key"] = (["AAPL"], _NOW - 25 * 60 * 60)  # 25 hours ago
 
         result = collector._get_from_cache("expired_key")
         assert result is None
         assert "expired_key" not in collector._cache
 
+    @pytest.mark.usefixtures("frozen_time")
     def test_cache_valid_within_ttl(self, collector):
         """Cache entries valid within TTL"""
-        # Set cache with recent timestamp
-        collector._set_cache("valid_key", ["AAPL", "MSFT"])
+        collector._cache["valid_key"] = (["AAPL", "MSFT"], _NOW - 23 * 60 * 60)  # 23 hours ago
 
         result = collector._get_from_cache("valid_key")
         assert result == ["AAPL", "MSFT"]
@@ -140,19 +123,6 @@ class TestCaching:
 class TestParseSP500Table:
     """Tests for S&P 500 table parsing"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.stock_universe.get_settings") as mock_settings:
-            mock_settings.return_value.stock_universe.sp500_url = "https://example.com/sp500"
-            mock_settings.return_value.stock_universe.nasdaq100_url = "https://example.com/nasdaq100"
-            mock_settings.return_value.stock_universe.user_agent = "Test/1.0"
-            mock_settings.return_value.stock_universe.request_delay = 0.01
-            mock_settings.return_value.stock_universe.timeout = 30
-            mock_settings.return_value.stock_universe.cache_ttl_hours = 24
-            from src.collectors.stock_universe import StockUniverseCollector
-            return StockUniverseCollector()
-
     def test_parses_symbol_column(self, collector):
         """Parses tickers from Symbol column"""
         html = '''
@@ -194,6 +164,10 @@ class TestParseSP500Table:
         result = collector._parse_sp500_table(html)
         assert result == []
 
+    def test_handles_empty_document(self, collector):
+        """Returns empty list for an empty response body"""
+        assert collector._parse_sp500_table("") == []
+
     def test_uppercase_normalization(self, collector):
         """Normalizes tickers to uppercase"""
         html = '''
@@ -207,23 +181,28 @@ class TestParseSP500Table:
         result = collector._parse_sp500_table(html)
         assert result == ["AAPL"]
 
+    def test_finds_sortable_wikitable_after_other_tables(self, collector):
+        """Skips non-wikitable tables and matches multi-class wikitables"""
+        html = '''
+        <html><body>
+            <table class="infobox"><tr><th>Symbol</th></tr><tr><td>ZZZZ</td></tr></table>
+            <div>
+                <table class="wikitable sortable">
+                    <tbody>
+                        <tr><th>Symbol</th><th>Company</th></tr>
+                        <tr><td><a href="/wiki/Apple">AAPL</a></td><td>Apple Inc</td></tr>
+                    </tbody>
+                </table>
+            </div>
+        </body></html>
+        '''
+        result = collector._parse_sp500_table(html)
+        assert result == ["AAPL"]
+
 
 class TestParseNasdaq100Table:
     """Tests for NASDAQ 100 table parsing"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.stock_universe.get_settings") as mock_settings:
-            mock_settings.return_value.stock_universe.sp500_url = "https://example.com/sp500"
-            mock_settings.return_value.stock_universe.nasdaq100_url = "https://example.com/nasdaq100"
-            mock_settings.return_value.stock_universe.user_agent = "Test/1.0"
-            mock_settings.return_value.stock_universe.request_delay = 0.01
-            mock_settings.return_value.stock_universe.timeout = 30
-            mock_settings.return_value.stock_universe.cache_ttl_hours = 24
-            from src.collectors.stock_universe import StockUniverseCollector
-            return StockUniverseCollector()
-
     def test_parses_ticker_column(self, collector):
         """Parses tickers from Ticker column"""
         html = '''
@@ -252,78 +231,65 @@ class TestParseNasdaq100Table:
         assert result == ["BRK.B"]
 
 
-class TestFallbackBehavior:
-    """Tests for fallback to hardcoded list"""
+class _StubResponse:
+    """Stand-in for httpx.Response; the collector only reads text"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.stock_universe.get_settings") as mock_settings:
-            mock_settings.return_value.stock_universe.sp500_url = "https://example.com/sp500"
-            mock_settings.return_value.stock_universe.nasdaq100_url = "https://example.com/nasdaq100"
-            mock_settings.return_value.stock_universe.user_agent = "Test/1.0"
-            mock_settings.return_value.stock_universe.request_delay = 0.01
-            mock_settings.return_value.stock_universe.timeout = 30
-            mock_settings.return_value.stock_universe.cache_ttl_hours = 24
-            from src.collectors.stock_universe import StockUniverseCollector
-            return StockUniverseCollector()
-
-    @pytest.mark.asyncio
-    async def test_fallback_on_http_error(self, collector):
-        """Falls back to hardcoded list on HTTP error"""
-        import httpx
+    __slots__ = ("text",)
 
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.HTTPError("Connection failed")
-        collector._get_client = AsyncMock(return_value=mock_client)
+    def __init__(self, text: str):
+        self.text = text
 
-        result = await collector.get_sp500()
+    def raise_for_status(self) -> None:
+        pass
 
-        # Should return fallback list
-        from src.collectors.stock_universe import FALLBACK_TOP_100
-        assert result == FALLBACK_TOP_100
 
-    @pytest.mark.asyncio
-    async def test_fallback_on_parse_failure(self, collector):
-        """Falls back when parsing returns empty list"""
-        mock_response = MagicMock()
-        mock_response.text = "<html><body>No table here</body></html>"
-        mock_response.raise_for_status = MagicMock()
+class _StubClient:
+    """Stand-in for httpx.AsyncClient whose get() returns one response or raises"""
 
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        collector._get_client = AsyncMock(return_value=mock_client)
+    __slots__ = ("response", "error")
+
+    def __init__(self, response: Optional[_StubResponse] = None, error: Optional[Exception] = None):
+        self.response = response
+        self.error = error
+
+    async def get(self, url: str, **kwargs) -> _StubResponse:
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestFallbackBehavior:
+    """Tests for fallback to hardcoded list"""
+
+    @pytest.mark.parametrize(
+        "client",
+        [
+            pytest.param(_StubClient(error=httpx.HTTPError("Connection failed")), id="http_error"),
+            pytest.param(
+                _StubClient(_StubResponse("<html><body>No table here</body></html>")),
+                id="parse_failure",
+            ),
+        ],
+    )
+    async def test_falls_back_to_hardcoded_list(self, collector, client):
+        """HTTP errors and pages without a ticker table return the fallback list"""
+        collector._client = client
 
         result = await collector.get_sp500()
 
-        # Should return fallback list
-        from src.collectors.stock_universe import FALLBACK_TOP_100
         assert result == FALLBACK_TOP_100
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestResourceCleanup:
     """Tests for resource cleanup"""
 
-    @pytest.fixture
-    def collector(self):
-        """Create collector instance"""
-        with patch("src.collectors.stock_universe.get_settings") as mock_settings:
-            mock_settings.return_value.stock_universe.sp500_url = "https://example.com/sp500"
-            mock_settings.return_value.stock_universe.nasdaq100_url = "https://example.com/nasdaq100"
-            mock_settings.return_value.stock_universe.user_agent = "Test/1.0"
-            mock_settings.return_value.stock_universe.request_delay = 0.01
-            mock_settings.return_value.stock_universe.timeout = 30
-            mock_settings.return_value.stock_universe.cache_ttl_hours = 24
-            from src.collectors.stock_universe import StockUniverseCollector
-            return StockUniverseCollector()
-
-    @pytest.mark.asyncio
     async def test_close_with_no_client(self, collector):
         """Close works when client was never created"""
         await collector.close()
         assert collector._client is None
 
-    @pytest.mark.asyncio
     async def test_close_closes_client(self, collector):
         """Close properly closes HTTP client"""
         mock_client = AsyncMock()
@@ -333,3 +299,12 @@ class TestResourceCleanup:
 
         mock_client.aclose.assert_called_once()
         assert collector._client is None
+
+    async def test_client_reused_until_closed(self, collector):
+        """Both list fetches share one client; close releases it"""
+        first = await collector._get_client()
+        assert await collector._get_client() is first
+
+        await collector.close()
+        assert collector._client is None
+        assert first.is_closed
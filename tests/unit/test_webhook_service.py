@@ -0,0 +1,342 @@
+"""
+Tests for Webhook Service
+"""
+
+import asyncio
+import json
+from dataclasses import replace
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.config.settings import Settings
+from src.core.exceptions import WebhookError
+from src.services.webhook_service import WebhookService, _jittered_backoff
+
+
+class TestClientReuse:
+    """Tests for pooled HTTP client handling"""
+
+    @pytest.fixture
+    def service(self):
+        """Create service instance"""
+        return WebhookService(settings=Settings())
+
+    @pytest.mark.asyncio
+    async def test_client_created_once(self, service):
+        """Reuses the same client across calls"""
+        first = await service._get_client()
+        second = await service._get_client()
+
+        assert first is second
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_send_alert_reuses_client(self, service, sample_risk_report):
+        """Multiple alerts go through one client"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        service._client = mock_client
+
+        await service.send_alert("https://example.com/hook", sample_risk_report)
+        await service.send_alert("https://example.com/hook", sample_risk_report)
+
+        assert mock_client.post.call_count == 2
+        assert service._client is mock_client
+
+    @pytest.mark.asyncio
+    async def test_send_alert_posts_serialized_body(self, service, sample_risk_report):
+        """Payload is sent as pre-encoded JSON bytes"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        service._client = mock_client
+
+        await service.send_alert("https://example.com/hook", sample_risk_report)
+
+        body = mock_client.post.call_args.kwargs["content"]
+        assert isinstance(body, bytes)
+        assert json.loads(body)["ticker"] == "TEST"
+
+    @pytest.mark.asyncio
+    async def test_close_closes_client(self, service):
+        """Close properly closes HTTP client"""
+        mock_client = AsyncMock()
+        service._client = mock_client
+
+        await service.close()
+
+        mock_client.aclose.assert_called_once()
+        assert service._client is None
+
+
+class TestAlertThreshold:
+    """Tests for skipping reports below the alert threshold"""
+
+    @pytest.fixture
+    def service(self):
+        """Create service instance with a mocked client"""
+        service = WebhookService(settings=Settings())
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        service._client = AsyncMock()
+        service._client.post.return_value = mock_response
+        return service
+
+    @pytest.fixture
+    def low_risk_report(self, sample_risk_report):
+        """Report scored below the default threshold"""
+        return replace(sample_risk_report, risk_score=10)
+
+    @pytest.mark.asyncio
+    async def test_below_threshold_skips_send(self, service, low_risk_report):
+        """Low-risk report is neither formatted nor posted"""
+        service._format_payload = MagicMock()
+
+        result = await service.send_alert("https://example.com/hook", low_risk_report)
+
+        assert result is False
+        service._format_payload.assert_not_called()
+        service._client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_threshold_override(self, service, low_risk_report):
+        """Explicit threshold lets a lower score through"""
+        result = await service.send_alert(
+            "https://example.com/hook", low_risk_report, threshold=5
+        )
+
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_zero_threshold_alerts_on_everything(self, service, low_risk_report):
+        """An explicit threshold of 0 is honoured, not replaced by the default"""
+        result = await service.send_alert(
+            "https://example.com/hook", replace(low_risk_report, risk_score=0), threshold=0
+        )
+
+        assert result is True
+        service._client.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_always_bypasses_threshold(self, service, low_risk_report):
+        """always=True sends regardless of score"""
+        result = await service.send_alert(
+            "https://example.com/hook", low_risk_report, always=True
+        )
+
+        assert result is True
+        service._client.post.assert_called_once()
+
+
+class TestSendAlerts:
+    """Tests for concurrent batch delivery"""
+
+    @pytest.fixture
+    def service(self):
+        """Create service instance"""
+        return WebhookService(settings=Settings())
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_block_other_alerts(self, service, sample_risk_report):
+        """One failing endpoint returns its exception, others still succeed"""
+        async def fake_send(url, report, format_type="generic", threshold=None):
+            if "bad" in url:
+                raise WebhookError(url=url, status_code=400)
+            return True
+
+        service.send_alert = fake_send
+
+        results = await service.send_alerts([
+            ("https://example.com/good", sample_risk_report, "generic"),
+            ("https://example.com/bad", sample_risk_report, "slack"),
+            ("https://example.com/good2", sample_risk_report, "discord"),
+        ])
+
+        assert results[0] is True
+        assert isinstance(results[1], WebhookError)
+        assert results[2] is True
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, sample_risk_report):
+        """No more than max_concurrent POSTs are in flight at once"""
+        settings = Settings()
+        settings = replace(settings, webhook=replace(settings.webhook, max_concurrent=2))
+        service = WebhookService(settings=settings)
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_post(url, content):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            response = MagicMock()
+            response.status_code = 200
+            return response
+
+        service._client = AsyncMock()
+        service._client.post.side_effect = fake_post
+
+        results = await service.send_alerts([
+            (f"https://example.com/{i}", sample_risk_report, "generic")
+            for i in range(6)
+        ])
+
+        assert results == [True] * 6
+        assert peak == 2
+
+
+class TestPayloadCache:
+    """Tests for formatted payload memoization"""
+
+    @pytest.fixture
+    def service(self):
+        """Create service instance"""
+        return WebhookService(settings=Settings())
+
+    def test_same_report_and_format_formats_once(self, service, sample_risk_report):
+        """Repeated formatting of one report reuses the payload"""
+        first = service._format_payload(sample_risk_report, "slack")
+        second = service._format_payload(sample_risk_report, "slack")
+
+        assert first is second
+
+    def test_formats_cached_separately(self, service, sample_risk_report):
+        """Each format type gets its own payload"""
+        slack = service._format_payload(sample_risk_report, "slack")
+        discord = service._format_payload(sample_risk_report, "discord")
+
+        assert "blocks" in slack
+        assert "embeds" in discord
+
+    @pytest.mark.asyncio
+    async def test_fanout_formats_each_report_once(self, service, sample_risk_report):
+        """Sending one report to several URLs builds its payload once"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        service._client = AsyncMock()
+        service._client.post.return_value = mock_response
+        format_slack = MagicMock(return_value={"blocks": []})
+
+        with patch.dict(WebhookService._DISPATCH, {"slack": format_slack}):
+            await service.send_alerts([
+                (f"https://example.com/{i}", sample_risk_report, "slack")
+                for i in range(3)
+            ])
+
+        assert format_slack.call_count == 1
+        assert service._client.post.call_count == 3
+
+    def test_unknown_format_falls_back_to_generic(self, service, sample_risk_report):
+        """Unrecognised format types use the generic payload"""
+        payload = service._format_payload(sample_risk_report, "teams")
+
+        assert payload["alert_type"] == "risk_signal"
+        assert "blocks" not in payload and "embeds" not in payload
+
+    def test_cache_is_bounded(self, service, sample_risk_report):
+        """Oldest entries are evicted past the size limit"""
+        service.PAYLOAD_CACHE_SIZE = 2
+        reports = [replace(sample_risk_report, ticker=t) for t in ("A", "B", "C")]
+        for report in reports:
+            service._format_payload(report, "generic")
+
+        assert len(service._payload_cache) == 2
+        assert (id(reports[0]), "generic") not in service._payload_cache
+
+
+class TestBackoff:
+    """Tests for retry backoff"""
+
+    def test_backoff_within_bounds(self):
+        """Delay stays between base and the capped exponential"""
+        for attempt in range(10):
+            delay = _jittered_backoff(attempt, base=0.25, cap=10.0)
+            assert 0.25 <= delay <= min(10.0, 0.25 * 2 ** attempt)
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("2", 2.0),
+            ("3600", 10.0),  # clamped to retry_backoff_cap
+            ("-5", 0.5),  # invalid, falls back to backoff
+            ("soon", 0.5),
+        ],
+    )
+    def test_retry_after_bounded(self, header, expected):
+        """Retry-After is honoured up to the backoff cap; bad values use backoff"""
+        service = WebhookService(settings=Settings())
+        service._backoff = MagicMock(return_value=0.5)
+        response = httpx.Response(429, headers={"Retry-After": header})
+
+        assert service._retry_after(response, attempt=0) == expected
+
+
+class TestRetryClassification:
+    """Tests for which failures are retried"""
+
+    @pytest.fixture
+    def service(self):
+        """Create service instance with instant retries"""
+        service = WebhookService(settings=Settings())
+        service._backoff = MagicMock(return_value=0)
+        return service
+
+    @staticmethod
+    def _response(status_code: int, headers: dict | None = None) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.text = ""
+        return response
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_with_retry_after(self, service, sample_risk_report):
+        """429 is retried after the Retry-After delay"""
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = [
+            self._response(429, {"Retry-After": "0"}),
+            self._response(200),
+        ]
+        service._client = mock_client
+
+        result = await service.send_alert("https://example.com/hook", sample_risk_report)
+
+        assert result is True
+        assert mock_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_connect_error(self, service, sample_risk_report):
+        """Connection errors are retried"""
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = [
+            httpx.ConnectError("refused"),
+            self._response(200),
+        ]
+        service._client = mock_client
+
+        result = await service.send_alert("https://example.com/hook", sample_risk_report)
+
+        assert result is True
+        assert mock_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self, service, sample_risk_report):
+        """Other 4xx responses fail immediately"""
+        mock_client = AsyncMock()
+        mock_client.post.return_value = self._response(404)
+        service._client = mock_client
+
+        with pytest.raises(WebhookError):
+            await service.send_alert("https://example.com/hook", sample_risk_report)
+
+        assert mock_client.post.call_count == 1